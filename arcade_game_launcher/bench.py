@@ -0,0 +1,328 @@
+"""
+Benchmark suite for the launcher menu and every discovered game.
+
+Each target runs headless for a fixed number of frames with scripted input.
+Results are written as JSON and compared against a baseline kept in the
+cache directory, as timings depend on the machine. The first run on a
+machine saves the baseline that later runs are compared against.
+
+Usage:
+    python -m arcade_game_launcher.bench [--frames N] [--output FILE]
+                                         [--baseline FILE] [--save-baseline]
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tracemalloc
+import pygame
+
+# Add the project root to the Python path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from arcade_game_launcher.config import SCREEN_WIDTH, SCREEN_HEIGHT, CACHE_DIR
+from arcade_game_launcher.utils.game_loader import GameLoader
+from arcade_game_launcher.utils.fonts import FontRegistry
+from arcade_game_launcher.utils.profiler import FrameProfiler
+from arcade_game_launcher.utils.scripted_input import ScriptedInput
+from arcade_game_launcher.utils.screen_manager import ScreenManager, init_display
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Benchmark settings
+DEFAULT_FRAMES = 3000
+DEFAULT_THRESHOLD = 0.20  # allowed relative slowdown before failing
+DEFAULT_OUTPUT = "bench_results.json"
+DEFAULT_BASELINE = os.path.join(CACHE_DIR, "bench_baseline.json")
+
+
+def peak_rss_kb():
+    """
+    Get the peak resident set size of the process.
+    
+    Returns:
+        int or None: Peak RSS in kilobytes, or None where unsupported
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class AllocationProfiler(FrameProfiler):
+    def __init__(self, window):
+        """
+        Initialize a frame profiler that also measures per-frame allocations.
+        
+        Must run under tracemalloc. At the start of each frame the traced
+        peak is reset, and at the end the peak above the frame's starting
+        memory is kept: the most Python memory the frame had allocated at
+        once. Objects a frame allocates and frees again still raise it, so
+        it shows per-frame churn that a net count of blocks misses.
+        
+        Args:
+            window (int): Number of recent frames kept for percentiles
+        """
+        super().__init__(window=window)
+        self.frame_memory = 0
+        self.frame_allocations = []
+        
+    def begin_frame(self):
+        """Start timing a frame and measuring its allocations."""
+        self.frame_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        super().begin_frame()
+        
+    def poll_overlay_key(self):
+        """Poll the overlay hotkey, leaving the 8 KB key state it reads out of the frame's allocations."""
+        super().poll_overlay_key()
+        self.frame_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        
+    def end_frame(self):
+        """Finish timing a frame and keep its allocation peak."""
+        super().end_frame()
+        self.frame_allocations.append(tracemalloc.get_traced_memory()[1] - self.frame_memory)
+        
+        
+def measure(run, frames):
+    """
+    Benchmark one target.
+    
+    The target runs twice: a timed pass with the profiler attached, then a
+    shorter pass under tracemalloc to measure peak Python allocations, both
+    over the whole run and within each frame (see AllocationProfiler). Net
+    allocated blocks per frame are taken from the timed pass; they count
+    blocks still held at the end, not allocations, so a steadily positive
+    value points at a per-frame leak.
+    
+    Args:
+        run (callable): Runs the target as run(max_frames, profiler)
+        frames (int): Frames for the timed pass
+        
+    Returns:
+        dict: Measured metrics
+    """
+    # Timed pass
+    random.seed(0)
+    profiler = FrameProfiler(window=frames)
+    blocks_before = sys.getallocatedblocks()
+    start = time.perf_counter()
+    run(frames, profiler)
+    elapsed = time.perf_counter() - start
+    blocks_after = sys.getallocatedblocks()
+    frames_run = max(profiler.frames, 1)
+    
+    # Allocation pass
+    random.seed(0)
+    alloc_frames = max(frames // 10, 1)
+    alloc_profiler = AllocationProfiler(alloc_frames)
+    tracemalloc.start()
+    run(alloc_frames, alloc_profiler)
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    frame_allocations = alloc_profiler.frame_allocations
+    
+    stats = profiler.stats()
+    return {
+        "frames": profiler.frames,
+        "seconds": elapsed,
+        "fps": profiler.frames / elapsed if elapsed else 0.0,
+        "phases": {name: {key: round(value, 4) for key, value in stat.items()}
+                   for name, stat in stats.items()},
+        "net_blocks_per_frame": (blocks_after - blocks_before) / frames_run,
+        "frame_alloc_kb": sum(frame_allocations) / max(len(frame_allocations), 1) / 1024,
+        "traced_peak_kb": traced_peak / 1024,
+        "peak_rss_kb": peak_rss_kb()
+    }
+
+
+def bench_game(loader, game_name, screen, frames):
+    """
+    Benchmark one game through its run_game entry point.
+    
+    Args:
+        loader (GameLoader): Loader that discovered the game
+        game_name (str): Game directory name
+        screen: Surface the game renders to
+        frames (int): Frames to simulate
+        
+    Returns:
+        dict: Measured metrics
+    """
+    def run(max_frames, profiler):
+        profiler.set_label(game_name)
+        loader.run_game(
+            game_name,
+            screen,
+            headless=True,
+            max_frames=max_frames,
+            profiler=profiler,
+            input_script=ScriptedInput()
+        )
+        
+    # Load once up front so module execution is not part of the measurement
+    loader.load_game(game_name)
+    return measure(run, frames)
+
+
+def bench_launcher(loader, fonts, frames):
+    """
+    Benchmark the launcher menu.
+    
+    Args:
+        loader (GameLoader): Loader shared with the launcher screen
+        fonts (FontRegistry): Shared font registry
+        frames (int): Frames to simulate
+        
+    Returns:
+        dict: Measured metrics
+    """
+    from arcade_game_launcher.launcher import LauncherScreen
+    
+    def run(max_frames, profiler):
+        profiler.set_label("launcher")
+        screen_manager = ScreenManager(SCREEN_WIDTH, SCREEN_HEIGHT, True, max_frames, profiler)
+        screen_manager.set_screen(LauncherScreen(screen_manager, loader, fonts))
+        screen_manager.run()
+        
+    return measure(run, frames)
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results against a baseline.
+    
+    Args:
+        results (dict): Current results keyed by target
+        baseline (dict): Baseline results keyed by target
+        threshold (float): Allowed relative slowdown, e.g. 0.2 for 20%
+        
+    Returns:
+        list: Descriptions of every regression found
+    """
+    regressions = []
+    for target, current in results.items():
+        base = baseline.get(target)
+        if not base:
+            continue
+            
+        if base["fps"] and current["fps"] < base["fps"] * (1 - threshold):
+            regressions.append(f"{target}: {current['fps']:.0f} fps vs baseline {base['fps']:.0f}")
+            
+        for phase, stat in current["phases"].items():
+            base_stat = base["phases"].get(phase)
+            if not base_stat:
+                continue
+            # Ignore sub-microsecond phases where noise dominates
+            limit = max(base_stat["p95"] * (1 + threshold), base_stat["p95"] + 0.001)
+            if stat["p95"] > limit:
+                regressions.append(f"{target}: {phase} p95 {stat['p95']:.3f} ms "
+                                   f"vs baseline {base_stat['p95']:.3f} ms")
+    return regressions
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments for the benchmark.
+    
+    Args:
+        argv (list or None): Arguments to parse, or None for sys.argv
+        
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the launcher and every game")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES,
+                        help="frames to simulate per target")
+    parser.add_argument("--games", nargs="*", default=None,
+                        help="only benchmark these games (directory names)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT,
+                        help="where to write the JSON results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline results to compare against")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown before failing")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Run the benchmark suite.
+    
+    Args:
+        argv (list or None): Arguments to parse, or None for sys.argv
+        
+    Returns:
+        int: Process exit code, 1 if a regression was found
+    """
+    args = parse_args(argv)
+    
+    init_display(True)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    fonts = FontRegistry()
+    loader = GameLoader(fonts=fonts)
+    games = loader.discover_games()
+    
+    results = {"launcher": bench_launcher(loader, fonts, args.frames)}
+    for info in games.values():
+        if args.games and info["name"] not in args.games:
+            continue
+        results[info["name"]] = bench_game(loader, info["name"], screen, args.frames)
+        
+    # Report
+    print()
+    print(f"{'target':<14}{'frames':>8}{'fps':>12}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'input p95':>11}{'alloc KB/f':>12}{'net blocks/f':>14}{'peak KB':>9}{'RSS KB':>10}")
+    for target, result in results.items():
+        frame = result["phases"]["frame"]
+        # Input latency is in simulated frame time, as the runs are headless
+        latency = result["phases"].get("input")
+        latency = f"{latency['p95']:.1f}" if latency else "-"
+        print(f"{target:<14}{result['frames']:>8}{result['fps']:>12.0f}{frame['p50']:>9.3f}"
+              f"{frame['p95']:>9.3f}{frame['p99']:>9.3f}{latency:>11}"
+              f"{result['frame_alloc_kb']:>12.1f}{result['net_blocks_per_frame']:>14.2f}"
+              f"{result['traced_peak_kb']:>9.1f}{result['peak_rss_kb'] or 0:>10}")
+              
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"\nWrote results to {args.output}")
+    
+    # Timings depend on the machine, so a first run saves its own baseline
+    if args.save_baseline or not os.path.exists(args.baseline):
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.baseline}")
+        pygame.quit()
+        return 0
+        
+    exit_code = 0
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print("Performance regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        exit_code = 1
+    else:
+        print(f"No regressions against {args.baseline}")
+        
+    pygame.quit()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
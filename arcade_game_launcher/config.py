@@ -2,11 +2,14 @@
 Configuration settings for the arcade game launcher.
 Contains shared settings like screen dimensions, colors, and FPS.
 """
+import os
 
 # Screen settings
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+TICK_RATE = 60  # fixed simulation steps per second
+MAX_FRAME_TIME = 0.25  # longest frame fed to the simulation, in seconds
 
 # Colors (RGB)
 BLACK = (0, 0, 0)
@@ -20,12 +23,43 @@ GRAY = (128, 128, 128)
 LIGHT_GRAY = (200, 200, 200)
 DARK_GRAY = (50, 50, 50)
 
+# Paths
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+GAMES_DIR = os.path.join(PACKAGE_DIR, "games")
+FONTS_DIR = os.path.join(PACKAGE_DIR, "assets", "fonts")
+CACHE_DIR = os.environ.get(
+    "ARCADE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "arcade_game_launcher")
+)
+THUMBNAIL_DIR = os.path.join(CACHE_DIR, "thumbnails")
+
 # UI settings
 BUTTON_WIDTH = 200
 BUTTON_HEIGHT = 50
 BUTTON_MARGIN = 20
 TITLE_FONT_SIZE = 48
 BUTTON_FONT_SIZE = 24
+THUMBNAIL_SIZE = (64, 48)
+THUMBNAIL_MARGIN = 10
+THUMBNAIL_SECONDS = 3  # scripted play before a thumbnail is captured
+
+# Rendered text cache memory cap in bytes
+TEXT_CACHE_MAX_BYTES = 8 * 1024 * 1024
 
 # Game settings
 GAME_TITLE = "Arcade Game Launcher"
+
+# Headless settings
+HEADLESS_ENV_VAR = "ARCADE_HEADLESS"
+
+# Profiling settings
+PROFILE_WINDOW = 600  # frames kept for rolling percentiles
+PROFILE_MAX_TRACE_EVENTS = 500000
+
+# Isolated session settings
+SESSION_FRAME_BUDGET_MS = 1000 / FPS * 2  # frames slower than this count as overruns
+SESSION_MAX_OVERRUNS = 120  # overruns in a row before a session is ended, or None to only count them
+SESSION_HANG_TIMEOUT = 5.0  # seconds without a new frame before a session is killed
+SESSION_MEMORY_LIMIT_MB = 1024  # address space cap for each session process
+WARM_POOL_SIZE = 2  # forked session workers kept ready to launch
+WARM_POOL_TIMEOUT = 10.0  # seconds to wait for the pool to hand out a worker
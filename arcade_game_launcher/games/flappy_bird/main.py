@@ -6,10 +6,16 @@ import sys
 import random
 import pygame
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+# Add the project root to the Python path when run standalone
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-from arcade_game_launcher.config import BLACK, WHITE, GREEN, BLUE, RED, YELLOW, FPS
+from arcade_game_launcher.config import BLACK, WHITE, GREEN, BLUE, RED, YELLOW, FPS, TICK_RATE
+from arcade_game_launcher.utils.screen_manager import FrameDriver, interpolate_rect
+from arcade_game_launcher.utils.input_queue import InputQueue
+from arcade_game_launcher.utils.fonts import FontRegistry
+from arcade_game_launcher.utils.text_cache import render_text
 
 # Game constants
 GRAVITY = 0.5
@@ -19,6 +25,20 @@ PIPE_GAP = 150
 PIPE_FREQUENCY = 1500  # milliseconds
 GROUND_HEIGHT = 100
 
+# Fonts used by the game, as (family, size) pairs
+FONT_SPECS = [("arial", 24), ("arial", 48)]
+
+
+def preload(fonts):
+    """
+    Build the game's fonts ahead of launch so the first frame does not stall.
+    
+    Args:
+        fonts (FontRegistry): Shared font registry
+    """
+    fonts.preload(FONT_SPECS)
+
+
 class Bird:
     def __init__(self, x, y):
         """
@@ -34,6 +54,7 @@ class Bird:
         self.height = 30
         self.velocity = 0
         self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.previous_rect = self.rect.copy()
         
     def jump(self):
         """Make the bird jump."""
@@ -41,6 +62,8 @@ class Bird:
         
     def update(self):
         """Update the bird's position."""
+        self.previous_rect = self.rect.copy()
+        
         # Apply gravity
         self.velocity += GRAVITY
         self.y += self.velocity
@@ -48,18 +71,20 @@ class Bird:
         # Update rectangle position
         self.rect.y = int(self.y)
         
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Draw the bird.
         
         Args:
             screen: Pygame surface to draw on
+            alpha (float): Interpolation between the last two simulation steps
         """
-        pygame.draw.rect(screen, YELLOW, self.rect)
+        rect = interpolate_rect(self.previous_rect, self.rect, alpha)
+        pygame.draw.rect(screen, YELLOW, rect)
         
         # Draw eye
-        eye_x = self.rect.x + self.rect.width - 10
-        eye_y = self.rect.y + 10
+        eye_x = rect.x + rect.width - 10
+        eye_y = rect.y + 10
         pygame.draw.circle(screen, BLACK, (eye_x, eye_y), 5)
 
 
@@ -84,81 +109,101 @@ class Pipe:
             self.y = screen_height - height - GROUND_HEIGHT
             
         self.rect = pygame.Rect(x, self.y, self.width, self.height)
+        self.previous_rect = self.rect.copy()
         self.passed = False
         
     def update(self):
         """Update the pipe's position."""
+        self.previous_rect = self.rect.copy()
         self.x -= PIPE_SPEED
         self.rect.x = self.x
         
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Draw the pipe.
         
         Args:
             screen: Pygame surface to draw on
+            alpha (float): Interpolation between the last two simulation steps
         """
-        pygame.draw.rect(screen, GREEN, self.rect)
+        pygame.draw.rect(screen, GREEN, interpolate_rect(self.previous_rect, self.rect, alpha))
 
 
 class FlappyBirdGame:
-    def __init__(self, screen, width, height):
+    def __init__(self, screen, width, height, driver=None, fonts=None, seed=None):
         """
         Initialize the Flappy Bird game.
         
+        A key press or click makes one jump on the next step, however long
+        it is held.
+        
         Args:
             screen: Pygame surface to draw on
             width (int): Screen width
             height (int): Screen height
+            driver (FrameDriver): Frame driver pacing the game loop
+            fonts (FontRegistry): Font registry shared with the launcher
+            seed (int or None): Seed for pipe gaps, or None to use the random
+                module's global state
         """
         self.screen = screen
         self.width = width
         self.height = height
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("arial", 24)
+        self.driver = driver or FrameDriver(FPS, step_rate=TICK_RATE)
+        self.fonts = fonts or FontRegistry()
+        self.font = self.fonts.get("arial", 24)
         self.running = True
+        self.rng = random if seed is None else random.Random(seed)
+        self.jumps = InputQueue(self.driver)
+        self.reset()
+        
+    def reset(self):
+        """Start a new round, keeping the random generator going."""
         self.score = 0
         self.game_over_state = False
         
         # Create bird
-        self.bird = Bird(width // 4, height // 2)
+        self.bird = Bird(self.width // 4, self.height // 2)
         
         # Create pipes
         self.pipes = []
-        self.last_pipe_time = pygame.time.get_ticks()
+        self.last_pipe_time = self.driver.get_ticks()
+        self.jumps.clear()
         
     def handle_events(self):
         """Handle game events."""
-        for event in pygame.event.get():
+        for event in self.driver.get_events():
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     if not self.game_over_state:
-                        self.bird.jump()
+                        self.jumps.push(True)
                     else:
                         # Restart game
-                        self.__init__(self.screen, self.width, self.height)
+                        self.reset()
                 elif event.key == pygame.K_ESCAPE:
                     self.running = False
+            # Also allow mouse clicks for jumping
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if not self.game_over_state:
+                    self.jumps.push(True)
                     
-        # Also allow mouse clicks for jumping
-        if pygame.mouse.get_pressed()[0] and not self.game_over_state:
-            self.bird.jump()
-            
     def update(self):
         """Update game state."""
         if self.game_over_state:
             return
             
-        # Update bird
+        # Update bird, jumping first if a jump was pressed
+        if self.jumps.pop():
+            self.bird.jump()
         self.bird.update()
         
         # Generate new pipes
-        current_time = pygame.time.get_ticks()
+        current_time = self.driver.get_ticks()
         if current_time - self.last_pipe_time > PIPE_FREQUENCY:
             # Generate random gap position
-            gap_y = random.randint(100, self.height - GROUND_HEIGHT - PIPE_GAP - 100)
+            gap_y = self.rng.randint(100, self.height - GROUND_HEIGHT - PIPE_GAP - 100)
             
             # Create top pipe
             top_height = gap_y
@@ -215,34 +260,34 @@ class FlappyBirdGame:
         # Clear screen
         self.screen.fill(BLUE)
         
+        # Positions are frozen once the game is over
+        alpha = 1.0 if self.game_over_state else self.driver.alpha
+        
         # Draw bird
-        self.bird.draw(self.screen)
+        self.bird.draw(self.screen, alpha)
         
         # Draw pipes
         for pipe in self.pipes:
-            pipe.draw(self.screen)
+            pipe.draw(self.screen, alpha)
             
         # Draw ground
         ground_rect = pygame.Rect(0, self.height - GROUND_HEIGHT, self.width, GROUND_HEIGHT)
         pygame.draw.rect(self.screen, (139, 69, 19), ground_rect)  # Brown color
         
         # Draw score
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
+        score_text = render_text(self.font, f"Score: {self.score}", WHITE)
         self.screen.blit(score_text, (10, 10))
         
         # Draw game over text if game is over
         if self.game_over_state:
-            game_over_font = pygame.font.SysFont("arial", 48)
-            game_over_text = game_over_font.render("GAME OVER", True, RED)
+            game_over_font = self.fonts.get("arial", 48)
+            game_over_text = render_text(game_over_font, "GAME OVER", RED)
             text_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
             self.screen.blit(game_over_text, text_rect)
             
-            restart_text = self.font.render("Press SPACE to restart or ESC to quit", True, WHITE)
+            restart_text = render_text(self.font, "Press SPACE to restart or ESC to quit", WHITE)
             restart_rect = restart_text.get_rect(center=(self.width // 2, self.height // 2 + 50))
             self.screen.blit(restart_text, restart_rect)
-            
-        # Update display
-        pygame.display.flip()
         
     def game_over(self):
         """Handle game over state."""
@@ -250,14 +295,11 @@ class FlappyBirdGame:
         
     def run(self):
         """Run the game loop."""
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+        self.driver.run(self)
 
 
-def run_game(screen, width, height):
+def run_game(screen, width, height, headless=None, max_frames=None, render=True, fonts=None,
+             profiler=None, input_script=None, seed=None, input_source=None):
     """
     Run the Flappy Bird game.
     
@@ -265,8 +307,19 @@ def run_game(screen, width, height):
         screen: Pygame surface to draw on
         width (int): Screen width
         height (int): Screen height
+        headless (bool or None): Run without a display or frame cap
+        max_frames (int or None): Stop after this many frames
+        render (bool): Whether to draw frames when headless
+        fonts (FontRegistry): Font registry shared with the launcher
+        profiler (FrameProfiler): Records per-phase frame timings when set
+        input_script (callable): Called with the frame number before each frame,
+            e.g. to post scripted input events
+        seed (int or None): Seed for pipe gaps
+        input_source (LiveInput): Records or replays the session when set
     """
-    game = FlappyBirdGame(screen, width, height)
+    driver = FrameDriver(FPS, headless, max_frames, render, profiler, input_script, TICK_RATE, input_source)
+    seed = driver.start_input("flappy_bird", seed)
+    game = FlappyBirdGame(screen, width, height, driver, fonts, seed)
     game.run()
 
 
@@ -0,0 +1,285 @@
+"""
+Arena where many snakes share one board, for bots and multiplayer.
+"""
+import random
+from array import array
+from collections import deque
+
+from arcade_game_launcher.games.snake.main import (
+    Snake, Food, FreeCells, SampledCells, LARGE_BOARD_CELLS, SAMPLE_ATTEMPTS, UP, DOWN, LEFT, RIGHT
+)
+
+# Most snakes an arena can hold, as snake IDs are stored in 16 bits
+MAX_SNAKES = 65535
+
+
+class ArenaSnake(Snake):
+    def __init__(self, arena, snake_id, position, direction=RIGHT):
+        """
+        Initialize a snake on an arena's board.
+        
+        The snake keeps its own body but marks its cells in the arena's
+        shared grid instead of a grid of its own, so hundreds of snakes cost
+        no more memory than the board.
+        
+        Args:
+            arena (Arena): Arena the snake plays in
+            snake_id (int): ID the snake's cells are marked with, from 1
+            position (tuple): (x, y) cell of the head
+            direction (tuple): Starting direction
+        """
+        self.arena = arena
+        self.id = snake_id
+        self.width = arena.width
+        self.height = arena.height
+        self.body = deque()
+        self.direction = direction
+        self.grow = False
+        self.alive = True
+        self.score = 0
+        self.add_head(position)
+        
+    def add_head(self, position):
+        """
+        Put a new head segment on the board.
+        
+        Args:
+            position (tuple): (x, y) cell of the new head, which must be free
+        """
+        self.body.appendleft(position)
+        cell = position[1] * self.width + position[0]
+        self.arena.free.take(cell)
+        self.arena.grid[cell] = self.id
+        
+    def remove_tail(self):
+        """
+        Take the tail segment off the board.
+        
+        Returns:
+            tuple: (x, y) cell the tail left
+        """
+        position = self.body.pop()
+        cell = position[1] * self.width + position[0]
+        self.arena.grid[cell] = 0
+        self.arena.free.release(cell)
+        return position
+        
+    def occupies(self, position):
+        """
+        Check whether a segment of this snake is on a cell.
+        
+        Args:
+            position (tuple): (x, y) cell to check
+            
+        Returns:
+            bool: True if the cell is occupied by this snake
+        """
+        return self.arena.grid[position[1] * self.width + position[0]] == self.id
+        
+    def next_head(self):
+        """
+        Get the cell the head moves to next, wrapping around the edges.
+        
+        Returns:
+            tuple: (x, y) cell
+        """
+        head_x, head_y = self.body[0]
+        dir_x, dir_y = self.direction
+        return ((head_x + dir_x) % self.width, (head_y + dir_y) % self.height)
+        
+    def check_collision(self):
+        """
+        Check if the snake was killed by the last step of its arena.
+        
+        Returns:
+            bool: True if the snake died
+        """
+        return not self.alive
+
+
+class Arena:
+    def __init__(self, width, height, foods=1, rng=random):
+        """
+        Initialize an empty arena.
+        
+        A grid shared by all snakes holds the ID of the snake on each cell,
+        or 0 when it is free. Every snake moves at once on step(), and each
+        new head is checked against the grid and against the other new
+        heads, so a tick costs one lookup per snake however long the snakes
+        are, where checking every pair of snakes would cost their total length.
+        
+        Args:
+            width (int): Board width in cells
+            height (int): Board height in cells
+            foods (int): Food kept on the board at all times
+            rng: Random number generator for spawning snakes and placing food
+        """
+        self.width = width
+        self.height = height
+        self.rng = rng
+        self.grid = array("H", bytes(2 * width * height))
+        if width * height < LARGE_BOARD_CELLS:
+            self.free = FreeCells(width * height)
+        else:
+            self.free = SampledCells(self.grid)
+        self.snakes = {}
+        self.next_id = 1
+        self.ticks = 0
+        
+        # Food cells, kept off the free cell index only by checking this set
+        self.foods = set()
+        for _ in range(foods):
+            self.add_food()
+            
+    def cell(self, position):
+        """
+        Get the index of a grid cell.
+        
+        Args:
+            position (tuple): (x, y) cell
+            
+        Returns:
+            int: Cell index
+        """
+        return position[1] * self.width + position[0]
+        
+    def owner(self, position):
+        """
+        Get the snake on a cell.
+        
+        Args:
+            position (tuple): (x, y) cell
+            
+        Returns:
+            ArenaSnake or None: The snake, or None if the cell is free
+        """
+        return self.snakes.get(self.grid[self.cell(position)])
+        
+    def add_food(self):
+        """
+        Place one more food on a free cell without food.
+        
+        Returns:
+            tuple or None: (x, y) cell of the food, or None if no cell was found
+        """
+        for _ in range(SAMPLE_ATTEMPTS):
+            position = Food(self, self.rng).position
+            if position is None:
+                return None
+            if position not in self.foods:
+                self.foods.add(position)
+                return position
+        return None
+        
+    def spawn(self, position=None, direction=None):
+        """
+        Add a snake of one segment.
+        
+        Args:
+            position (tuple or None): (x, y) cell of the head, or None for a
+                random free cell without food
+            direction (tuple or None): Starting direction, or None for random
+            
+        Returns:
+            ArenaSnake or None: The new snake, or None if the arena is full
+        """
+        if len(self.snakes) >= MAX_SNAKES:
+            return None
+        if position is None:
+            for _ in range(SAMPLE_ATTEMPTS):
+                cell = self.free.pick(self.rng)
+                if cell is None:
+                    return None
+                position = (cell % self.width, cell // self.width)
+                if position not in self.foods:
+                    break
+            else:
+                return None
+        if direction is None:
+            direction = self.rng.choice([UP, DOWN, LEFT, RIGHT])
+            
+        # IDs are reused once they wrap around
+        while self.next_id in self.snakes:
+            self.next_id = self.next_id % MAX_SNAKES + 1
+        snake = ArenaSnake(self, self.next_id, position, direction)
+        self.snakes[snake.id] = snake
+        self.next_id = self.next_id % MAX_SNAKES + 1
+        return snake
+        
+    def remove(self, snake):
+        """
+        Take a snake and all its segments off the board.
+        
+        Args:
+            snake (ArenaSnake): Snake to remove
+        """
+        while snake.body:
+            snake.remove_tail()
+        snake.alive = False
+        del self.snakes[snake.id]
+        
+    def step(self):
+        """
+        Move every snake one cell at once and resolve collisions.
+        
+        A snake dies when its new head lands on a segment of any snake,
+        itself included, or on the new head of another snake. Two snakes
+        whose heads swap cells collide head-on and both die, instead of
+        passing through each other. Tails move out of the way in the same
+        step, so following a tail is safe unless its snake is growing. Dead
+        snakes are removed from the board.
+        
+        Returns:
+            list: Snakes that died this step
+        """
+        self.ticks += 1
+        snakes = list(self.snakes.values())
+        grid = self.grid
+        width = self.width
+        
+        # Where every head comes from and goes, and the tails that leave their cells
+        moves = []
+        arrivals = {}
+        heads = {}
+        leaving = set()
+        for snake in snakes:
+            old = snake.body[0]
+            old_cell = old[1] * width + old[0]
+            head = snake.next_head()
+            cell = head[1] * width + head[0]
+            moves.append((snake, head, cell, old_cell))
+            arrivals[cell] = arrivals.get(cell, 0) + 1
+            heads[old_cell] = cell
+            if not snake.grow:
+                tail = snake.body[-1]
+                leaving.add(tail[1] * width + tail[0])
+                
+        # Resolve every collision against the board before anything moves
+        dead = []
+        survivors = []
+        for snake, head, cell, old_cell in moves:
+            if arrivals[cell] > 1 or (grid[cell] and cell not in leaving):
+                dead.append(snake)
+            elif cell != old_cell and heads.get(cell) == old_cell:
+                # Head-on: the snake whose head is on our new cell moves onto our head
+                dead.append(snake)
+            else:
+                survivors.append((snake, head))
+                
+        for snake in dead:
+            self.remove(snake)
+            
+        # Tails move first so heads can take the cells they leave
+        for snake, head in survivors:
+            if snake.grow:
+                snake.grow = False
+            else:
+                snake.remove_tail()
+        for snake, head in survivors:
+            snake.add_head(head)
+            if head in self.foods:
+                self.foods.discard(head)
+                snake.grow_snake()
+                snake.score += 10
+                self.add_food()
+        return dead
@@ -0,0 +1,324 @@
+"""
+Autopilot that plays Snake by itself, for attract mode and load testing.
+"""
+import heapq
+from array import array
+from collections import deque
+
+from arcade_game_launcher.games.snake.main import GRID_WIDTH, GRID_HEIGHT, UP, DOWN, LEFT, RIGHT
+
+# Cells a plan may expand per cell of distance to its goal before giving up,
+# which bounds the cost of searching for food that cannot be reached
+PLAN_EXPANSION_FACTOR = 16
+
+# Ticks to follow the Hamiltonian cycle after a failed plan before planning again
+PLAN_RETRY_TICKS = 4
+
+# Hamiltonian cycles by grid size, built once per size
+cycles = {}
+
+
+def build_cycle(width, height, cell_at):
+    """
+    Build a Hamiltonian cycle that crosses every row of a wraparound grid.
+    
+    Each row is crossed in full, width - 1 steps right or left, followed by
+    one step down. A row crossed rightwards moves the next row's starting
+    column one to the left and a leftwards row one to the right, so with k
+    rightward rows the cycle closes when height - 2k is a multiple of width.
+    
+    Args:
+        width (int): Cells per row
+        height (int): Number of rows
+        cell_at (callable): Maps (column, row) to a cell index
+        
+    Returns:
+        array or None: Next cell on the cycle for each cell, or None if no k fits
+    """
+    rightward = next((k for k in range(height + 1) if (height - 2 * k) % width == 0), None)
+    if rightward is None:
+        return None
+    successor = array("i", bytes(4 * width * height))
+    x = 0
+    for y in range(height):
+        step = 1 if y < rightward else -1
+        for _ in range(width - 1):
+            successor[cell_at(x, y)] = cell_at((x + step) % width, y)
+            x = (x + step) % width
+        successor[cell_at(x, y)] = cell_at(x, (y + 1) % height)
+    return successor
+
+
+def hamiltonian_cycle(width, height):
+    """
+    Get a Hamiltonian cycle over a wraparound grid, building it on first use.
+    
+    Args:
+        width (int): Grid width in cells
+        height (int): Grid height in cells
+        
+    Returns:
+        array or None: Next cell on the cycle for each cell, or None if the
+            grid is too small or no cycle of this shape exists
+    """
+    if (width, height) not in cycles:
+        cycle = None
+        if width >= 2 and height >= 2:
+            cycle = build_cycle(width, height, lambda x, y: y * width + x)
+            if cycle is None:
+                # Cross columns instead of rows
+                cycle = build_cycle(height, width, lambda y, x: y * width + x)
+        cycles[width, height] = cycle
+    return cycles[width, height]
+
+
+class Autopilot:
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        """
+        Initialize an autopilot for a grid.
+        
+        The autopilot plans a path to the food with A* over the wraparound
+        grid. Body segments count as obstacles only until the tail has moved
+        past them, so the path stays valid as the snake follows it and is
+        planned once per food rather than every tick. A path is only taken if
+        the snake can still reach its own tail after eating. Otherwise the
+        snake follows a precomputed Hamiltonian cycle, which never traps it
+        once its body lies along the cycle.
+        
+        Args:
+            width (int): Grid width in cells
+            height (int): Grid height in cells
+        """
+        self.width = width
+        self.height = height
+        self.cycle = hamiltonian_cycle(width, height)
+        self.path = deque()
+        self.target = None
+        self.expected_head = None
+        self.retry_tick = 0
+        self.ticks = 0
+        self.plans = 0
+        self.fallbacks = 0
+        
+    def cell(self, position):
+        """
+        Get the index of a grid cell.
+        
+        Args:
+            position (tuple): (x, y) cell
+            
+        Returns:
+            int: Cell index
+        """
+        return position[1] * self.width + position[0]
+        
+    def neighbors(self, cell):
+        """
+        Get the cells next to a cell, wrapping around the edges.
+        
+        Args:
+            cell (int): Cell index
+            
+        Returns:
+            list: (cell, direction) pairs
+        """
+        width, height = self.width, self.height
+        x, y = cell % width, cell // width
+        return [
+            (((y - 1) % height) * width + x, UP),
+            (((y + 1) % height) * width + x, DOWN),
+            (y * width + (x - 1) % width, LEFT),
+            (y * width + (x + 1) % width, RIGHT)
+        ]
+        
+    def direction_to(self, cell, neighbor):
+        """
+        Get the direction from a cell to one next to it.
+        
+        Args:
+            cell (int): Cell index
+            neighbor (int): Index of a cell next to it
+            
+        Returns:
+            tuple: Direction of the move
+        """
+        return next(direction for other, direction in self.neighbors(cell) if other == neighbor)
+        
+    def distance(self, a, b):
+        """
+        Get the shortest distance between two cells on an empty wraparound grid.
+        
+        Args:
+            a (int): Cell index
+            b (int): Cell index
+            
+        Returns:
+            int: Number of moves
+        """
+        dx = abs(a % self.width - b % self.width)
+        dy = abs(a // self.width - b // self.width)
+        return min(dx, self.width - dx) + min(dy, self.height - dy)
+        
+    def vacate_times(self, body, grow):
+        """
+        Get when each body cell becomes free.
+        
+        Args:
+            body (list): Cell indices, head first
+            grow (bool): Whether the tail stays put on the next move
+            
+        Returns:
+            dict: Moves until each cell is free, by cell index
+        """
+        length = len(body) + (1 if grow else 0)
+        return {cell: length - i for i, cell in enumerate(body)}
+        
+    def find_path(self, start, goal, heading, vacate):
+        """
+        Find a shortest path with A*, treating body cells as free once vacated.
+        
+        Args:
+            start (int): Cell index of the head
+            goal (int): Cell index to reach
+            heading (tuple): Current direction, which cannot be reversed
+            vacate (dict): Moves until each body cell is free
+            
+        Returns:
+            list or None: Cell indices from the first move to the goal, or
+                None if no path was found within the expansion limit
+        """
+        reverse = (-heading[0], -heading[1])
+        limit = PLAN_EXPANSION_FACTOR * (self.distance(start, goal) + self.width + self.height)
+        steps_to = {start: 0}
+        came_from = {}
+        # Ties go to the deepest node, which heads straight for the goal
+        heap = [(self.distance(start, goal), 0, start)]
+        expansions = 0
+        while heap:
+            _, depth, cell = heapq.heappop(heap)
+            steps = -depth
+            if cell == goal:
+                path = []
+                while cell != start:
+                    path.append(cell)
+                    cell = came_from[cell]
+                path.reverse()
+                return path
+            if steps > steps_to[cell]:
+                continue
+            expansions += 1
+            if expansions > limit:
+                return None
+                
+            steps += 1
+            for neighbor, direction in self.neighbors(cell):
+                if cell == start and direction == reverse:
+                    continue
+                if vacate.get(neighbor, 0) > steps or steps_to.get(neighbor, steps + 1) <= steps:
+                    continue
+                steps_to[neighbor] = steps
+                came_from[neighbor] = cell
+                heapq.heappush(heap, (steps + self.distance(neighbor, goal), -steps, neighbor))
+        return None
+        
+    def plan(self, snake, food):
+        """
+        Plan a path to the food that does not trap the snake.
+        
+        Args:
+            snake (Snake): Snake to steer
+            food (int): Cell index of the food
+            
+        Returns:
+            bool: True if a safe path was planned
+        """
+        self.plans += 1
+        body = [self.cell(position) for position in snake.body]
+        path = self.find_path(body[0], food, snake.direction, self.vacate_times(body, snake.grow))
+        if path is None:
+            return False
+            
+        # The snake's body on reaching the food, which grows on the next move
+        length = len(body) + (1 if snake.grow else 0)
+        arrived = (path[::-1] + body)[:length]
+        if length > 1:
+            previous = path[-2] if len(path) > 1 else body[0]
+            heading = self.direction_to(previous, food)
+            if self.find_path(food, arrived[-1], heading, self.vacate_times(arrived, True)) is None:
+                return False
+                
+        self.path = deque(path)
+        return True
+        
+    def is_safe(self, snake, cell):
+        """
+        Check whether the head can move into a cell on the next tick.
+        
+        Args:
+            snake (Snake): Snake to steer
+            cell (int): Cell index
+            
+        Returns:
+            bool: True if the cell is free, or is the tail and the tail moves
+        """
+        occupied = snake.occupancy[cell]
+        if not occupied:
+            return True
+        return occupied == 1 and not snake.grow and cell == self.cell(snake.body[-1])
+        
+    def fallback(self, snake, head):
+        """
+        Choose a move without a plan, following the Hamiltonian cycle.
+        
+        Args:
+            snake (Snake): Snake to steer
+            head (int): Cell index of the head
+            
+        Returns:
+            tuple: Direction to move in
+        """
+        self.fallbacks += 1
+        reverse = (-snake.direction[0], -snake.direction[1])
+        moves = [(cell, direction) for cell, direction in self.neighbors(head)
+                 if direction != reverse and self.is_safe(snake, cell)]
+        if not moves:
+            return snake.direction
+        if self.cycle:
+            successor = self.cycle[head]
+            for cell, direction in moves:
+                if cell == successor:
+                    return direction
+        return moves[0][1]
+        
+    def next_direction(self, snake, food):
+        """
+        Choose the snake's direction for the next tick.
+        
+        Args:
+            snake (Snake): Snake to steer
+            food (tuple or None): (x, y) cell of the food, None if there is none
+            
+        Returns:
+            tuple: Direction to move in
+        """
+        self.ticks += 1
+        head = self.cell(snake.body[0])
+        target = None if food is None else self.cell(food)
+        
+        # Keep the plan while the food stays put and the snake followed it
+        if target != self.target or head != self.expected_head:
+            self.path.clear()
+            self.target = target
+        if not self.path and target is not None and self.ticks >= self.retry_tick:
+            if not self.plan(snake, target):
+                self.retry_tick = self.ticks + PLAN_RETRY_TICKS
+                
+        if self.path and self.is_safe(snake, self.path[0]):
+            cell = self.path.popleft()
+            self.expected_head = cell
+            return self.direction_to(head, cell)
+            
+        self.path.clear()
+        direction = self.fallback(snake, head)
+        self.expected_head = None
+        return direction
@@ -0,0 +1,370 @@
+"""
+Vectorized Snake simulator that steps many independent boards at once.
+
+Follows the rules of Snake, Food and SnakeGame.update in main.py, including
+the order in which free cells are handed out, so a board seeded with S plays
+out exactly like the reference classes with Food placed by random.Random(S).
+Requires NumPy.
+"""
+import random
+import multiprocessing
+
+try:
+    import numpy as np
+except ImportError:  # Optional, only needed for batch simulation
+    np = None
+
+from arcade_game_launcher.games.snake.main import GRID_WIDTH, GRID_HEIGHT, UP, DOWN, LEFT, RIGHT
+
+# Action i turns the snake towards ACTIONS[i]; turning back on itself is ignored
+ACTIONS = [UP, DOWN, LEFT, RIGHT]
+OPPOSITE = [1, 0, 3, 2]
+
+# Observation cell values
+EMPTY = 0
+BODY = 1
+HEAD = 2
+FOOD = 3
+
+# Rewards
+REWARD_FOOD = 1.0
+REWARD_DEATH = -1.0
+
+
+class BatchSnakeEnv:
+    def __init__(self, num_envs, width=GRID_WIDTH, height=GRID_HEIGHT):
+        """
+        Initialize a batch of Snake boards.
+        
+        Every board's state lives in rows of shared arrays: the body as a
+        ring buffer of cell indices, per-cell segment counts, and the free
+        cell index of FreeCells. A step updates all boards with a handful of
+        array operations; only boards that eat fall back to Python, to draw
+        their next food from their own random.Random.
+        
+        Args:
+            num_envs (int): Number of boards
+            width (int): Grid width in cells
+            height (int): Grid height in cells
+        """
+        if np is None:
+            raise ImportError("BatchSnakeEnv requires NumPy (pip install -r requirements.txt)")
+            
+        self.num_envs = num_envs
+        self.width = width
+        self.height = height
+        self.cells = width * height
+        self.rows = np.arange(num_envs)
+        self.actions = np.array(ACTIONS)
+        self.opposite = np.array(OPPOSITE)
+        
+        # One more slot than cells, for the head of a snake that fills the board
+        self.ring = np.zeros((num_envs, self.cells + 1), dtype=np.int32)
+        self.head_slot = np.zeros(num_envs, dtype=np.int64)
+        self.length = np.zeros(num_envs, dtype=np.int64)
+        self.occupancy = np.zeros((num_envs, self.cells), dtype=np.uint8)
+        self.free_cells = np.zeros((num_envs, self.cells), dtype=np.int32)
+        self.free_slots = np.zeros((num_envs, self.cells), dtype=np.int32)
+        self.free_count = np.zeros(num_envs, dtype=np.int64)
+        self.direction = np.zeros(num_envs, dtype=np.int64)
+        self.grow = np.zeros(num_envs, dtype=bool)
+        self.food = np.zeros(num_envs, dtype=np.int64)
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        
+        # Observations are kept up to date cell by cell, like the incremental
+        # renderer, rather than rebuilt from the whole board every step
+        self.grid = np.zeros((num_envs, self.cells), dtype=np.uint8)
+        self.rngs = [random.Random() for _ in range(num_envs)]
+        
+    def reset(self, seed=None):
+        """
+        Start a new game on every board.
+        
+        Args:
+            seed (int or None): Board i places food with random.Random(seed + i),
+                or unseeded generators when None
+                
+        Returns:
+            numpy.ndarray: Observations, see observe()
+        """
+        for i in range(self.num_envs):
+            self.rngs[i] = random.Random(None if seed is None else seed + i)
+        self.reset_boards(self.rows)
+        return self.observe()
+        
+    def reset_boards(self, boards):
+        """
+        Start a new game on some boards, keeping their random generators.
+        
+        Args:
+            boards (numpy.ndarray): Board indices
+        """
+        if not len(boards):
+            return
+        start = (self.height // 2) * self.width + self.width // 2
+        self.occupancy[boards] = 0
+        self.grid[boards] = EMPTY
+        self.free_cells[boards] = np.arange(self.cells, dtype=np.int32)
+        self.free_slots[boards] = np.arange(self.cells, dtype=np.int32)
+        self.free_count[boards] = self.cells
+        self.head_slot[boards] = 0
+        self.ring[boards, 0] = start
+        self.length[boards] = 1
+        self.direction[boards] = ACTIONS.index(RIGHT)
+        self.grow[boards] = False
+        self.score[boards] = 0
+        self.take(boards, np.full(len(boards), start))
+        self.occupancy[boards, start] = 1
+        self.grid[boards, start] = HEAD
+        self.place_food(boards)
+        
+    def swap(self, boards, cells, slots):
+        """
+        Move cells to slots of the free cell index, like FreeCells.swap.
+        
+        Args:
+            boards (numpy.ndarray): Board indices, each at most once
+            cells (numpy.ndarray): Cell index for each board
+            slots (numpy.ndarray): Slot to move each cell to
+        """
+        others = self.free_cells[boards, slots]
+        old_slots = self.free_slots[boards, cells]
+        self.free_cells[boards, old_slots] = others
+        self.free_slots[boards, others] = old_slots
+        self.free_cells[boards, slots] = cells
+        self.free_slots[boards, cells] = slots
+        
+    def take(self, boards, cells):
+        """
+        Mark cells as taken, like FreeCells.take.
+        
+        Args:
+            boards (numpy.ndarray): Board indices, each at most once
+            cells (numpy.ndarray): Cell index for each board
+        """
+        self.free_count[boards] -= 1
+        self.swap(boards, cells, self.free_count[boards])
+        
+    def release(self, boards, cells):
+        """
+        Mark cells as free, like FreeCells.release.
+        
+        Args:
+            boards (numpy.ndarray): Board indices, each at most once
+            cells (numpy.ndarray): Cell index for each board
+        """
+        self.swap(boards, cells, self.free_count[boards])
+        self.free_count[boards] += 1
+        
+    def place_food(self, boards):
+        """
+        Place new food on some boards, like Food.generate_position.
+        
+        Args:
+            boards (numpy.ndarray): Board indices
+            
+        Returns:
+            numpy.ndarray: Boards left without a free cell, which are won
+        """
+        full = []
+        for board in boards.tolist():
+            count = int(self.free_count[board])
+            if count:
+                self.food[board] = self.free_cells[board, self.rngs[board].randrange(count)]
+                self.grid[board, self.food[board]] = FOOD
+            else:
+                self.food[board] = -1
+                full.append(board)
+        return np.array(full, dtype=np.int64)
+        
+    def step(self, actions):
+        """
+        Advance every board by one tick.
+        
+        Boards whose game ended are reset right away, so the observation
+        returned for them is the first of a new game.
+        
+        Args:
+            actions (array-like): Action index for each board, see ACTIONS
+            
+        Returns:
+            tuple: (observations, rewards, dones, info), where info["score"]
+                holds each board's score before finished games were reset
+        """
+        rows = self.rows
+        actions = np.asarray(actions, dtype=np.int64)
+        
+        # Change direction, ignoring 180-degree turns
+        self.direction = np.where(actions != self.opposite[self.direction], actions, self.direction)
+        
+        # Move: add the new head, wrapping around the edges
+        head = self.ring[rows, self.head_slot]
+        moves = self.actions[self.direction]
+        x = (head % self.width + moves[:, 0]) % self.width
+        y = (head // self.width + moves[:, 1]) % self.height
+        new_head = y * self.width + x
+        self.head_slot = (self.head_slot + 1) % (self.cells + 1)
+        self.ring[rows, self.head_slot] = new_head
+        self.length += 1
+        self.grid[rows, head] = BODY
+        entering = rows[self.occupancy[rows, new_head] == 0]
+        self.take(entering, new_head[entering])
+        self.occupancy[rows, new_head] += 1
+        
+        # Remove the tail unless growing
+        shrinking = rows[~self.grow]
+        tail = self.ring[shrinking, (self.head_slot[shrinking] - self.length[shrinking] + 1) % (self.cells + 1)]
+        self.length[shrinking] -= 1
+        self.occupancy[shrinking, tail] -= 1
+        leaving = self.occupancy[shrinking, tail] == 0
+        self.release(shrinking[leaving], tail[leaving])
+        self.grid[shrinking[leaving], tail[leaving]] = EMPTY
+        self.grid[rows, new_head] = HEAD
+        self.grow[:] = False
+        
+        # Eat food, winning once no cell is left for more
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        eaters = rows[new_head == self.food]
+        self.grow[eaters] = True
+        self.score[eaters] += 10
+        rewards[eaters] = REWARD_FOOD
+        won = self.place_food(eaters)
+        
+        # Self collision
+        crashed = self.occupancy[rows, new_head] > 1
+        crashed[won] = False
+        rewards[crashed] = REWARD_DEATH
+        dones = crashed
+        dones[won] = True
+        
+        info = {"score": self.score.copy()}
+        self.reset_boards(rows[dones])
+        return self.observe(), rewards, dones, info
+        
+    def observe(self):
+        """
+        Render every board as a grid of cell values.
+        
+        Returns:
+            numpy.ndarray: uint8 array of shape (num_envs, height, width)
+                holding EMPTY, BODY, HEAD and FOOD
+        """
+        return self.grid.reshape(self.num_envs, self.height, self.width).copy()
+        
+    def heads(self):
+        """
+        Get the head position of every snake.
+        
+        Returns:
+            numpy.ndarray: Array of shape (num_envs, 2) holding (x, y) cells
+        """
+        head = self.ring[self.rows, self.head_slot]
+        return np.stack([head % self.width, head // self.width], axis=1)
+        
+    def close(self):
+        """Release resources; nothing to do in-process."""
+
+
+def shard_worker(conn, num_envs, width, height):
+    """
+    Serve one shard of a ShardedSnakeEnv in a worker process.
+    
+    Args:
+        conn: Pipe end to receive commands on and send results to
+        num_envs (int): Boards in this shard
+        width (int): Grid width in cells
+        height (int): Grid height in cells
+    """
+    env = BatchSnakeEnv(num_envs, width, height)
+    while True:
+        try:
+            command, data = conn.recv()
+        except EOFError:
+            break
+        if command == "reset":
+            conn.send(env.reset(data))
+        elif command == "step":
+            conn.send(env.step(data))
+        elif command == "close":
+            break
+    conn.close()
+
+
+class ShardedSnakeEnv:
+    def __init__(self, num_envs, shards, width=GRID_WIDTH, height=GRID_HEIGHT):
+        """
+        Initialize a batch of Snake boards split across worker processes.
+        
+        Presents the same reset/step API as BatchSnakeEnv. Boards are numbered
+        across shards, so with the same seed board i plays out the same as in
+        a single BatchSnakeEnv.
+        
+        Args:
+            num_envs (int): Total number of boards
+            shards (int): Number of worker processes
+            width (int): Grid width in cells
+            height (int): Grid height in cells
+        """
+        shards = max(1, min(shards, num_envs))
+        self.num_envs = num_envs
+        self.width = width
+        self.height = height
+        sizes = [num_envs // shards + (1 if i < num_envs % shards else 0) for i in range(shards)]
+        self.offsets = [sum(sizes[:i]) for i in range(shards + 1)]
+        
+        context = multiprocessing.get_context("spawn")
+        self.conns = []
+        self.processes = []
+        for size in sizes:
+            conn, child_conn = context.Pipe()
+            process = context.Process(target=shard_worker, args=(child_conn, size, width, height), daemon=True)
+            process.start()
+            child_conn.close()
+            self.conns.append(conn)
+            self.processes.append(process)
+            
+    def reset(self, seed=None):
+        """
+        Start a new game on every board.
+        
+        Args:
+            seed (int or None): Board i places food with random.Random(seed + i)
+            
+        Returns:
+            numpy.ndarray: Observations of all boards
+        """
+        for conn, offset in zip(self.conns, self.offsets):
+            conn.send(("reset", None if seed is None else seed + offset))
+        return np.concatenate([conn.recv() for conn in self.conns])
+        
+    def step(self, actions):
+        """
+        Advance every board by one tick, each shard in parallel.
+        
+        Args:
+            actions (array-like): Action index for each board
+            
+        Returns:
+            tuple: (observations, rewards, dones, info) for all boards
+        """
+        actions = np.asarray(actions)
+        for i, conn in enumerate(self.conns):
+            conn.send(("step", actions[self.offsets[i]:self.offsets[i + 1]]))
+        results = [conn.recv() for conn in self.conns]
+        observations, rewards, dones, infos = zip(*results)
+        info = {"score": np.concatenate([info["score"] for info in infos])}
+        return np.concatenate(observations), np.concatenate(rewards), np.concatenate(dones), info
+        
+    def close(self):
+        """Stop the worker processes."""
+        for conn in self.conns:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.kill()
+        self.conns = []
+        self.processes = []
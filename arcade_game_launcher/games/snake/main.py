@@ -4,18 +4,31 @@ Snake game implementation.
 import os
 import sys
 import random
+from array import array
+from collections import deque
 import pygame
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+# Add the project root to the Python path when run standalone
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from arcade_game_launcher.config import BLACK, WHITE, GREEN, RED, FPS
+from arcade_game_launcher.utils.screen_manager import FrameDriver
+from arcade_game_launcher.utils.input_queue import InputQueue
+from arcade_game_launcher.utils.fonts import FontRegistry
+from arcade_game_launcher.utils.text_cache import render_text
+from arcade_game_launcher.games.snake.viewport import BoardView
 
 # Snake game constants
 GRID_SIZE = 20
 GRID_WIDTH = 40
 GRID_HEIGHT = 30
-SNAKE_SPEED = 10
+SNAKE_SPEED = 10  # moves per second, independent of the render rate
+DIRTY_CELL_LIMIT = 256  # changed cells kept for an incremental draw before redrawing fully
+LARGE_BOARD_CELLS = 1 << 18  # boards with this many cells track free cells by sampling
+SAMPLE_ATTEMPTS = 64  # random cells tried for food on a large board before scanning
+TURN_BUFFER = 3  # turns queued ahead of the snake's moves
 
 # Directions
 UP = (0, -1)
@@ -23,25 +36,243 @@ DOWN = (0, 1)
 LEFT = (-1, 0)
 RIGHT = (1, 0)
 
+# Arrow keys and the directions they turn to
+KEY_DIRECTIONS = {pygame.K_UP: UP, pygame.K_DOWN: DOWN, pygame.K_LEFT: LEFT, pygame.K_RIGHT: RIGHT}
+
+# Fonts used by the game, as (family, size) pairs
+FONT_SPECS = [("arial", 24), ("arial", 48)]
+
+
+def preload(fonts):
+    """
+    Build the game's fonts ahead of launch so the first frame does not stall.
+    
+    Args:
+        fonts (FontRegistry): Shared font registry
+    """
+    fonts.preload(FONT_SPECS)
+
+
+class FreeCells:
+    def __init__(self, count):
+        """
+        Initialize an index of free grid cells, with every cell free.
+        
+        Free cells are packed at the front of an array and a second array
+        maps each cell to its slot, so taking or releasing a cell is a swap
+        with the boundary between free and taken cells, and picking a random
+        free cell is a single lookup however full the board is.
+        
+        Args:
+            count (int): Number of cells on the grid
+        """
+        self.cells = array("i", range(count))
+        self.slots = array("i", range(count))
+        self.count = count
+        
+    def __len__(self):
+        """int: Number of free cells."""
+        return self.count
+        
+    def __contains__(self, cell):
+        """bool: True if a cell is free."""
+        return self.slots[cell] < self.count
+        
+    def swap(self, cell, slot):
+        """
+        Move a cell to a slot, moving the cell there to the old slot.
+        
+        Args:
+            cell (int): Cell index
+            slot (int): Slot to move it to
+        """
+        other = self.cells[slot]
+        old_slot = self.slots[cell]
+        self.cells[old_slot] = other
+        self.slots[other] = old_slot
+        self.cells[slot] = cell
+        self.slots[cell] = slot
+        
+    def take(self, cell):
+        """
+        Mark a free cell as taken.
+        
+        Args:
+            cell (int): Cell index
+        """
+        self.count -= 1
+        self.swap(cell, self.count)
+        
+    def release(self, cell):
+        """
+        Mark a taken cell as free.
+        
+        Args:
+            cell (int): Cell index
+        """
+        self.swap(cell, self.count)
+        self.count += 1
+        
+    def pick(self, rng=random):
+        """
+        Pick a random free cell.
+        
+        Args:
+            rng: Random number generator, the random module or a random.Random
+            
+        Returns:
+            int or None: Cell index, or None if no cell is free
+        """
+        if not self.count:
+            return None
+        return self.cells[rng.randrange(self.count)]
+
+
+class SampledCells:
+    def __init__(self, occupancy):
+        """
+        Initialize a count of the free cells of a large grid.
+        
+        FreeCells keeps two slots per cell, which adds up on boards of
+        millions of cells. This keeps only the count and picks free cells
+        by sampling the occupancy grid, which takes a draw or two while the
+        board is mostly empty, as large boards are.
+        
+        Args:
+            occupancy (bytearray or array): Per-cell values, zero for free cells
+        """
+        self.occupancy = occupancy
+        self.count = len(occupancy)
+        
+    def __len__(self):
+        """int: Number of free cells."""
+        return self.count
+        
+    def __contains__(self, cell):
+        """bool: True if a cell is free."""
+        return not self.occupancy[cell]
+        
+    def take(self, cell):
+        """
+        Mark a free cell as taken.
+        
+        Args:
+            cell (int): Cell index
+        """
+        self.count -= 1
+        
+    def release(self, cell):
+        """
+        Mark a taken cell as free.
+        
+        Args:
+            cell (int): Cell index
+        """
+        self.count += 1
+        
+    def pick(self, rng=random):
+        """
+        Pick a random free cell.
+        
+        Falls back to the first free cell after a random one when sampling
+        keeps hitting the snake.
+        
+        Args:
+            rng: Random number generator, the random module or a random.Random
+            
+        Returns:
+            int or None: Cell index, or None if no cell is free
+        """
+        if not self.count:
+            return None
+        cells = len(self.occupancy)
+        for _ in range(SAMPLE_ATTEMPTS):
+            cell = rng.randrange(cells)
+            if not self.occupancy[cell]:
+                return cell
+        try:
+            return self.occupancy.index(0, rng.randrange(cells))
+        except ValueError:
+            return self.occupancy.index(0)
+
+
 class Snake:
-    def __init__(self):
-        """Initialize the snake."""
-        self.body = [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        """
+        Initialize the snake in the middle of the grid.
+        
+        The body is a deque, head first, so moving costs O(1) at both ends.
+        A grid of per-cell segment counts mirrors the body, so collision and
+        occupancy checks are a single lookup instead of a scan, and an index
+        of the cells the snake leaves free is kept up to date for placing food.
+        
+        Args:
+            width (int): Grid width in cells
+            height (int): Grid height in cells
+        """
+        self.width = width
+        self.height = height
+        self.body = deque()
+        self.occupancy = bytearray(width * height)
+        if width * height < LARGE_BOARD_CELLS:
+            self.free = FreeCells(width * height)
+        else:
+            self.free = SampledCells(self.occupancy)
         self.direction = RIGHT
         self.grow = False
+        self.add_head((width // 2, height // 2))
+        
+    def add_head(self, position):
+        """
+        Put a new head segment on the grid.
+        
+        Args:
+            position (tuple): (x, y) cell of the new head
+        """
+        self.body.appendleft(position)
+        cell = position[1] * self.width + position[0]
+        if not self.occupancy[cell]:
+            self.free.take(cell)
+        self.occupancy[cell] += 1
+        
+    def remove_tail(self):
+        """
+        Take the tail segment off the grid.
+        
+        Returns:
+            tuple: (x, y) cell the tail left
+        """
+        position = self.body.pop()
+        cell = position[1] * self.width + position[0]
+        self.occupancy[cell] -= 1
+        if not self.occupancy[cell]:
+            self.free.release(cell)
+        return position
+        
+    def occupies(self, position):
+        """
+        Check whether a segment of the snake is on a cell.
+        
+        Args:
+            position (tuple): (x, y) cell to check
+            
+        Returns:
+            bool: True if the cell is occupied
+        """
+        return self.occupancy[position[1] * self.width + position[0]] > 0
         
     def move(self):
         """Move the snake in the current direction."""
         head_x, head_y = self.body[0]
         dir_x, dir_y = self.direction
-        new_head = ((head_x + dir_x) % GRID_WIDTH, (head_y + dir_y) % GRID_HEIGHT)
+        new_head = ((head_x + dir_x) % self.width, (head_y + dir_y) % self.height)
         
         # Insert new head
-        self.body.insert(0, new_head)
+        self.add_head(new_head)
         
         # Remove tail if not growing
         if not self.grow:
-            self.body.pop()
+            self.remove_tail()
         else:
             self.grow = False
             
@@ -63,7 +294,8 @@ class Snake:
         Returns:
             bool: True if collision detected, False otherwise
         """
-        return self.body[0] in self.body[1:]
+        head_x, head_y = self.body[0]
+        return self.occupancy[head_y * self.width + head_x] > 1
         
     def grow_snake(self):
         """Make the snake grow on the next move."""
@@ -71,94 +303,353 @@ class Snake:
 
 
 class Food:
-    def __init__(self, snake_body):
+    def __init__(self, snake, rng=random):
         """
         Initialize food at a random position.
         
         Args:
-            snake_body (list): List of snake body positions to avoid
+            snake (Snake): Snake whose cells to avoid
+            rng: Random number generator, the random module or a seeded
+                random.Random for reproducible placement
         """
-        self.position = self.generate_position(snake_body)
+        self.position = self.generate_position(snake, rng)
         
-    def generate_position(self, snake_body):
+    def generate_position(self, snake, rng=random):
         """
         Generate a random position for food that's not on the snake.
         
         Args:
-            snake_body (list): List of snake body positions to avoid
+            snake (Snake): Snake whose cells to avoid
+            rng: Random number generator
             
         Returns:
-            tuple: (x, y) position for the food
+            tuple or None: (x, y) position for the food, or None if the snake
+                fills the whole board
         """
-        while True:
-            position = (
-                random.randint(0, GRID_WIDTH - 1),
-                random.randint(0, GRID_HEIGHT - 1)
-            )
-            if position not in snake_body:
-                return position
+        cell = snake.free.pick(rng)
+        if cell is None:
+            return None
+        return (cell % snake.width, cell // snake.width)
 
 
 class SnakeGame:
-    def __init__(self, screen, width, height):
+    def __init__(self, screen, width, height, driver=None, fonts=None, seed=None, incremental=True,
+                 autopilot=False, board_size=None):
         """
         Initialize the snake game.
         
+        In incremental mode the board drawn on the screen is kept between
+        frames. Each tick only the cells that changed (the new head, the
+        vacated tail and new food) are painted and handed to the driver as
+        dirty rectangles, so drawing costs the same at any snake length.
+        
+        Turns are buffered, one applied per move, so quick turns between two
+        moves are all made instead of the last one overwriting the others.
+        
+        The default board is stretched over the screen. Other board sizes
+        are drawn at GRID_SIZE pixels per cell through a BoardView, with a
+        camera following the head, so boards of any size can be played.
+        
         Args:
             screen: Pygame surface to draw on
             width (int): Screen width
             height (int): Screen height
+            driver (FrameDriver): Frame driver pacing the game loop
+            fonts (FontRegistry): Font registry shared with the launcher
+            seed (int or None): Seed for food placement, or None to use the
+                random module's global state
+            incremental (bool): Paint only changed cells instead of the whole board
+            autopilot (bool): Let an Autopilot steer the snake
+            board_size (tuple or None): (width, height) of the board in cells,
+                or None for the default board filling the screen
         """
         self.screen = screen
         self.width = width
         self.height = height
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("arial", 24)
+        self.driver = driver or FrameDriver(FPS, step_rate=SNAKE_SPEED)
+        self.fonts = fonts or FontRegistry()
+        self.font = self.fonts.get("arial", 24)
         self.running = True
         self.score = 0
         
-        # Calculate cell size
-        self.cell_width = width // GRID_WIDTH
-        self.cell_height = height // GRID_HEIGHT
+        # Incremental drawing state
+        self.incremental = incremental
+        self.needs_redraw = True
+        self.dirty_cells = []
+        self.score_rect = None
+        self.drawn_score = None
+        self.marker_rect = None
         
         # Create snake and food
-        self.snake = Snake()
-        self.food = Food(self.snake.body)
+        board_width, board_height = board_size or (GRID_WIDTH, GRID_HEIGHT)
+        self.rng = random if seed is None else random.Random(seed)
+        self.snake = Snake(board_width, board_height)
+        self.food = Food(self.snake, self.rng)
         
+        # Calculate cell size, or fix it and view the board through a camera
+        self.view = None
+        if board_size is None:
+            self.cell_width = width // GRID_WIDTH
+            self.cell_height = height // GRID_HEIGHT
+        else:
+            self.cell_width = self.cell_height = GRID_SIZE
+            self.view = BoardView(self.snake, GRID_SIZE, width, height)
+            
+        self.autopilot = None
+        if autopilot:
+            # Imported here because the autopilot module builds on this one
+            from arcade_game_launcher.games.snake.autopilot import Autopilot
+            self.autopilot = Autopilot(board_width, board_height)
+            
+        self.turns = InputQueue(self.driver, TURN_BUFFER)
+            
     def handle_events(self):
         """Handle game events."""
-        for event in pygame.event.get():
+        for event in self.driver.get_events():
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    self.snake.change_direction(UP)
-                elif event.key == pygame.K_DOWN:
-                    self.snake.change_direction(DOWN)
-                elif event.key == pygame.K_LEFT:
-                    self.snake.change_direction(LEFT)
-                elif event.key == pygame.K_RIGHT:
-                    self.snake.change_direction(RIGHT)
+                if event.key in KEY_DIRECTIONS:
+                    self.queue_turn(KEY_DIRECTIONS[event.key])
                 elif event.key == pygame.K_ESCAPE:
                     self.running = False
                     
+    def queue_turn(self, direction):
+        """
+        Buffer a turn for one of the coming moves.
+        
+        Turns are checked against the heading the snake will have after the
+        turns already buffered, so pressing the current heading is ignored
+        and up then left while heading right is not dropped as a reversal.
+        
+        Args:
+            direction (tuple): Direction to turn to
+        """
+        heading = self.turns.last(self.snake.direction)
+        if direction != heading and direction != (-heading[0], -heading[1]):
+            self.turns.push(direction)
+            
     def update(self):
         """Update game state."""
-        # Move snake
+        # Move snake. The old tail and the new head are the cells that may
+        # have changed; their colors are worked out when they are drawn.
+        if self.autopilot:
+            self.snake.change_direction(self.autopilot.next_direction(self.snake, self.food.position))
+        else:
+            turn = self.turns.pop()
+            if turn is not None:
+                self.snake.change_direction(turn)
+        tail = self.snake.body[-1]
         self.snake.move()
+        self.dirty_cells.append(tail)
+        self.dirty_cells.append(self.snake.body[0])
         
         # Check for food collision
         if self.snake.body[0] == self.food.position:
             self.snake.grow_snake()
-            self.food = Food(self.snake.body)
+            self.food = Food(self.snake, self.rng)
             self.score += 10
-            
+            if self.food.position is not None:
+                self.dirty_cells.append(self.food.position)
+                
+            # The snake fills the board once no cell is left for food
+            if self.food.position is None:
+                self.game_over("YOU WIN", GREEN)
+                return
+                
         # Check for self collision
         if self.snake.check_collision():
             self.game_over()
             
+        # Ticks that were never drawn, e.g. with rendering off, are cheaper
+        # to catch up on with one full redraw
+        if len(self.dirty_cells) > DIRTY_CELL_LIMIT:
+            self.invalidate()
+            
+    def invalidate(self):
+        """Redraw the whole board on the next frame."""
+        self.needs_redraw = True
+        self.dirty_cells.clear()
+        
+        # Cells that changed since are no longer known, so chunks are stale
+        if self.view:
+            self.view.clear()
+        
+    def resize(self, width, height):
+        """
+        Fit the board to a new screen size.
+        
+        Args:
+            width (int): Screen width
+            height (int): Screen height
+        """
+        self.width = width
+        self.height = height
+        if self.view:
+            self.view.resize(width, height)
+        else:
+            self.cell_width = width // GRID_WIDTH
+            self.cell_height = height // GRID_HEIGHT
+        self.invalidate()
+        
+    def cell_rect(self, position):
+        """
+        Get the screen area of a grid cell.
+        
+        Args:
+            position (tuple): (x, y) cell
+            
+        Returns:
+            pygame.Rect: Area of the cell
+        """
+        return pygame.Rect(position[0] * self.cell_width, position[1] * self.cell_height,
+                           self.cell_width, self.cell_height)
+                           
+    def cell_color(self, position):
+        """
+        Get the color a grid cell is drawn in.
+        
+        Args:
+            position (tuple): (x, y) cell
+            
+        Returns:
+            tuple: RGB color of the cell
+        """
+        if position == self.food.position:
+            return RED
+        if self.snake.occupies(position):
+            return GREEN
+        return BLACK
+        
     def draw(self):
-        """Draw the game."""
+        """
+        Draw the game.
+        
+        Returns:
+            list or None: Rectangles of the screen that changed, or None when
+                the whole screen was redrawn
+        """
+        size = self.screen.get_size()
+        if size != (self.width, self.height):
+            self.resize(*size)
+            
+        if self.view:
+            return self.draw_view()
+            
+        if self.needs_redraw or not self.incremental:
+            self.draw_full()
+            return None
+            
+        rects = []
+        for position in self.dirty_cells:
+            rect = self.cell_rect(position)
+            self.screen.fill(self.cell_color(position), rect)
+            rects.append(rect)
+        self.dirty_cells.clear()
+        
+        # The score is drawn over the board, so it is redrawn when it
+        # changes or a cell under it was painted
+        if self.score != self.drawn_score or self.score_rect.collidelist(rects) != -1:
+            rects.append(self.draw_score())
+        return rects
+        
+    def draw_view(self):
+        """
+        Draw the part of the board in view of the camera.
+        
+        Returns:
+            list or None: Rectangles of the screen that changed, or None when
+                the whole screen was redrawn
+        """
+        view = self.view
+        scrolled = view.camera.follow(self.snake.body[0])
+        
+        # Changed cells are painted into their chunks whether or not they
+        # are drawn on the screen this frame
+        rects = []
+        for position in self.dirty_cells:
+            color = self.cell_color(position)
+            rect = view.update_cell(position, color)
+            if rect:
+                self.screen.fill(color, rect)
+                rects.append(rect)
+        self.dirty_cells.clear()
+        
+        if self.needs_redraw or scrolled or not self.incremental:
+            view.blit(self.screen, self.food.position)
+            self.marker_rect = None
+            self.score_rect = None
+            self.draw_marker([])
+            self.draw_score()
+            self.needs_redraw = False
+            return None
+            
+        rects.extend(self.draw_marker(rects))
+        if self.score != self.drawn_score or self.score_rect.collidelist(rects) != -1:
+            rects.append(self.draw_score())
+        return rects
+        
+    def draw_marker(self, rects):
+        """
+        Point at food outside the view with a marker on the edge of the view.
+        
+        Args:
+            rects (list): Rectangles of the screen painted this frame
+            
+        Returns:
+            list: Rectangles of the screen that changed
+        """
+        marker_rect = self.view.marker_rect(self.food.position)
+        if marker_rect == self.marker_rect and (not marker_rect or marker_rect.collidelist(rects) == -1):
+            return []
+            
+        changed = []
+        if self.marker_rect:
+            self.repaint(self.marker_rect)
+            changed.append(self.marker_rect)
+        if marker_rect:
+            pygame.draw.circle(self.screen, RED, marker_rect.center, marker_rect.width // 2)
+            changed.append(marker_rect)
+        self.marker_rect = marker_rect
+        return changed
+        
+    def repaint(self, area):
+        """
+        Redraw the board under an area of the screen.
+        
+        Args:
+            area (pygame.Rect): Area of the screen
+        """
+        if self.view:
+            self.view.blit(self.screen, self.food.position, area)
+            return
+            
+        self.screen.fill(BLACK, area)
+        for y in range(area.top // self.cell_height, min(area.bottom // self.cell_height + 1, GRID_HEIGHT)):
+            for x in range(area.left // self.cell_width, min(area.right // self.cell_width + 1, GRID_WIDTH)):
+                color = self.cell_color((x, y))
+                if color != BLACK:
+                    self.screen.fill(color, self.cell_rect((x, y)).clip(area))
+                    
+    def draw_score(self):
+        """
+        Draw the score, repainting the cells under the previous one.
+        
+        Returns:
+            pygame.Rect: Area of the screen that was redrawn
+        """
+        score_text = render_text(self.font, f"Score: {self.score}", WHITE)
+        score_rect = score_text.get_rect(topleft=(10, 10))
+        area = score_rect.union(self.score_rect) if self.score_rect else score_rect
+        
+        self.repaint(area)
+        self.screen.blit(score_text, score_rect)
+        self.score_rect = score_rect
+        self.drawn_score = self.score
+        return area
+        
+    def draw_full(self):
+        """Draw the whole board."""
         # Clear screen
         self.screen.fill(BLACK)
         
@@ -173,44 +664,52 @@ class SnakeGame:
             pygame.draw.rect(self.screen, GREEN, rect)
             
         # Draw food
-        food_rect = pygame.Rect(
-            self.food.position[0] * self.cell_width,
-            self.food.position[1] * self.cell_height,
-            self.cell_width,
-            self.cell_height
-        )
-        pygame.draw.rect(self.screen, RED, food_rect)
-        
+        if self.food.position is not None:
+            food_rect = pygame.Rect(
+                self.food.position[0] * self.cell_width,
+                self.food.position[1] * self.cell_height,
+                self.cell_width,
+                self.cell_height
+            )
+            pygame.draw.rect(self.screen, RED, food_rect)
+            
         # Draw score
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
-        
-        # Update display
-        pygame.display.flip()
-        
-    def game_over(self):
-        """Handle game over state."""
-        game_over_font = pygame.font.SysFont("arial", 48)
-        game_over_text = game_over_font.render("GAME OVER", True, RED)
-        text_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2))
+        score_text = render_text(self.font, f"Score: {self.score}", WHITE)
+        self.score_rect = self.screen.blit(score_text, (10, 10))
+        self.drawn_score = self.score
+        self.needs_redraw = False
+        self.dirty_cells.clear()
         
-        self.screen.blit(game_over_text, text_rect)
-        pygame.display.flip()
+    def game_over(self, message="GAME OVER", color=RED):
+        """
+        Handle game over state.
         
+        Args:
+            message (str): Text to show
+            color (tuple): RGB color of the text
+        """
+        # Runs that do not render skip the message like any other frame
+        if self.driver.render:
+            game_over_font = self.fonts.get("arial", 48)
+            game_over_text = render_text(game_over_font, message, color)
+            text_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2))
+            
+            self.screen.blit(game_over_text, text_rect)
+            self.driver.present()
+            self.invalidate()
+            
         # Wait for a moment before returning to launcher
-        pygame.time.wait(2000)
+        self.driver.wait(2000)
         self.running = False
         
     def run(self):
         """Run the game loop."""
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(SNAKE_SPEED)
+        self.driver.run(self)
 
 
-def run_game(screen, width, height):
+def run_game(screen, width, height, headless=None, max_frames=None, render=True, fonts=None,
+             profiler=None, input_script=None, seed=None, incremental=True, autopilot=False,
+             board_size=None, input_source=None):
     """
     Run the snake game.
     
@@ -218,8 +717,23 @@ def run_game(screen, width, height):
         screen: Pygame surface to draw on
         width (int): Screen width
         height (int): Screen height
+        headless (bool or None): Run without a display or frame cap
+        max_frames (int or None): Stop after this many frames
+        render (bool): Whether to draw frames when headless
+        fonts (FontRegistry): Font registry shared with the launcher
+        profiler (FrameProfiler): Records per-phase frame timings when set
+        input_script (callable): Called with the frame number before each frame,
+            e.g. to post scripted input events
+        seed (int or None): Seed for food placement
+        incremental (bool): Paint only the cells that changed each tick
+        autopilot (bool): Let the snake play itself
+        board_size (tuple or None): (width, height) of the board in cells, viewed
+            through a camera, or None for the default board
+        input_source (LiveInput): Records or replays the session when set
     """
-    game = SnakeGame(screen, width, height)
+    driver = FrameDriver(FPS, headless, max_frames, render, profiler, input_script, SNAKE_SPEED, input_source)
+    seed = driver.start_input("snake", seed)
+    game = SnakeGame(screen, width, height, driver, fonts, seed, incremental, autopilot, board_size)
     game.run()
 
 
@@ -0,0 +1,323 @@
+"""
+Camera and chunked rendering for Snake boards larger than the screen.
+"""
+from collections import OrderedDict
+import pygame
+
+from arcade_game_launcher.config import BLACK, GREEN, RED
+
+# Board chunks are CHUNK_CELLS x CHUNK_CELLS cells, each pre-rendered to a surface
+CHUNK_CELLS = 16
+
+# Chunks only hold these colors, so they are stored with one byte per pixel
+CHUNK_PALETTE = [BLACK, GREEN, RED]
+
+# Cells between the head and the edge of the view before the camera scrolls
+CAMERA_MARGIN = 8
+
+
+def wrapped_spans(start, length, size):
+    """
+    Split a run of cells along a wraparound axis where it crosses the edge.
+    
+    Args:
+        start (int): First cell of the run
+        length (int): Number of cells in the run
+        size (int): Number of cells along the axis
+        
+    Returns:
+        list: (first board cell, offset in the run, length) pieces
+    """
+    spans = []
+    offset = 0
+    while offset < length:
+        begin = (start + offset) % size
+        span = min(length - offset, size - begin)
+        spans.append((begin, offset, span))
+        offset += span
+    return spans
+
+
+def follow_axis(camera, head, view, size, margin):
+    """
+    Scroll one axis of the camera just enough to keep the head inside the margin.
+    
+    Args:
+        camera (int): First visible cell along the axis
+        head (int): Head cell along the axis
+        view (int): Visible cells along the axis
+        size (int): Board cells along the axis
+        margin (int): Cells to keep between the head and the edge of the view
+        
+    Returns:
+        int: New first visible cell
+    """
+    margin = min(margin, (view - 1) // 2)
+    offset = (head - camera) % size
+    if offset < margin:
+        return (head - margin) % size
+    if offset >= view - margin:
+        return (head - view + margin + 1) % size
+    return camera
+
+
+class Camera:
+    def __init__(self, board_width, board_height, view_width, view_height, margin=CAMERA_MARGIN):
+        """
+        Initialize a camera over a wraparound board.
+        
+        The camera only scrolls once the head gets within the margin of the
+        edge of the view, so most ticks leave the view where it is and can be
+        drawn incrementally.
+        
+        Args:
+            board_width (int): Board width in cells
+            board_height (int): Board height in cells
+            view_width (int): Visible cells across
+            view_height (int): Visible cells down
+            margin (int): Cells to keep between the head and the edge of the view
+        """
+        self.board_width = board_width
+        self.board_height = board_height
+        self.view_width = view_width
+        self.view_height = view_height
+        self.margin = margin
+        self.x = 0
+        self.y = 0
+        
+    def center(self, position):
+        """
+        Center the view on a cell.
+        
+        Args:
+            position (tuple): (x, y) cell
+        """
+        self.x = (position[0] - self.view_width // 2) % self.board_width
+        self.y = (position[1] - self.view_height // 2) % self.board_height
+        
+    def follow(self, position):
+        """
+        Scroll the view to keep a cell away from its edges.
+        
+        Args:
+            position (tuple): (x, y) cell to follow, usually the head
+            
+        Returns:
+            bool: True if the view scrolled
+        """
+        x = follow_axis(self.x, position[0], self.view_width, self.board_width, self.margin)
+        y = follow_axis(self.y, position[1], self.view_height, self.board_height, self.margin)
+        moved = (x, y) != (self.x, self.y)
+        self.x, self.y = x, y
+        return moved
+        
+    def to_view(self, position):
+        """
+        Get a cell's position in the view.
+        
+        Args:
+            position (tuple): (x, y) cell
+            
+        Returns:
+            tuple or None: (x, y) cell in the view, or None if it is not visible
+        """
+        x = (position[0] - self.x) % self.board_width
+        y = (position[1] - self.y) % self.board_height
+        if x >= self.view_width or y >= self.view_height:
+            return None
+        return x, y
+
+
+class BoardView:
+    def __init__(self, snake, cell_size, width, height):
+        """
+        Initialize a view of a board that is drawn through a camera.
+        
+        The board is split into chunks, each pre-rendered to a surface on
+        first sight and then kept up to date cell by cell. A frame blits the
+        chunks under the view, and only as many chunks as cover the view a
+        couple of times over are kept, least recently used first out. Drawing
+        and memory therefore scale with the view, whatever the board size.
+        
+        Args:
+            snake (Snake): Snake whose board is shown
+            cell_size (int): Cell size in pixels
+            width (int): Screen width
+            height (int): Screen height
+        """
+        self.snake = snake
+        self.cell_size = cell_size
+        self.chunks = OrderedDict()
+        self.rebuilds = 0
+        self.resize(width, height)
+        
+    def resize(self, width, height):
+        """
+        Fit the view to a new screen size.
+        
+        Args:
+            width (int): Screen width
+            height (int): Screen height
+        """
+        snake = self.snake
+        self.view_width = max(1, min(width // self.cell_size, snake.width))
+        self.view_height = max(1, min(height // self.cell_size, snake.height))
+        self.view_rect = pygame.Rect(0, 0, self.view_width * self.cell_size, self.view_height * self.cell_size)
+        self.camera = Camera(snake.width, snake.height, self.view_width, self.view_height)
+        self.camera.center(snake.body[0])
+        
+        # Chunks overlapping the view at the worst alignment, plus a row and
+        # a column so turning back does not rebuild the chunks just left behind
+        across = self.view_width // CHUNK_CELLS + 2
+        down = self.view_height // CHUNK_CELLS + 2
+        self.capacity = (across + 1) * (down + 1)
+        self.clear()
+        
+    def clear(self):
+        """Drop every pre-rendered chunk, e.g. when cells changed unseen."""
+        self.chunks.clear()
+        
+    def build_chunk(self, chunk_x, chunk_y, food):
+        """
+        Render one chunk of the board.
+        
+        Args:
+            chunk_x (int): Chunk column
+            chunk_y (int): Chunk row
+            food (tuple or None): (x, y) cell of the food
+            
+        Returns:
+            pygame.Surface: The chunk's cells
+        """
+        snake = self.snake
+        size = self.cell_size
+        left, top = chunk_x * CHUNK_CELLS, chunk_y * CHUNK_CELLS
+        columns = min(CHUNK_CELLS, snake.width - left)
+        rows = min(CHUNK_CELLS, snake.height - top)
+        surface = pygame.Surface((columns * size, rows * size), depth=8)
+        surface.set_palette(CHUNK_PALETTE)
+        surface.fill(BLACK)
+        
+        # Scan the occupancy grid a row at a time, skipping empty rows
+        for y in range(rows):
+            start = (top + y) * snake.width + left
+            row = snake.occupancy[start:start + columns]
+            if row.count(0) == columns:
+                continue
+            for x, count in enumerate(row):
+                if count:
+                    surface.fill(GREEN, (x * size, y * size, size, size))
+                    
+        if food is not None and left <= food[0] < left + columns and top <= food[1] < top + rows:
+            surface.fill(RED, ((food[0] - left) * size, (food[1] - top) * size, size, size))
+        self.rebuilds += 1
+        return surface
+        
+    def chunk(self, chunk_x, chunk_y, food):
+        """
+        Get a chunk's surface, rendering it if it is not cached.
+        
+        Args:
+            chunk_x (int): Chunk column
+            chunk_y (int): Chunk row
+            food (tuple or None): (x, y) cell of the food
+            
+        Returns:
+            pygame.Surface: The chunk's cells
+        """
+        key = (chunk_x, chunk_y)
+        surface = self.chunks.get(key)
+        if surface is None:
+            surface = self.build_chunk(chunk_x, chunk_y, food)
+            self.chunks[key] = surface
+            if len(self.chunks) > self.capacity:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(key)
+        return surface
+        
+    def update_cell(self, position, color):
+        """
+        Repaint a cell in its chunk, if the chunk is cached.
+        
+        Args:
+            position (tuple): (x, y) cell
+            color (tuple): RGB color of the cell
+            
+        Returns:
+            pygame.Rect or None: Area of the screen showing the cell, or None
+                if it is not visible
+        """
+        size = self.cell_size
+        surface = self.chunks.get((position[0] // CHUNK_CELLS, position[1] // CHUNK_CELLS))
+        if surface is not None:
+            surface.fill(color, ((position[0] % CHUNK_CELLS) * size, (position[1] % CHUNK_CELLS) * size, size, size))
+            
+        cell = self.camera.to_view(position)
+        if cell is None:
+            return None
+        return pygame.Rect(cell[0] * size, cell[1] * size, size, size)
+        
+    def blit(self, screen, food, area=None):
+        """
+        Draw the visible part of the board.
+        
+        Args:
+            screen: Pygame surface to draw on
+            food (tuple or None): (x, y) cell of the food
+            area (pygame.Rect or None): Only redraw this part of the screen
+        """
+        if area is not None:
+            screen.set_clip(area)
+        if not self.view_rect.contains(area or screen.get_rect()):
+            screen.fill(BLACK, area)
+            
+        size = self.cell_size
+        camera = self.camera
+        for board_y, view_y, height in wrapped_spans(camera.y, self.view_height, self.snake.height):
+            for board_x, view_x, width in wrapped_spans(camera.x, self.view_width, self.snake.width):
+                for chunk_y in range(board_y // CHUNK_CELLS, (board_y + height - 1) // CHUNK_CELLS + 1):
+                    top = max(board_y, chunk_y * CHUNK_CELLS)
+                    bottom = min(board_y + height, (chunk_y + 1) * CHUNK_CELLS)
+                    for chunk_x in range(board_x // CHUNK_CELLS, (board_x + width - 1) // CHUNK_CELLS + 1):
+                        left = max(board_x, chunk_x * CHUNK_CELLS)
+                        right = min(board_x + width, (chunk_x + 1) * CHUNK_CELLS)
+                        source = pygame.Rect((left - chunk_x * CHUNK_CELLS) * size, (top - chunk_y * CHUNK_CELLS) * size,
+                                             (right - left) * size, (bottom - top) * size)
+                        destination = ((view_x + left - board_x) * size, (view_y + top - board_y) * size)
+                        screen.blit(self.chunk(chunk_x, chunk_y, food), destination, source)
+                        
+        if area is not None:
+            screen.set_clip(None)
+            
+    def marker_rect(self, food):
+        """
+        Get where to point at food outside the view, on the edge of the view.
+        
+        Args:
+            food (tuple or None): (x, y) cell of the food
+            
+        Returns:
+            pygame.Rect or None: Area of the marker, or None if the food is
+                visible or there is none
+        """
+        if food is None or self.camera.to_view(food) is not None:
+            return None
+            
+        # Shortest way to the food from the middle of the view, around the edges
+        snake = self.snake
+        center_x = self.camera.x + self.view_width / 2
+        center_y = self.camera.y + self.view_height / 2
+        dx = (food[0] + 0.5 - center_x + snake.width / 2) % snake.width - snake.width / 2
+        dy = (food[1] + 0.5 - center_y + snake.height / 2) % snake.height - snake.height / 2
+        
+        # Scale the offset to reach the edge, keeping the marker inside
+        size = self.cell_size
+        half_width = self.view_rect.width / 2 - size
+        half_height = self.view_rect.height / 2 - size
+        scale = min(half_width / abs(dx * size) if dx else float("inf"),
+                    half_height / abs(dy * size) if dy else float("inf"))
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = (round(self.view_rect.centerx + dx * size * scale),
+                       round(self.view_rect.centery + dy * size * scale))
+        return rect
@@ -5,16 +5,37 @@ import os
 import sys
 import pygame
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+# Add the project root to the Python path when run standalone
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-from arcade_game_launcher.config import BLACK, WHITE, RED, BLUE, GREEN, FPS
+from arcade_game_launcher.config import BLACK, WHITE, RED, BLUE, GREEN, FPS, TICK_RATE
+from arcade_game_launcher.utils.screen_manager import FrameDriver, interpolate_rect
+from arcade_game_launcher.utils.input_queue import InputQueue
+from arcade_game_launcher.utils.fonts import FontRegistry
+from arcade_game_launcher.utils.text_cache import render_text
 
 # Game constants
 GRAVITY = 0.5
 JUMP_STRENGTH = -12
 PLAYER_SPEED = 5
 PLATFORM_SPEED = 3
+JUMP_BUFFER = 100  # milliseconds a jump pressed in the air is kept for landing
+
+# Fonts used by the game, as (family, size) pairs
+FONT_SPECS = [("arial", 24), ("arial", 48)]
+
+
+def preload(fonts):
+    """
+    Build the game's fonts ahead of launch so the first frame does not stall.
+    
+    Args:
+        fonts (FontRegistry): Shared font registry
+    """
+    fonts.preload(FONT_SPECS)
+
 
 class Player:
     def __init__(self, x, y):
@@ -33,6 +54,7 @@ class Player:
         self.velocity_y = 0
         self.is_jumping = False
         self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.previous_rect = self.rect.copy()
         self.facing_right = True
         
     def jump(self):
@@ -62,6 +84,8 @@ class Player:
         Args:
             platforms (list): List of platform objects to check for collisions
         """
+        self.previous_rect = self.rect.copy()
+        
         # Apply gravity
         self.velocity_y += GRAVITY
         
@@ -92,27 +116,30 @@ class Player:
             self.rect.right = 800
             self.x = self.rect.x - self.width
             
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Draw the player.
         
         Args:
             screen: Pygame surface to draw on
+            alpha (float): Interpolation between the last two simulation steps
         """
+        rect = interpolate_rect(self.previous_rect, self.rect, alpha)
+        
         # Draw player body
-        pygame.draw.rect(screen, RED, self.rect)
+        pygame.draw.rect(screen, RED, rect)
         
         # Draw face details based on direction
         if self.facing_right:
             # Draw eye
-            eye_x = self.rect.x + self.rect.width - 15
-            eye_y = self.rect.y + 15
+            eye_x = rect.x + rect.width - 15
+            eye_y = rect.y + 15
             pygame.draw.circle(screen, WHITE, (eye_x, eye_y), 8)
             pygame.draw.circle(screen, BLACK, (eye_x + 2, eye_y), 4)
         else:
             # Draw eye
-            eye_x = self.rect.x + 15
-            eye_y = self.rect.y + 15
+            eye_x = rect.x + 15
+            eye_y = rect.y + 15
             pygame.draw.circle(screen, WHITE, (eye_x, eye_y), 8)
             pygame.draw.circle(screen, BLACK, (eye_x - 2, eye_y), 4)
 
@@ -135,6 +162,7 @@ class Platform:
         self.width = width
         self.height = height
         self.rect = pygame.Rect(x, y, width, height)
+        self.previous_rect = self.rect.copy()
         self.moving = moving
         self.move_range = move_range
         self.start_x = x
@@ -144,6 +172,7 @@ class Platform:
     def update(self):
         """Update the platform's position if it's moving."""
         if self.moving:
+            self.previous_rect = self.rect.copy()
             self.x += self.speed * self.direction
             
             # Change direction if reached movement range
@@ -155,15 +184,16 @@ class Platform:
             # Update rectangle position
             self.rect.x = int(self.x)
             
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Draw the platform.
         
         Args:
             screen: Pygame surface to draw on
+            alpha (float): Interpolation between the last two simulation steps
         """
         color = GREEN if self.moving else (139, 69, 19)  # Brown for static platforms
-        pygame.draw.rect(screen, color, self.rect)
+        pygame.draw.rect(screen, color, interpolate_rect(self.previous_rect, self.rect, alpha))
 
 
 class Coin:
@@ -193,26 +223,33 @@ class Coin:
 
 
 class SuperMarioGame:
-    def __init__(self, screen, width, height):
+    def __init__(self, screen, width, height, driver=None, fonts=None):
         """
         Initialize the Super Mario game.
         
+        A jump pressed shortly before landing is buffered and made on
+        landing instead of being lost.
+        
         Args:
             screen: Pygame surface to draw on
             width (int): Screen width
             height (int): Screen height
+            driver (FrameDriver): Frame driver pacing the game loop
+            fonts (FontRegistry): Font registry shared with the launcher
         """
         self.screen = screen
         self.width = width
         self.height = height
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("arial", 24)
+        self.driver = driver or FrameDriver(FPS, step_rate=TICK_RATE)
+        self.fonts = fonts or FontRegistry()
+        self.font = self.fonts.get("arial", 24)
         self.running = True
         self.score = 0
         self.game_over_state = False
         
         # Create player
         self.player = Player(100, height - 200)
+        self.jumps = InputQueue(self.driver, lifetime=JUMP_BUFFER)
         
         # Create platforms
         self.platforms = [
@@ -240,20 +277,19 @@ class SuperMarioGame:
         
     def handle_events(self):
         """Handle game events."""
-        for event in pygame.event.get():
+        for event in self.driver.get_events():
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE or event.key == pygame.K_UP:
-                    self.player.jump()
+                    self.jumps.push(True)
                 elif event.key == pygame.K_ESCAPE:
                     self.running = False
                     
         # Handle continuous key presses
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
+        if self.driver.key_held(pygame.K_LEFT):
             self.player.move_left()
-        elif keys[pygame.K_RIGHT]:
+        elif self.driver.key_held(pygame.K_RIGHT):
             self.player.move_right()
         else:
             self.player.stop()
@@ -263,7 +299,9 @@ class SuperMarioGame:
         if self.game_over_state:
             return
             
-        # Update player
+        # Update player, jumping first if a jump is buffered and it can
+        if not self.player.is_jumping and self.jumps.pop():
+            self.player.jump()
         self.player.update(self.platforms)
         
         # Update platforms
@@ -289,38 +327,38 @@ class SuperMarioGame:
         # Clear screen
         self.screen.fill(BLUE)
         
+        # Positions are frozen once the game is over
+        alpha = 1.0 if self.game_over_state else self.driver.alpha
+        
         # Draw platforms
         for platform in self.platforms:
-            platform.draw(self.screen)
+            platform.draw(self.screen, alpha)
             
         # Draw coins
         for coin in self.coins:
             coin.draw(self.screen)
             
         # Draw player
-        self.player.draw(self.screen)
+        self.player.draw(self.screen, alpha)
         
         # Draw score
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
+        score_text = render_text(self.font, f"Score: {self.score}", WHITE)
         self.screen.blit(score_text, (10, 10))
         
         # Draw game over or victory text if applicable
         if self.game_over_state:
-            game_over_font = pygame.font.SysFont("arial", 48)
+            game_over_font = self.fonts.get("arial", 48)
             if all(coin.collected for coin in self.coins):
-                game_over_text = game_over_font.render("VICTORY!", True, (255, 215, 0))  # Gold color
+                game_over_text = render_text(game_over_font, "VICTORY!", (255, 215, 0))  # Gold color
             else:
-                game_over_text = game_over_font.render("GAME OVER", True, RED)
+                game_over_text = render_text(game_over_font, "GAME OVER", RED)
                 
             text_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
             self.screen.blit(game_over_text, text_rect)
             
-            restart_text = self.font.render("Press ESC to return to launcher", True, WHITE)
+            restart_text = render_text(self.font, "Press ESC to return to launcher", WHITE)
             restart_rect = restart_text.get_rect(center=(self.width // 2, self.height // 2 + 50))
             self.screen.blit(restart_text, restart_rect)
-            
-        # Update display
-        pygame.display.flip()
         
     def game_over(self):
         """Handle game over state."""
@@ -332,14 +370,11 @@ class SuperMarioGame:
         
     def run(self):
         """Run the game loop."""
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+        self.driver.run(self)
 
 
-def run_game(screen, width, height):
+def run_game(screen, width, height, headless=None, max_frames=None, render=True, fonts=None,
+             profiler=None, input_script=None, input_source=None):
     """
     Run the Super Mario game.
     
@@ -347,8 +382,18 @@ def run_game(screen, width, height):
         screen: Pygame surface to draw on
         width (int): Screen width
         height (int): Screen height
+        headless (bool or None): Run without a display or frame cap
+        max_frames (int or None): Stop after this many frames
+        render (bool): Whether to draw frames when headless
+        fonts (FontRegistry): Font registry shared with the launcher
+        profiler (FrameProfiler): Records per-phase frame timings when set
+        input_script (callable): Called with the frame number before each frame,
+            e.g. to post scripted input events
+        input_source (LiveInput): Records or replays the session when set
     """
-    game = SuperMarioGame(screen, width, height)
+    driver = FrameDriver(FPS, headless, max_frames, render, profiler, input_script, TICK_RATE, input_source)
+    driver.start_input("super_mario")
+    game = SuperMarioGame(screen, width, height, driver, fonts)
     game.run()
 
 
@@ -3,35 +3,60 @@ Main launcher UI with game selection menu.
 """
 import os
 import sys
+import time
+import argparse
 import pygame
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from arcade_game_launcher.config import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE, BLUE, 
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE, BLUE, GRAY, DARK_GRAY,
     BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_MARGIN, TITLE_FONT_SIZE, 
-    BUTTON_FONT_SIZE, GAME_TITLE
+    BUTTON_FONT_SIZE, GAME_TITLE, WARM_POOL_SIZE
 )
 from arcade_game_launcher.utils.button import Button
-from arcade_game_launcher.utils.game_loader import GameLoader
-from arcade_game_launcher.utils.screen_manager import ScreenManager
+from arcade_game_launcher.utils.game_list import GameList, SCROLL_KEYS
+from arcade_game_launcher.utils.game_loader import GameLoader, PRELOAD_HOVER
+from arcade_game_launcher.utils.text_cache import text_cache
+from arcade_game_launcher.utils.fonts import FontRegistry
+from arcade_game_launcher.utils.profiler import FrameProfiler
+from arcade_game_launcher.utils.replay import InputRecorder
+from arcade_game_launcher.utils.search import SearchIndex
+from arcade_game_launcher.utils.thumbnails import ThumbnailCache
+from arcade_game_launcher.utils.screen_manager import ScreenManager, is_headless, init_display
 
 class LauncherScreen:
-    def __init__(self, screen_manager):
+    def __init__(self, screen_manager, game_loader, fonts, thumbnails=None):
         """
         Initialize the launcher screen.
         
         Args:
             screen_manager: Screen manager instance
+            game_loader: Game loader that has already discovered the games
+            fonts (FontRegistry): Shared font registry
+            thumbnails (ThumbnailCache or None): Source of game preview thumbnails
         """
         self.screen_manager = screen_manager
-        self.game_loader = GameLoader()
-        self.games = self.game_loader.discover_games()
-        self.buttons = []
+        self.game_loader = game_loader
+        self.fonts = fonts
+        self.thumbnails = thumbnails
+        self.games = game_loader.games
+        self.game_list = None
         self.title_font = None
         self.button_font = None
         self.quit_button = None
+        self.title_surface = None
+        self.needs_redraw = True
+        
+        # Type-ahead search over the catalog
+        self.search_index = SearchIndex()
+        self.search_index.update(list(self.games.values()))
+        self.games_by_name = {entry["name"]: entry for entry in self.games.values()}
+        self.query = ""
+        self.search_rect = pygame.Rect(0, 0, BUTTON_WIDTH + BUTTON_MARGIN * 2, BUTTON_HEIGHT * 3 // 5)
+        self.search_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4)
+        self.search_dirty = True
         
         # Initialize UI elements
         self.init_ui()
@@ -39,50 +64,90 @@ class LauncherScreen:
     def init_ui(self):
         """Initialize UI elements like fonts and buttons."""
         # Initialize fonts
-        pygame.font.init()
-        try:
-            font_path = os.path.join("assets", "fonts", "arial.ttf")
-            if os.path.exists(font_path):
-                self.title_font = pygame.font.Font(font_path, TITLE_FONT_SIZE)
-                self.button_font = pygame.font.Font(font_path, BUTTON_FONT_SIZE)
-            else:
-                self.title_font = pygame.font.SysFont("arial", TITLE_FONT_SIZE)
-                self.button_font = pygame.font.SysFont("arial", BUTTON_FONT_SIZE)
-        except Exception as e:
-            print(f"Error loading fonts: {e}")
-            self.title_font = pygame.font.SysFont("arial", TITLE_FONT_SIZE)
-            self.button_font = pygame.font.SysFont("arial", BUTTON_FONT_SIZE)
-            
+        self.title_font = self.fonts.get("arial", TITLE_FONT_SIZE)
+        self.button_font = self.fonts.get("arial", BUTTON_FONT_SIZE)
+        
+        # Pre-render the title
+        self.title_surface = self.title_font.render(GAME_TITLE, True, WHITE)
+        
         # Create game buttons
         self.create_buttons()
         
     def create_buttons(self):
-        """Create buttons for each game."""
-        self.buttons = []
-        
-        # Calculate starting position for buttons
+        """Create the virtualized game list and the quit button."""
+        row_height = BUTTON_HEIGHT + BUTTON_MARGIN
         start_y = SCREEN_HEIGHT // 3
+        visible_rows = self.count_visible_rows()
         
-        # Create a button for each game
-        for i, game_name in enumerate(self.games.keys()):
-            x = (SCREEN_WIDTH - BUTTON_WIDTH) // 2
-            y = start_y + i * (BUTTON_HEIGHT + BUTTON_MARGIN)
-            
-            button = Button(x, y, BUTTON_WIDTH, BUTTON_HEIGHT, game_name)
-            button.set_font(self.button_font)
-            self.buttons.append(button)
-            
-        # Add quit button at the bottom
-        quit_y = start_y + len(self.games) * (BUTTON_HEIGHT + BUTTON_MARGIN) + BUTTON_MARGIN
-        self.quit_button = Button(
-            (SCREEN_WIDTH - BUTTON_WIDTH) // 2,
-            quit_y,
-            BUTTON_WIDTH,
-            BUTTON_HEIGHT,
-            "Quit"
-        )
+        # Buttons are created for the visible rows only
+        x = (SCREEN_WIDTH - BUTTON_WIDTH) // 2
+        self.game_list = GameList(x, start_y, BUTTON_WIDTH, BUTTON_HEIGHT, row_height, visible_rows,
+                                  self.button_font, self.thumbnails)
+        self.game_list.set_items(list(self.games.values()))
+        
+        # Add quit button below the list
+        quit_y = start_y + visible_rows * row_height + BUTTON_MARGIN
+        self.quit_button = Button(x, quit_y, BUTTON_WIDTH, BUTTON_HEIGHT, "Quit")
         self.quit_button.set_font(self.button_font)
         
+    def count_visible_rows(self):
+        """
+        Count the game rows to show: as many as fit above the quit button.
+        
+        Returns:
+            int: Number of visible rows
+        """
+        space = SCREEN_HEIGHT - SCREEN_HEIGHT // 3 - BUTTON_HEIGHT - 2 * BUTTON_MARGIN
+        return max(1, min(len(self.games), space // (BUTTON_HEIGHT + BUTTON_MARGIN)))
+        
+    def refresh_games(self):
+        """Pick up catalog changes, re-indexing only the games that changed."""
+        self.games = self.game_loader.games
+        self.games_by_name = {entry["name"]: entry for entry in self.games.values()}
+        self.search_index.update(list(self.games.values()))
+        
+        # The number of rows depends on the catalog size
+        if self.count_visible_rows() != self.game_list.visible_rows:
+            self.create_buttons()
+        self.apply_search(reset=False)
+        self.needs_redraw = True
+        
+    def apply_search(self, reset=True):
+        """
+        Show the games matching the current query.
+        
+        Args:
+            reset (bool): Scroll back to the first match
+        """
+        names = self.search_index.search(self.query)
+        self.game_list.set_items([self.games_by_name[name] for name in names], reset)
+        self.search_dirty = True
+        
+    def handle_search_key(self, event):
+        """
+        Edit the search query from a key press.
+        
+        Args:
+            event: Pygame KEYDOWN event
+            
+        Returns:
+            bool: True if the query changed
+        """
+        if event.key == pygame.K_BACKSPACE:
+            query = self.query[:-1]
+        elif event.key == pygame.K_ESCAPE:
+            query = ""
+        elif event.key not in SCROLL_KEYS and event.unicode and event.unicode.isprintable():
+            query = self.query + event.unicode
+        else:
+            return False
+            
+        if query == self.query:
+            return False
+        self.query = query
+        self.apply_search()
+        return True
+        
     def handle_event(self, event):
         """
         Handle events for the launcher screen.
@@ -93,15 +158,17 @@ class LauncherScreen:
         Returns:
             str or None: Game name to launch, or None to continue
         """
-        # Handle button clicks
+        # Typing filters the games
+        if event.type == pygame.KEYDOWN and self.handle_search_key(event):
+            return None
+            
+        # Scrolling and game clicks
+        game_info = self.game_list.handle_event(event)
+        if game_info:
+            return game_info["name"]
+            
+        # Check quit button
         if event.type == pygame.MOUSEBUTTONDOWN:
-            # Check game buttons
-            for i, button in enumerate(self.buttons):
-                if button.handle_event(event):
-                    game_name = list(self.games.keys())[i]
-                    return game_name
-                    
-            # Check quit button
             if self.quit_button and self.quit_button.handle_event(event):
                 self.screen_manager.quit()
                 return None
@@ -112,13 +179,44 @@ class LauncherScreen:
         """Update the launcher screen."""
         mouse_pos = pygame.mouse.get_pos()
         
-        # Update button states
-        for button in self.buttons:
-            button.update(mouse_pos)
+        # Games loaded in the background build their fonts here, on the main thread
+        self.game_loader.finish_preloads()
+        
+        # Update the hovered game, warming it in the background
+        game_info = self.game_list.update(mouse_pos)
+        if game_info:
+            self.game_loader.preload(game_info["name"], PRELOAD_HOVER)
             
         if self.quit_button:
             self.quit_button.update(mouse_pos)
             
+    def invalidate(self):
+        """Force a full redraw on the next frame."""
+        self.needs_redraw = True
+        
+    def draw_search(self, screen):
+        """
+        Draw the search box with the current query.
+        
+        Args:
+            screen: Pygame surface to draw on
+        """
+        screen.fill(BLACK, self.search_rect)
+        pygame.draw.rect(screen, DARK_GRAY, self.search_rect, 2)
+        if not self.query:
+            text, color = "Type to search", GRAY
+        elif not self.game_list.items:
+            text, color = f"{self.query} - no matches", GRAY
+        else:
+            text, color = self.query, WHITE
+            
+        # Rendered directly: every keystroke gives a new string, which
+        # would only churn the text cache
+        text_surface = self.button_font.render(text, True, color)
+        text_rect = text_surface.get_rect(midleft=(self.search_rect.x + 8, self.search_rect.centery))
+        screen.blit(text_surface, text_rect, pygame.Rect(0, 0, self.search_rect.width - 16, text_rect.height))
+        self.search_dirty = False
+        
     def draw(self, screen):
         """
         Draw the launcher screen.
@@ -130,42 +228,183 @@ class LauncherScreen:
         screen.fill(BLACK)
         
         # Draw title
-        if self.title_font:
-            title_surface = self.title_font.render(GAME_TITLE, True, WHITE)
-            title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 6))
-            screen.blit(title_surface, title_rect)
-            
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(screen)
+        if self.title_surface:
+            title_rect = self.title_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 6))
+            screen.blit(self.title_surface, title_rect)
             
+        # Draw the search box and the visible games
+        self.draw_search(screen)
+        self.game_list.draw(screen)
+        
         # Draw quit button
         if self.quit_button:
             self.quit_button.draw(screen)
+            
+    def draw_dirty(self, screen):
+        """
+        Draw only what changed since the last frame.
+        
+        Args:
+            screen: Pygame surface to draw on
+            
+        Returns:
+            list: Rectangles of the screen that were redrawn
+        """
+        if self.needs_redraw:
+            self.needs_redraw = False
+            self.draw(screen)
+            return [screen.get_rect()]
+            
+        rects = self.game_list.draw_dirty(screen)
+        if self.search_dirty:
+            self.draw_search(screen)
+            rects.append(self.search_rect)
+        if self.quit_button and self.quit_button.dirty:
+            self.quit_button.draw(screen)
+            rects.append(self.quit_button.rect)
+        return rects
 
 
 class GameRunner:
-    def __init__(self):
-        """Initialize the game runner."""
-        # Initialize Pygame
-        pygame.init()
+    def __init__(self, headless=None, max_frames=None, render=True, hot_reload=False,
+                 profile=False, trace_file=None, isolated=False, warm_pool=WARM_POOL_SIZE, lazy=False,
+                 record_dir=None):
+        """
+        Initialize the game runner.
+        
+        Args:
+            headless (bool or None): Run off-screen without a frame cap,
+                or None to read the ARCADE_HEADLESS environment variable
+            max_frames (int or None): Frames to run each screen for when headless
+            render (bool): Whether to draw frames when headless
+            hot_reload (bool): Reload game modules whose files changed
+            profile (bool): Record per-phase frame timings (F3 shows the overlay)
+            trace_file (str or None): Write a Chrome trace of the session here
+            isolated (bool): Run each game in its own process
+            warm_pool (int): Forked workers kept ready for isolated games, 0 to
+                spawn every session from scratch
+            lazy (bool): Load games only when they are launched, and skip the
+                warm pool and thumbnail rendering, for the fastest startup
+            record_dir (str or None): Record every game session to a replay
+                file in this directory
+        """
+        self.headless = is_headless(headless)
+        self.max_frames = max_frames
+        self.render = render
+        self.isolated = isolated
+        self.lazy = lazy
+        self.record_dir = record_dir
+        self.trace_file = trace_file
+        self.profiler = None
+        if profile or trace_file:
+            self.profiler = FrameProfiler(trace=bool(trace_file))
+            self.profiler.set_label("launcher")
+        
+        # Initialize only the display; fonts start on first use
+        init_display(self.headless)
         
         # Create screen manager
-        self.screen_manager = ScreenManager(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.screen_manager = ScreenManager(SCREEN_WIDTH, SCREEN_HEIGHT, self.headless, max_frames, self.profiler)
+        self.screen_manager.driver.render = render or not self.headless
         self.screen_manager.set_caption(GAME_TITLE)
         self.screen_manager.set_fps(FPS)
         
-        # Create launcher screen
-        self.launcher_screen = LauncherScreen(self.screen_manager)
+        # Fonts are resolved once and shared with every game
+        self.fonts = FontRegistry()
         
-        # Game loader
-        self.game_loader = GameLoader()
+        # Game loader, shared with the launcher screen
+        self.game_loader = GameLoader(hot_reload=hot_reload, fonts=self.fonts, lazy=lazy)
         self.game_loader.discover_games()
         
-    def run(self):
-        """Run the game launcher."""
-        # Set the initial screen
+        # Create launcher screen with game previews
+        self.thumbnails = ThumbnailCache()
+        self.launcher_screen = LauncherScreen(self.screen_manager, self.game_loader, self.fonts, self.thumbnails)
+        
+        # Warm the session pool while the menu is up
+        self.pool = None
+        if isolated and warm_pool > 0 and not lazy:
+            # Multiprocessing is imported only when isolation is used
+            from arcade_game_launcher.utils.warm_pool import WarmPool
+            self.pool = WarmPool(warm_pool)
+            if not self.pool.start():
+                self.pool = None
+        
+    def launch(self, game_name):
+        """
+        Run a single game and return when it exits.
+        
+        Args:
+            game_name (str): Name of the game to run
+            
+        Returns:
+            bool: True if the game ran successfully, False otherwise
+        """
+        print(f"Launching game: {game_name}")
+        pygame.display.set_caption(f"{GAME_TITLE} - {game_name}")
+        
+        record = None
+        if self.record_dir:
+            record = os.path.join(self.record_dir, f"{game_name}-{time.strftime('%Y%m%d-%H%M%S')}.replay")
+            
+        # Run the game, either in its own process or in this one
+        if self.isolated:
+            from arcade_game_launcher.utils.isolation import IsolatedSession
+            session = IsolatedSession(game_name, SCREEN_WIDTH, SCREEN_HEIGHT, self.headless, self.max_frames,
+                                      pool=self.pool, record=record)
+            result = session.run(self.screen_manager)
+            pygame.display.set_caption(GAME_TITLE)
+            if record and os.path.exists(record):
+                print(f"Recorded {game_name} to {record}")
+            return result
+            
+        result = self.game_loader.run_game(
+            game_name,
+            self.screen_manager.screen,
+            headless=self.headless,
+            max_frames=self.max_frames,
+            render=self.render,
+            profiler=self.profiler,
+            input_source=InputRecorder(record) if record else None
+        )
+        
+        pygame.display.set_caption(GAME_TITLE)
+        if record and os.path.exists(record):
+            print(f"Recorded {game_name} to {record}")
+        if self.profiler:
+            print(f"Frame timings for {game_name}:")
+            for line in self.profiler.summary():
+                print(f"  {line}")
+            self.profiler.set_label("launcher")
+        return result
+        
+    def start_menu(self):
+        """Show the menu and warm games and their thumbnails while it is idle."""
         self.screen_manager.set_screen(self.launcher_screen)
+        if not self.lazy:
+            self.thumbnails.generate(self.game_loader.games.values())
+            self.game_loader.preload_all()
+            
+    def run(self, game_names=None):
+        """
+        Run the game launcher.
+        
+        Args:
+            game_names (list or None): Games to launch directly, skipping the menu.
+                Isolated headless games run in parallel, others one after another.
+        """
+        if game_names:
+            if self.isolated and self.headless and len(game_names) > 1:
+                from arcade_game_launcher.utils.isolation import run_parallel
+                results = run_parallel(game_names, SCREEN_WIDTH, SCREEN_HEIGHT, self.max_frames, pool=self.pool)
+                for name, ok in results.items():
+                    print(f"{name}: {'ok' if ok else 'failed'}")
+            else:
+                for game_name in game_names:
+                    self.launch(game_name)
+            self.shutdown()
+            return
+            
+        self.start_menu()
         
         # Main loop
         running = True
@@ -178,20 +417,71 @@ class GameRunner:
                 running = False
             else:
                 # Launch the selected game
-                print(f"Launching game: {result}")
-                pygame.display.set_caption(f"{GAME_TITLE} - {result}")
-                
-                # Run the game
-                self.game_loader.run_game(result, self.screen_manager.screen)
+                self.launch(result)
                 
+                # Games edited while hot reloading may have been added or renamed
+                if self.game_loader.hot_reload:
+                    self.game_loader.discover_games()
+                    self.launcher_screen.refresh_games()
+                    
                 # Return to the launcher
-                pygame.display.set_caption(GAME_TITLE)
                 self.screen_manager.set_screen(self.launcher_screen)
                 
         # Clean up
+        self.shutdown()
+        
+    def shutdown(self):
+        """Report session statistics and shut down Pygame."""
+        stats = text_cache.stats()
+        print(f"Text cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['evictions']} evictions, ~{stats['saved_ms']:.1f} ms saved")
+        if self.trace_file:
+            self.profiler.export_chrome_trace(self.trace_file)
+        if self.pool:
+            self.pool.stop()
+        self.thumbnails.shutdown()
         pygame.quit()
 
 
+def parse_args(argv=None):
+    """
+    Parse command line arguments for the launcher.
+    
+    Args:
+        argv (list or None): Arguments to parse, or None for sys.argv
+        
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description=GAME_TITLE)
+    parser.add_argument("--headless", action="store_true", default=None,
+                        help="render off-screen and drop the frame cap")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="number of frames to run when headless")
+    parser.add_argument("--no-render", dest="render", action="store_false",
+                        help="skip drawing entirely when headless")
+    parser.add_argument("--hot-reload", action="store_true",
+                        help="reload a game's module when its file changes")
+    parser.add_argument("--profile", action="store_true",
+                        help="record per-phase frame timings, F3 toggles the overlay")
+    parser.add_argument("--trace", default=None, metavar="FILE",
+                        help="write a Chrome trace-event JSON file on exit")
+    parser.add_argument("--isolated", action="store_true",
+                        help="run each game in its own process")
+    parser.add_argument("--warm-pool", type=int, default=WARM_POOL_SIZE, metavar="N",
+                        help="forked workers kept ready for isolated games, 0 disables the pool")
+    parser.add_argument("--lazy", action="store_true",
+                        help="load games only when launched, for the fastest startup")
+    parser.add_argument("--record", default=None, metavar="DIR",
+                        help="record every game session to a replay file in DIR")
+    parser.add_argument("--game", action="append", default=None,
+                        help="launch a game directly instead of showing the menu, "
+                             "may be repeated")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    runner = GameRunner()
-    runner.run()
+    args = parse_args()
+    runner = GameRunner(args.headless, args.frames, args.render, args.hot_reload,
+                        args.profile, args.trace, args.isolated, args.warm_pool, args.lazy, args.record)
+    runner.run(args.game)
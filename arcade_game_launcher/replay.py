@@ -0,0 +1,158 @@
+"""
+Replays recorded game sessions headless at full speed.
+
+Sessions are recorded with the launcher's --record option. A replay runs
+the game with the recorded seed and input, without a frame cap, and checks
+that it ends with the recorded score. With --profile it reports per-phase
+frame timings, so a slow stretch a player hit can be measured again; with
+--frames it stops early, e.g. just after a reported bug.
+
+Usage:
+    python -m arcade_game_launcher.replay FILE [--frames N] [--render] [--profile]
+    python -m arcade_game_launcher.replay FILE --info
+    python -m arcade_game_launcher.replay FILE --dump FRAME [COUNT]
+"""
+import os
+import sys
+import time
+import argparse
+import pygame
+
+# Add the project root to the Python path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from arcade_game_launcher.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from arcade_game_launcher.utils.game_loader import GameLoader
+from arcade_game_launcher.utils.profiler import FrameProfiler
+from arcade_game_launcher.utils.replay import InputReplay
+from arcade_game_launcher.utils.screen_manager import init_display
+
+# Frames printed by --dump when no count is given
+DEFAULT_DUMP_FRAMES = 10
+
+
+def print_info(log):
+    """
+    Print what a replay file holds.
+    
+    Args:
+        log (ReplayLog): Opened replay file
+    """
+    header = log.header
+    size = len(log.data)
+    print(f"Game:      {header['game']}")
+    print(f"Seed:      {header['seed']}")
+    print(f"Timing:    {header['fps']} fps, {header['step_rate']} steps/s")
+    print(f"Frames:    {log.frames} ({log.frames / header['fps']:.1f} s)")
+    print(f"Score:     {log.footer.get('score', 'unknown, the recording was cut short')}")
+    print(f"Size:      {size} bytes, {size / max(log.frames, 1):.2f} bytes/frame, {len(log.index)} blocks")
+
+
+def dump_frames(log, start, count):
+    """
+    Print the recorded input of some frames.
+    
+    Args:
+        log (ReplayLog): Opened replay file
+        start (int): First frame to print
+        count (int): Number of frames to print
+    """
+    for frame, steps, events, polls in log.iter_frames(start):
+        if frame >= start + count:
+            break
+        names = [pygame.event.event_name(event.type) + (f" {pygame.key.name(event.key)}" if hasattr(event, "key") else "")
+                 for event in events]
+        held = "".join("1" if poll else "0" for poll in polls)
+        print(f"{frame:>8}  steps {steps}  polls {held or '-'}  {', '.join(names)}")
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments for replaying a session.
+    
+    Args:
+        argv (list or None): Arguments to parse, or None for sys.argv
+        
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Replay a recorded game session")
+    parser.add_argument("file", help="replay file recorded with the launcher's --record")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="stop after this many frames")
+    parser.add_argument("--render", action="store_true",
+                        help="draw every frame, as the recorded session did")
+    parser.add_argument("--profile", action="store_true",
+                        help="report per-phase frame timings")
+    parser.add_argument("--info", action="store_true",
+                        help="describe the recording instead of replaying it")
+    parser.add_argument("--dump", type=int, nargs="+", default=None, metavar="FRAME",
+                        help="print the recorded input from FRAME on, for COUNT frames")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Replay a recorded session.
+    
+    Args:
+        argv (list or None): Arguments to parse, or None for sys.argv
+        
+    Returns:
+        int: Process exit code, 1 if the replay diverged from the recording
+    """
+    args = parse_args(argv)
+    try:
+        replay = InputReplay(args.file)
+    except (OSError, ValueError) as e:
+        print(f"Cannot read replay: {e}")
+        return 1
+        
+    if args.info:
+        print_info(replay.log)
+        return 0
+    if args.dump:
+        dump_frames(replay.log, args.dump[0], args.dump[1] if len(args.dump) > 1 else DEFAULT_DUMP_FRAMES)
+        return 0
+        
+    init_display(True)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    loader = GameLoader()
+    loader.discover_games()
+    profiler = FrameProfiler() if args.profile else None
+    
+    game_name = replay.log.header["game"]
+    start = time.perf_counter()
+    ok = loader.run_game(
+        game_name,
+        screen,
+        headless=True,
+        max_frames=args.frames,
+        render=args.render,
+        profiler=profiler,
+        input_source=replay
+    )
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+    if not ok:
+        return 1
+        
+    recorded_seconds = replay.frame / replay.log.header["fps"]
+    print(f"Replayed {replay.frame} frames of {game_name} in {elapsed:.2f} s "
+          f"({recorded_seconds / elapsed if elapsed else 0:.1f}x real time)")
+    if profiler:
+        for line in profiler.summary():
+            print(f"  {line}")
+    if replay.diverged:
+        return 1
+    if "score" not in replay.log.footer:
+        print("The recording was cut short, so there is no score to check")
+    elif args.frames is None or replay.frame >= replay.log.frames:
+        print("Replay matches the recording")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
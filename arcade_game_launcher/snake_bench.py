@@ -0,0 +1,665 @@
+"""
+Micro-benchmarks for the Snake game's simulation.
+
+Sections, selected with --only:
+    ticks      one tick (move, food check, self-collision) by snake length
+    food       placing food by board fill
+    draw       one tick drawn fully and incrementally by snake length
+    autopilot  autopilot decision time and play by board size
+    world      camera drawing time and chunk memory by board size
+    arena      collision checks, then tick time by snake count and length
+    batch      batch simulator checked against the game, then its steps/s
+
+Ticks, food placement, incremental draws, world draws and arena ticks per
+snake should not grow with snake length, fill or board size.
+
+Usage:
+    python -m arcade_game_launcher.snake_bench [--only SECTION [SECTION ...]]
+                                               [--ticks N] [--lengths N [N ...]]
+                                               [--placements N] [--fills F [F ...]]
+                                               [--draws N] [--draw-lengths N [N ...]]
+                                               [--autopilot-ticks N] [--autopilot-sizes WxH [WxH ...]]
+                                               [--world-draws N] [--world-sizes WxH [WxH ...]]
+                                               [--arena-ticks N] [--arena-snakes N [N ...]]
+                                               [--arena-lengths N [N ...]]
+                                               [--batch-envs N [N ...]] [--batch-steps N]
+                                               [--shards N]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import pygame
+
+# Add the project root to the Python path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from arcade_game_launcher.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from arcade_game_launcher.games.snake.main import (
+    Snake, SnakeGame, Food, GRID_WIDTH, GRID_HEIGHT, UP, DOWN, LEFT, RIGHT
+)
+from arcade_game_launcher.games.snake import batch
+from arcade_game_launcher.games.snake.autopilot import Autopilot
+from arcade_game_launcher.games.snake.arena import Arena
+from arcade_game_launcher.utils.fonts import FontRegistry
+from arcade_game_launcher.utils.screen_manager import FrameDriver, init_display
+
+# Benchmark settings
+DEFAULT_TICKS = 100000
+DEFAULT_LENGTHS = [10, 100, 1000, 10000, 100000]
+DEFAULT_PLACEMENTS = 100000
+DEFAULT_FILLS = [0.1, 0.5, 0.9, 0.99, 1.0]
+DEFAULT_DRAWS = 2000
+DEFAULT_DRAW_LENGTHS = [10, 100, 1000]
+DEFAULT_AUTOPILOT_TICKS = 20000
+DEFAULT_AUTOPILOT_SIZES = ["40x30", "100x100", "500x500"]
+DEFAULT_WORLD_DRAWS = 2000
+DEFAULT_WORLD_SIZES = ["100x100", "500x500", "2000x2000"]
+DEFAULT_ARENA_TICKS = 200
+DEFAULT_ARENA_SNAKES = [10, 100, 1000]
+DEFAULT_ARENA_LENGTHS = [10, 100, 1000]
+DEFAULT_BATCH_ENVS = [1, 64, 1024, 4096]
+DEFAULT_BATCH_STEPS = 200
+DEFAULT_SHARDS = os.cpu_count() or 1
+SECTIONS = ["ticks", "food", "draw", "autopilot", "world", "arena", "batch"]
+
+
+def grown_snake(length):
+    """
+    Build a snake of a given length heading right along a ring of cells.
+    
+    The ring is four times as long as the snake, so it never runs into
+    itself however long the benchmark runs.
+    
+    Args:
+        length (int): Number of segments
+        
+    Returns:
+        Snake: The grown snake
+    """
+    snake = Snake(length * 4, 1)
+    snake.direction = RIGHT
+    for _ in range(length - 1):
+        snake.grow_snake()
+        snake.move()
+    return snake
+
+
+def bench_ticks(length, ticks):
+    """
+    Time game ticks of a snake.
+    
+    Args:
+        length (int): Number of segments
+        ticks (int): Ticks to run
+        
+    Returns:
+        float: Microseconds per tick
+    """
+    snake = grown_snake(length)
+    food = (0, 0)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        snake.move()
+        # The food check without eating, so the length stays fixed
+        snake.body[0] == food
+        if snake.check_collision():
+            raise RuntimeError("The benchmark snake ran into itself")
+        snake.occupies(food)
+    return (time.perf_counter() - start) * 1e6 / ticks
+
+
+def bench_food(fill, placements, seed=0):
+    """
+    Time food placement on a default-sized board partly covered by snake.
+    
+    Args:
+        fill (float): Fraction of the board covered, 1.0 for a full board
+        placements (int): Placements to run
+        seed (int): Seed for covering the board and placing food
+        
+    Returns:
+        float: Microseconds per placement
+    """
+    rng = random.Random(seed)
+    snake = Snake()
+    cells = [(x, y) for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH)]
+    rng.shuffle(cells)
+    for position in cells[:int(len(cells) * fill)]:
+        if not snake.occupies(position):
+            snake.add_head(position)
+            
+    start = time.perf_counter()
+    for _ in range(placements):
+        Food(snake, rng)
+    return (time.perf_counter() - start) * 1e6 / placements
+    
+    
+def bench_draw(length, draws, incremental, fonts):
+    """
+    Time drawing a tick of the default game.
+    
+    The snake winds over the board: right along a row, then one step
+    down, wrapping around. It does not cross its own body for lengths up
+    to 1000 on the default board.
+    
+    Args:
+        length (int): Number of segments, at most 1000
+        draws (int): Ticks to draw
+        incremental (bool): Use incremental rendering
+        fonts (FontRegistry): Shared font registry
+        
+    Returns:
+        float: Microseconds per draw
+    """
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = SnakeGame(screen, SCREEN_WIDTH, SCREEN_HEIGHT, FrameDriver(headless=True), fonts,
+                     seed=0, incremental=incremental)
+    # No food, so the length stays fixed
+    game.food.position = None
+    
+    def step(tick, grow):
+        game.snake.change_direction(DOWN if tick % GRID_WIDTH == GRID_WIDTH - 1 else RIGHT)
+        if grow:
+            game.snake.grow_snake()
+        game.update()
+        
+    for tick in range(length - 1):
+        step(tick, True)
+    game.draw()
+    
+    elapsed = 0
+    for tick in range(length - 1, length - 1 + draws):
+        step(tick, False)
+        start = time.perf_counter()
+        game.draw()
+        elapsed += time.perf_counter() - start
+    if not game.running:
+        raise RuntimeError("The benchmark snake ran into itself")
+    return elapsed * 1e6 / draws
+    
+    
+def bench_autopilot(width, height, ticks, seed=0):
+    """
+    Time the autopilot steering a snake, starting over whenever it dies.
+    
+    Args:
+        width (int): Grid width in cells
+        height (int): Grid height in cells
+        ticks (int): Ticks to play
+        seed (int): Seed for food placement
+        
+    Returns:
+        dict: Decision time per tick in microseconds (mean, p99 and max),
+            foods eaten, deaths and the longest snake
+    """
+    rng = random.Random(seed)
+    times = []
+    eaten = 0
+    deaths = 0
+    longest = 1
+    snake = Snake(width, height)
+    food = Food(snake, rng)
+    autopilot = Autopilot(width, height)
+    for _ in range(ticks):
+        start = time.perf_counter()
+        direction = autopilot.next_direction(snake, food.position)
+        times.append(time.perf_counter() - start)
+        
+        snake.change_direction(direction)
+        snake.move()
+        if snake.body[0] == food.position:
+            snake.grow_snake()
+            food = Food(snake, rng)
+            eaten += 1
+        longest = max(longest, len(snake.body))
+        # Start over on death, or once the snake fills the board
+        crashed = snake.check_collision()
+        if crashed:
+            deaths += 1
+        if crashed or food.position is None:
+            snake = Snake(width, height)
+            food = Food(snake, rng)
+            autopilot = Autopilot(width, height)
+            
+    times.sort()
+    return {
+        "mean": sum(times) * 1e6 / len(times),
+        "p99": times[int(len(times) * 0.99)] * 1e6,
+        "max": times[-1] * 1e6,
+        "eaten": eaten,
+        "deaths": deaths,
+        "longest": longest
+    }
+    
+    
+def bench_world(width, height, draws, fonts, seed=0):
+    """
+    Time drawing a large board through the camera while the autopilot plays.
+    
+    Args:
+        width (int): Board width in cells
+        height (int): Board height in cells
+        draws (int): Ticks to draw
+        fonts (FontRegistry): Shared font registry
+        seed (int): Seed for food placement
+        
+    Returns:
+        dict: Microseconds per draw, the share of frames redrawn in full
+            because the camera scrolled, and the chunks cached with their
+            size in kilobytes
+    """
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = SnakeGame(screen, SCREEN_WIDTH, SCREEN_HEIGHT, FrameDriver(headless=True), fonts,
+                     seed=seed, autopilot=True, board_size=(width, height))
+    game.draw()
+    
+    elapsed = 0
+    full = 0
+    for _ in range(draws):
+        game.update()
+        if not game.running:
+            break
+        start = time.perf_counter()
+        rects = game.draw()
+        elapsed += time.perf_counter() - start
+        full += rects is None
+        
+    chunks = game.view.chunks.values()
+    return {
+        "us": elapsed * 1e6 / draws,
+        "full": full / draws,
+        "chunks": len(chunks),
+        "kb": sum(chunk.get_width() * chunk.get_height() * chunk.get_bytesize() for chunk in chunks) / 1024
+    }
+    
+    
+def bench_arena(snakes, length, ticks):
+    """
+    Time arena ticks with snakes of a fixed length.
+    
+    Each snake heads right along its own row, four times as long as the
+    snake, so none of them ever collide and the segment count stays fixed.
+    
+    Args:
+        snakes (int): Number of snakes
+        length (int): Segments per snake
+        ticks (int): Ticks to time
+        
+    Returns:
+        float: Microseconds per tick
+    """
+    arena = Arena(length * 4, snakes, foods=0)
+    for row in range(snakes):
+        arena.spawn((0, row), RIGHT)
+    for _ in range(length - 1):
+        for snake in arena.snakes.values():
+            snake.grow_snake()
+        arena.step()
+        
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if arena.step():
+            raise RuntimeError("Benchmark snakes collided")
+    return (time.perf_counter() - start) * 1e6 / ticks
+    
+    
+def bench_brawl(snakes, ticks, size=200, seed=0):
+    """
+    Time an arena of bots turning at random, respawning those that die.
+    
+    Args:
+        snakes (int): Number of snakes
+        ticks (int): Ticks to run
+        size (int): Board width and height in cells
+        seed (int): Seed for the bots, spawning and food
+        
+    Returns:
+        dict: Microseconds per tick, deaths per tick and the longest snake
+    """
+    rng = random.Random(seed)
+    arena = Arena(size, size, foods=snakes // 2, rng=rng)
+    for _ in range(snakes):
+        arena.spawn()
+    directions = [UP, DOWN, LEFT, RIGHT]
+    
+    elapsed = 0
+    deaths = 0
+    longest = 1
+    for _ in range(ticks):
+        for snake in arena.snakes.values():
+            if rng.random() < 0.1:
+                snake.change_direction(rng.choice(directions))
+        start = time.perf_counter()
+        dead = arena.step()
+        elapsed += time.perf_counter() - start
+        deaths += len(dead)
+        longest = max(longest, max(len(snake.body) for snake in arena.snakes.values()) if arena.snakes else 1)
+        for _ in dead:
+            arena.spawn()
+    return {"us": elapsed * 1e6 / ticks, "deaths": deaths / ticks, "longest": longest}
+    
+    
+def check_arena():
+    """
+    Check arena collisions on small boards where the outcome is known.
+    
+    Returns:
+        list: Descriptions of the cases that resolved wrongly
+    """
+    # (name, [(head, direction)], snakes expected to die)
+    cases = [
+        ("head-on swap", [((3, 0), RIGHT), ((4, 0), LEFT)], 2),
+        ("head-on into one cell", [((3, 0), RIGHT), ((5, 0), LEFT)], 2),
+        ("following a tail", [((3, 0), RIGHT), ((4, 0), RIGHT)], 0),
+        ("crossing paths", [((3, 0), RIGHT), ((4, 1), UP)], 2),
+    ]
+    failures = []
+    for name, spawns, expected in cases:
+        arena = Arena(10, 10, foods=0)
+        for position, direction in spawns:
+            arena.spawn(position, direction)
+        dead = len(arena.step())
+        if dead != expected:
+            failures.append(f"{name}: {dead} snakes died, expected {expected}")
+    return failures
+    
+    
+def parse_size(text):
+    """
+    Parse a board size given as WIDTHxHEIGHT.
+    
+    Args:
+        text (str): Size such as "40x30"
+        
+    Returns:
+        tuple: (width, height) in cells
+    """
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid board size: {text!r}")
+    return width, height
+    
+    
+def reference_rollout(seed, actions, width=GRID_WIDTH, height=GRID_HEIGHT):
+    """
+    Play one game with the reference classes, as SnakeGame.update does.
+    
+    Args:
+        seed (int): Seed for food placement
+        actions (list): Action index for each tick, see batch.ACTIONS
+        width (int): Grid width in cells
+        height (int): Grid height in cells
+        
+    Returns:
+        list: (head, length, food, done, score) after each tick, up to the
+            end of the game
+    """
+    rng = random.Random(seed)
+    snake = Snake(width, height)
+    food = Food(snake, rng)
+    score = 0
+    states = []
+    for action in actions:
+        snake.change_direction(batch.ACTIONS[action])
+        snake.move()
+        done = False
+        if snake.body[0] == food.position:
+            snake.grow_snake()
+            food = Food(snake, rng)
+            score += 10
+            done = food.position is None
+        if not done:
+            done = snake.check_collision()
+        states.append((snake.body[0], len(snake.body), food.position, done, score))
+        if done:
+            break
+    return states
+    
+    
+def check_batch(num_envs, steps, width=GRID_WIDTH, height=GRID_HEIGHT, seed=0):
+    """
+    Check that the batch simulator plays out like the reference classes.
+    
+    Every board plays random actions; its first game is compared tick by
+    tick with reference_rollout.
+    
+    Args:
+        num_envs (int): Boards to check
+        steps (int): Ticks to run
+        width (int): Grid width in cells
+        height (int): Grid height in cells
+        seed (int): Seed for food placement and actions
+        
+    Returns:
+        int: Number of boards that differed
+    """
+    rng = random.Random(seed)
+    actions = [[rng.randrange(len(batch.ACTIONS)) for _ in range(num_envs)] for _ in range(steps)]
+    env = batch.BatchSnakeEnv(num_envs, width, height)
+    env.reset(seed)
+    states = [[] for _ in range(num_envs)]
+    playing = set(range(num_envs))
+    for tick_actions in actions:
+        _, _, dones, info = env.step(tick_actions)
+        heads = env.heads()
+        for board in list(playing):
+            if dones[board]:
+                # The board was reset, so only the outcome can be compared
+                states[board].append(("done", int(info["score"][board])))
+                playing.discard(board)
+                continue
+            food = int(env.food[board])
+            states[board].append(((int(heads[board][0]), int(heads[board][1])), int(env.length[board]),
+                                  (food % width, food // width), False, int(env.score[board])))
+                                  
+    mismatches = 0
+    for board in range(num_envs):
+        expected = [("done", state[4]) if state[3] else state
+                    for state in reference_rollout(seed + board, [tick[board] for tick in actions], width, height)]
+        if states[board] != expected:
+            mismatches += 1
+    return mismatches
+    
+    
+def bench_reference(steps, seed=0):
+    """
+    Time ticks of the reference classes with random actions.
+    
+    Args:
+        steps (int): Ticks to run
+        seed (int): Seed for food placement and actions
+        
+    Returns:
+        float: Steps per second
+    """
+    rng = random.Random(seed)
+    actions = [rng.randrange(len(batch.ACTIONS)) for _ in range(steps)]
+    start = time.perf_counter()
+    done = steps
+    while done:
+        done -= len(reference_rollout(rng.randrange(1 << 30), actions[:done]))
+    return steps / (time.perf_counter() - start)
+    
+    
+def bench_batch(env, steps, seed=0):
+    """
+    Time ticks of a batch simulator with random actions.
+    
+    Args:
+        env: BatchSnakeEnv or ShardedSnakeEnv
+        steps (int): Ticks to run
+        seed (int): Seed for food placement and actions
+        
+    Returns:
+        float: Board steps per second
+    """
+    rng = random.Random(seed)
+    actions = [[rng.randrange(len(batch.ACTIONS)) for _ in range(env.num_envs)] for _ in range(steps)]
+    env.reset(seed)
+    start = time.perf_counter()
+    for tick_actions in actions:
+        env.step(tick_actions)
+    return steps * env.num_envs / (time.perf_counter() - start)
+    
+    
+def parse_args(argv=None):
+    """
+    Parse command line arguments for the Snake benchmarks.
+    
+    Args:
+        argv (list or None): Arguments to parse, or None for sys.argv
+        
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Snake simulation")
+    parser.add_argument("--only", nargs="+", choices=SECTIONS, default=SECTIONS,
+                        help="benchmark sections to run")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS,
+                        help="ticks to time per snake length")
+    parser.add_argument("--lengths", type=int, nargs="+", default=DEFAULT_LENGTHS,
+                        help="snake lengths to benchmark")
+    parser.add_argument("--placements", type=int, default=DEFAULT_PLACEMENTS,
+                        help="food placements to time per board fill")
+    parser.add_argument("--fills", type=float, nargs="+", default=DEFAULT_FILLS,
+                        help="fractions of the board covered by the snake")
+    parser.add_argument("--draws", type=int, default=DEFAULT_DRAWS,
+                        help="ticks to draw per snake length")
+    parser.add_argument("--draw-lengths", type=int, nargs="+", default=DEFAULT_DRAW_LENGTHS,
+                        help="snake lengths to time drawing for, up to 1000")
+    parser.add_argument("--autopilot-ticks", type=int, default=DEFAULT_AUTOPILOT_TICKS,
+                        help="ticks for the autopilot to play per board size")
+    parser.add_argument("--autopilot-sizes", type=parse_size, nargs="+",
+                        default=[parse_size(size) for size in DEFAULT_AUTOPILOT_SIZES],
+                        help="board sizes to run the autopilot on, as WIDTHxHEIGHT")
+    parser.add_argument("--world-draws", type=int, default=DEFAULT_WORLD_DRAWS,
+                        help="ticks to draw per large board size")
+    parser.add_argument("--world-sizes", type=parse_size, nargs="+",
+                        default=[parse_size(size) for size in DEFAULT_WORLD_SIZES],
+                        help="large board sizes to time drawing for, as WIDTHxHEIGHT")
+    parser.add_argument("--arena-ticks", type=int, default=DEFAULT_ARENA_TICKS,
+                        help="arena ticks to time per snake count and length")
+    parser.add_argument("--arena-snakes", type=int, nargs="+", default=DEFAULT_ARENA_SNAKES,
+                        help="numbers of snakes to put in the arena")
+    parser.add_argument("--arena-lengths", type=int, nargs="+", default=DEFAULT_ARENA_LENGTHS,
+                        help="arena snake lengths to benchmark")
+    parser.add_argument("--batch-envs", type=int, nargs="+", default=DEFAULT_BATCH_ENVS,
+                        help="board counts to time the batch simulator with")
+    parser.add_argument("--batch-steps", type=int, default=DEFAULT_BATCH_STEPS,
+                        help="batch steps to time per board count")
+    parser.add_argument("--shards", type=int, default=DEFAULT_SHARDS,
+                        help="worker processes for the sharded batch simulator")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Run the Snake benchmarks.
+    
+    Args:
+        argv (list or None): Arguments to parse, or None for sys.argv
+        
+    Returns:
+        int: Process exit code
+    """
+    args = parse_args(argv)
+    exit_code = 0
+    
+    if "ticks" in args.only:
+        print(f"{'length':>8}{'us/tick':>10}")
+        for length in args.lengths:
+            print(f"{length:>8}{bench_ticks(length, args.ticks):>10.3f}")
+        print()
+        
+    if "food" in args.only:
+        print(f"{'fill':>8}{'us/food':>10}")
+        for fill in args.fills:
+            print(f"{fill:>8.0%}{bench_food(fill, args.placements):>10.3f}")
+        print()
+        
+    if "draw" in args.only:
+        init_display(True)
+        fonts = FontRegistry()
+        print(f"{'length':>8}{'full us/draw':>14}{'incremental':>13}")
+        for length in args.draw_lengths:
+            full = bench_draw(length, args.draws, False, fonts)
+            incremental = bench_draw(length, args.draws, True, fonts)
+            print(f"{length:>8}{full:>14.1f}{incremental:>13.1f}")
+        print()
+        pygame.quit()
+        
+    if "autopilot" in args.only:
+        print(f"{'board':>10}{'mean us':>10}{'p99 us':>10}{'max us':>10}{'eaten':>8}{'deaths':>8}{'longest':>9}")
+        for width, height in args.autopilot_sizes:
+            result = bench_autopilot(width, height, args.autopilot_ticks)
+            print(f"{f'{width}x{height}':>10}{result['mean']:>10.1f}{result['p99']:>10.1f}{result['max']:>10.0f}"
+                  f"{result['eaten']:>8}{result['deaths']:>8}{result['longest']:>9}")
+        print()
+        
+    if "world" in args.only:
+        init_display(True)
+        fonts = FontRegistry()
+        print(f"{'board':>10}{'us/draw':>10}{'scrolled':>10}{'chunks':>8}{'chunk KB':>10}")
+        for width, height in args.world_sizes:
+            result = bench_world(width, height, args.world_draws, fonts)
+            print(f"{f'{width}x{height}':>10}{result['us']:>10.1f}{result['full']:>10.0%}"
+                  f"{result['chunks']:>8}{result['kb']:>10.0f}")
+        print()
+        pygame.quit()
+        
+    if "arena" in args.only:
+        failures = check_arena()
+        if failures:
+            print("Arena collisions resolved wrongly:")
+            for failure in failures:
+                print(f"  {failure}")
+            exit_code = 1
+        else:
+            print("Arena collisions resolve as expected")
+            
+        print(f"{'snakes':>8}{'length':>8}{'segments':>10}{'us/tick':>10}{'us/snake':>10}")
+        for snakes in args.arena_snakes:
+            for length in args.arena_lengths:
+                us = bench_arena(snakes, length, args.arena_ticks)
+                print(f"{snakes:>8}{length:>8}{snakes * length:>10}{us:>10.1f}{us / snakes:>10.3f}")
+        result = bench_brawl(max(args.arena_snakes), args.arena_ticks * 10)
+        print(f"Brawl of {max(args.arena_snakes)} bots: {result['us']:.1f} us/tick, "
+              f"{result['deaths']:.2f} deaths/tick, longest snake {result['longest']}")
+        print()
+        
+    if "batch" in args.only:
+        if batch.np is None:
+            print("Skipping the batch simulator: NumPy is not installed, see requirements.txt")
+            return exit_code
+            
+        mismatches = check_batch(64, 2000) + check_batch(256, 500, 5, 4)
+        if mismatches:
+            print(f"Batch simulator differs from the reference classes on {mismatches} boards")
+            exit_code = 1
+        else:
+            print("Batch simulator matches the reference classes")
+            
+        print(f"{'boards':>8}{'steps/s':>14}")
+        print(f"{'ref':>8}{bench_reference(args.batch_steps * 10):>14,.0f}")
+        for num_envs in args.batch_envs:
+            env = batch.BatchSnakeEnv(num_envs)
+            print(f"{num_envs:>8}{bench_batch(env, args.batch_steps):>14,.0f}")
+            
+        if args.shards > 1:
+            num_envs = max(args.batch_envs)
+            env = batch.ShardedSnakeEnv(num_envs, args.shards)
+            try:
+                steps_per_second = bench_batch(env, args.batch_steps)
+            finally:
+                env.close()
+            print(f"{num_envs:>8}{steps_per_second:>14,.0f}  ({args.shards} shards)")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""
+Startup profiler for the launcher.
+
+Reports an import-time breakdown (from python -X importtime) and the wall
+clock time from process start to the first menu frame, and checks both
+against the budget checked in as startup_budget.json.
+
+Usage:
+    python -m arcade_game_launcher.startup [--runs N] [--top N] [--lazy]
+                                           [--budget FILE]
+"""
+import os
+import sys
+import re
+import json
+import time
+import argparse
+import subprocess
+
+# Add the project root to the Python path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from arcade_game_launcher.config import PACKAGE_DIR
+
+# Profiler settings
+DEFAULT_RUNS = 5
+DEFAULT_TOP = 15
+DEFAULT_BUDGET = os.path.join(PACKAGE_DIR, "startup_budget.json")
+PROFILED_MODULE = "arcade_game_launcher.launcher"
+FIRST_FRAME_MARKER = "FIRST_MENU_FRAME"
+FIRST_FRAME_PATTERN = re.compile(FIRST_FRAME_MARKER + r" (\d+\.\d+)")
+
+# Runs the real launcher startup path up to the first menu frame. The marker
+# goes to a pipe of its own in a single write, so output printed by the
+# launcher's background threads cannot land in the middle of it.
+FIRST_FRAME_SCRIPT = f"""
+import os, sys, time
+from arcade_game_launcher.launcher import GameRunner
+runner = GameRunner(headless=True, max_frames=1, lazy=sys.argv[1] == "1")
+runner.start_menu()
+runner.screen_manager.run()
+os.write(int(sys.argv[2]), ("{FIRST_FRAME_MARKER} %.6f\\n" % time.time()).encode())
+runner.shutdown()
+"""
+
+
+def run_python(args, **kwargs):
+    """
+    Start a fresh interpreter with the project root on its path.
+    
+    Args:
+        args (list): Interpreter arguments
+        **kwargs: Extra subprocess.Popen arguments
+        
+    Returns:
+        subprocess.Popen: The started process
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    return subprocess.Popen([sys.executable] + args, env=env, text=True, **kwargs)
+
+
+def import_profile(module=PROFILED_MODULE):
+    """
+    Measure how long importing a module takes, broken down per import.
+    
+    Args:
+        module (str): Module to import
+        
+    Returns:
+        list: (name, self_ms, cumulative_ms, depth) tuples in import order
+    """
+    process = run_python(["-X", "importtime", "-c", f"import {module}"],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    _, stderr = process.communicate()
+    
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000, depth))
+    return imports
+
+
+def first_frame_ms(lazy=False):
+    """
+    Measure the wall clock time from process start to the first menu frame.
+    
+    Args:
+        lazy (bool): Start the launcher in lazy mode
+        
+    Returns:
+        float: Milliseconds to the first menu frame
+    """
+    read_fd, write_fd = os.pipe()
+    start = time.time()
+    process = run_python(["-c", FIRST_FRAME_SCRIPT, "1" if lazy else "0", str(write_fd)],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, pass_fds=(write_fd,))
+    os.close(write_fd)
+    try:
+        # Blocks until the marker is written or the launcher exits
+        with os.fdopen(read_fd) as marker:
+            match = FIRST_FRAME_PATTERN.search(marker.readline())
+        if match:
+            return (float(match.group(1)) - start) * 1000
+    finally:
+        # Background work such as thumbnail rendering is not part of startup
+        process.kill()
+        process.wait()
+    raise RuntimeError("The launcher exited before drawing the menu")
+
+
+def median(values):
+    """
+    Get the median of some values.
+    
+    Args:
+        values (list): Numbers
+        
+    Returns:
+        float: The median
+    """
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments for the startup profiler.
+    
+    Args:
+        argv (list or None): Arguments to parse, or None for sys.argv
+        
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Profile launcher startup")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS,
+                        help="measurements per metric, the median is reported")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP,
+                        help="number of slowest imports to list")
+    parser.add_argument("--lazy", action="store_true",
+                        help="profile the launcher's lazy startup mode")
+    parser.add_argument("--budget", default=DEFAULT_BUDGET,
+                        help="budget to check the results against")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Run the startup profiler.
+    
+    Args:
+        argv (list or None): Arguments to parse, or None for sys.argv
+        
+    Returns:
+        int: Process exit code, 1 if the budget was exceeded
+    """
+    args = parse_args(argv)
+    runs = max(args.runs, 1)
+    
+    # Import time, keeping the breakdown of the median run
+    profiles = sorted((import_profile() for _ in range(runs)),
+                      key=lambda imports: sum(entry[2] for entry in imports if entry[3] == 0))
+    imports = profiles[len(profiles) // 2]
+    import_ms = sum(entry[2] for entry in imports if entry[3] == 0)
+    
+    print(f"Slowest imports of {PROFILED_MODULE}:")
+    print(f"  {'cumulative ms':>13}  {'self ms':>8}  module")
+    for name, self_ms, cumulative_ms, _ in sorted(imports, key=lambda entry: -entry[2])[:args.top]:
+        print(f"  {cumulative_ms:>13.2f}  {self_ms:>8.2f}  {name}")
+        
+    own_ms = sum(entry[1] for entry in imports if entry[0].startswith("arcade_game_launcher"))
+    print(f"\nTotal import time: {import_ms:.1f} ms ({own_ms:.1f} ms in arcade_game_launcher itself)")
+    
+    # Wall clock to the first menu frame
+    frame_ms = median([first_frame_ms(args.lazy) for _ in range(runs)])
+    mode = "lazy" if args.lazy else "default"
+    print(f"Process start to first menu frame ({mode} mode): {frame_ms:.1f} ms")
+    
+    if not os.path.exists(args.budget):
+        print(f"No budget at {args.budget}")
+        return 0
+        
+    with open(args.budget, "r") as f:
+        budget = json.load(f)
+    results = {"import_ms": import_ms, f"first_frame_ms_{mode}": frame_ms}
+    exceeded = [f"{key}: {value:.1f} ms over budget of {budget[key]} ms"
+                for key, value in results.items() if key in budget and value > budget[key]]
+    if exceeded:
+        print("Startup budget exceeded:")
+        for line in exceeded:
+            print(f"  {line}")
+        return 1
+        
+    print(f"Within the startup budget in {args.budget}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ Button class for UI elements in the game launcher.
 """
 import pygame
 from arcade_game_launcher.config import WHITE, BLACK, LIGHT_GRAY, DARK_GRAY
+from arcade_game_launcher.utils.text_cache import render_text
 
 class Button:
     def __init__(self, x, y, width, height, text, font_size=24):
@@ -24,6 +25,11 @@ class Button:
         self.is_hovered = False
         self.is_clicked = False
         
+        # Pre-baked surfaces for each hover state, built by bake()
+        self.normal_surface = None
+        self.hover_surface = None
+        self.dirty = True
+        
         # Colors
         self.bg_color = LIGHT_GRAY
         self.hover_color = WHITE
@@ -33,27 +39,77 @@ class Button:
     def set_font(self, font):
         """Set the font for the button text."""
         self.font = font
+        self.bake()
         
-    def draw(self, screen):
+    def set_text(self, text):
         """
-        Draw the button on the screen.
+        Change the button text. The surfaces are baked again on the next draw.
         
         Args:
-            screen: Pygame surface to draw on
+            text (str): Text to display on the button
+        """
+        if text != self.text:
+            self.text = text
+            self.normal_surface = None
+            self.hover_surface = None
+            self.dirty = True
+            
+    def set_hovered(self, is_hovered):
         """
+        Set the hover state directly, e.g. from an index-based hit test.
+        
+        Args:
+            is_hovered (bool): Whether the mouse is over the button
+        """
+        if is_hovered != self.is_hovered:
+            self.is_hovered = is_hovered
+            self.dirty = True
+        
+    def render_state(self, color):
+        """
+        Render the button for one background color.
+        
+        Args:
+            color (tuple): Background RGB color
+            
+        Returns:
+            pygame.Surface: The rendered button
+        """
+        surface = pygame.Surface(self.rect.size)
+        local_rect = surface.get_rect()
+        
         # Draw button background
-        color = self.hover_color if self.is_hovered else self.bg_color
-        pygame.draw.rect(screen, color, self.rect)
+        pygame.draw.rect(surface, color, local_rect)
         
         # Draw border
-        pygame.draw.rect(screen, self.border_color, self.rect, 2)
+        pygame.draw.rect(surface, self.border_color, local_rect, 2)
         
         # Draw text if font is available
         if self.font:
-            text_surface = self.font.render(self.text, True, self.text_color)
-            text_rect = text_surface.get_rect(center=self.rect.center)
-            screen.blit(text_surface, text_rect)
-            
+            text_surface = render_text(self.font, self.text, self.text_color)
+            text_rect = text_surface.get_rect(center=local_rect.center)
+            surface.blit(text_surface, text_rect)
+        return surface
+        
+    def bake(self):
+        """Pre-render the normal and hover surfaces."""
+        self.normal_surface = self.render_state(self.bg_color)
+        self.hover_surface = self.render_state(self.hover_color)
+        self.dirty = True
+        
+    def draw(self, screen):
+        """
+        Draw the button on the screen.
+        
+        Args:
+            screen: Pygame surface to draw on
+        """
+        if self.normal_surface is None:
+            self.bake()
+        surface = self.hover_surface if self.is_hovered else self.normal_surface
+        screen.blit(surface, self.rect)
+        self.dirty = False
+        
     def update(self, mouse_pos):
         """
         Update button state based on mouse position.
@@ -64,7 +120,7 @@ class Button:
         Returns:
             bool: True if button is hovered, False otherwise
         """
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        self.set_hovered(bool(self.rect.collidepoint(mouse_pos)))
         return self.is_hovered
         
     def handle_event(self, event):
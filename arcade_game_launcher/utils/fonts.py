@@ -0,0 +1,73 @@
+"""
+Font registry that resolves and caches fonts once for the launcher and games.
+"""
+import os
+import threading
+import pygame
+from arcade_game_launcher.config import FONTS_DIR
+
+
+class FontRegistry:
+    def __init__(self, fonts_dir=FONTS_DIR):
+        """
+        Initialize the font registry.
+        
+        Args:
+            fonts_dir (str): Directory searched for bundled .ttf files first
+        """
+        self.fonts_dir = fonts_dir
+        self.fonts = {}
+        self.lock = threading.Lock()
+        
+    def load(self, family, size):
+        """
+        Load a font, preferring a bundled file over a system font.
+        
+        Args:
+            family (str): Font family, e.g. "arial"
+            size (int): Font size
+            
+        Returns:
+            pygame.font.Font: The loaded font
+        """
+        if not pygame.font.get_init():
+            pygame.font.init()
+        try:
+            font_path = os.path.join(self.fonts_dir, f"{family}.ttf")
+            if os.path.exists(font_path):
+                return pygame.font.Font(font_path, size)
+            return pygame.font.SysFont(family, size)
+        except Exception as e:
+            print(f"Error loading fonts: {e}")
+            return pygame.font.SysFont(family, size)
+            
+    def get(self, family, size):
+        """
+        Get a font by family and size, loading it on first use.
+        
+        Args:
+            family (str): Font family, e.g. "arial"
+            size (int): Font size
+            
+        Returns:
+            pygame.font.Font: The cached font
+        """
+        key = (family, size)
+        font = self.fonts.get(key)
+        if font is None:
+            with self.lock:
+                font = self.fonts.get(key)
+                if font is None:
+                    font = self.load(family, size)
+                    self.fonts[key] = font
+        return font
+        
+    def preload(self, specs):
+        """
+        Load several fonts ahead of use.
+        
+        Args:
+            specs (list): (family, size) pairs to load
+        """
+        for family, size in specs:
+            self.get(family, size)
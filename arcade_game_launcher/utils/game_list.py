@@ -0,0 +1,267 @@
+"""
+Virtualized, scrollable list of game buttons for the launcher menu.
+"""
+import pygame
+from arcade_game_launcher.config import BLACK, GRAY, DARK_GRAY, THUMBNAIL_SIZE, THUMBNAIL_MARGIN
+from arcade_game_launcher.utils.button import Button
+
+# Width of the scrollbar drawn right of the buttons
+SCROLLBAR_WIDTH = 6
+
+# Keys that scroll the list, mapped to a direction and whether they move a page
+SCROLL_KEYS = {
+    pygame.K_UP: (-1, False),
+    pygame.K_DOWN: (1, False),
+    pygame.K_PAGEUP: (-1, True),
+    pygame.K_PAGEDOWN: (1, True)
+}
+
+
+class GameList:
+    def __init__(self, x, y, button_width, button_height, row_height, visible_rows, font, thumbnails=None):
+        """
+        Initialize a virtualized list of games.
+        
+        Only one button per visible row is ever created. Scrolling rebinds
+        those buttons to other games, and hit tests map a position to a row
+        arithmetically, so the cost per frame does not depend on the number
+        of games.
+        
+        Args:
+            x (int): X-coordinate of the buttons' left edge
+            y (int): Y-coordinate of the first row
+            button_width (int): Width of a button
+            button_height (int): Height of a button
+            row_height (int): Distance between the tops of two rows
+            visible_rows (int): Number of rows shown at once
+            font: Font for the button text
+            thumbnails (ThumbnailCache or None): Source of game preview thumbnails
+        """
+        self.x = x
+        self.y = y
+        self.button_width = button_width
+        self.button_height = button_height
+        self.row_height = row_height
+        self.visible_rows = visible_rows
+        self.thumbnails = thumbnails
+        self.items = []
+        self.first = 0
+        self.hovered_row = None
+        self.needs_redraw = True
+        self.thumbnails_drawn = set()
+        
+        # Everything the list draws on: thumbnails, buttons and the scrollbar
+        left = x - (THUMBNAIL_SIZE[0] + THUMBNAIL_MARGIN if thumbnails else 0)
+        right = x + button_width + THUMBNAIL_MARGIN + SCROLLBAR_WIDTH
+        self.rect = pygame.Rect(left, y, right - left, visible_rows * row_height)
+        
+        self.buttons = []
+        for row in range(visible_rows):
+            button = Button(x, y + row * row_height, button_width, button_height, "")
+            button.font = font
+            self.buttons.append(button)
+            
+    def set_items(self, items, reset=False):
+        """
+        Show a new list of games, keeping the existing buttons.
+        
+        Args:
+            items (list): Manifest entries of the games, in display order
+            reset (bool): Scroll back to the first game
+        """
+        self.items = items
+        self.first = 0 if reset else min(self.first, self.max_first())
+        self.bind()
+        
+    def max_first(self):
+        """
+        Get the largest valid index of the first visible game.
+        
+        Returns:
+            int: Index of the first game when scrolled to the end
+        """
+        return max(len(self.items) - self.visible_rows, 0)
+        
+    def bind(self):
+        """Point each row's button at the game now shown in that row."""
+        for row, button in enumerate(self.buttons):
+            index = self.first + row
+            button.set_text(self.items[index]["display_name"] if index < len(self.items) else "")
+            button.set_hovered(False)
+        self.hovered_row = None
+        self.needs_redraw = True
+        
+    def scroll(self, rows):
+        """
+        Scroll the list.
+        
+        Args:
+            rows (int): Rows to scroll by, negative to scroll up
+        """
+        first = max(0, min(self.first + rows, self.max_first()))
+        if first != self.first:
+            self.first = first
+            self.bind()
+            
+    def row_at(self, pos):
+        """
+        Find the row whose button is at a position.
+        
+        Args:
+            pos (tuple): Screen position (x, y)
+            
+        Returns:
+            int or None: Row index, or None if no game button is there
+        """
+        x, y = pos
+        if not self.x <= x < self.x + self.button_width or y < self.y:
+            return None
+        row, offset = divmod(y - self.y, self.row_height)
+        if row >= self.visible_rows or offset >= self.button_height or self.first + row >= len(self.items):
+            return None
+        return row
+        
+    def item_at(self, pos):
+        """
+        Find the game whose button is at a position.
+        
+        Args:
+            pos (tuple): Screen position (x, y)
+            
+        Returns:
+            dict or None: Manifest entry of the game, or None
+        """
+        row = self.row_at(pos)
+        return None if row is None else self.items[self.first + row]
+        
+    def update(self, mouse_pos):
+        """
+        Update the hovered button.
+        
+        Only the buttons entering and leaving hover are touched.
+        
+        Args:
+            mouse_pos (tuple): Current mouse position (x, y)
+            
+        Returns:
+            dict or None: Manifest entry of a game that just became hovered
+        """
+        row = self.row_at(mouse_pos)
+        if row == self.hovered_row:
+            return None
+        if self.hovered_row is not None:
+            self.buttons[self.hovered_row].set_hovered(False)
+        self.hovered_row = row
+        if row is None:
+            return None
+        self.buttons[row].set_hovered(True)
+        return self.items[self.first + row]
+        
+    def handle_event(self, event):
+        """
+        Handle scrolling and clicks.
+        
+        Args:
+            event: Pygame event
+            
+        Returns:
+            dict or None: Manifest entry of a clicked game, or None
+        """
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll(-event.y)
+        elif event.type == pygame.KEYDOWN and event.key in SCROLL_KEYS:
+            direction, page = SCROLL_KEYS[event.key]
+            self.scroll(direction * (self.visible_rows if page else 1))
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            return self.item_at(event.pos)
+        return None
+        
+    def thumbnail_rect(self, row):
+        """
+        Get where a row's thumbnail goes, left of its button.
+        
+        Args:
+            row (int): Row index
+            
+        Returns:
+            pygame.Rect: Thumbnail area
+        """
+        rect = pygame.Rect((0, 0), THUMBNAIL_SIZE)
+        rect.midright = (self.x - THUMBNAIL_MARGIN, self.buttons[row].rect.centery)
+        return rect
+        
+    def draw_thumbnails(self, screen):
+        """
+        Draw visible thumbnails that became ready since they were last drawn.
+        
+        Args:
+            screen: Pygame surface to draw on
+            
+        Returns:
+            list: Rectangles of the screen that were drawn
+        """
+        rects = []
+        if not self.thumbnails:
+            return rects
+        for row in range(min(self.visible_rows, len(self.items) - self.first)):
+            if row in self.thumbnails_drawn:
+                continue
+            thumbnail = self.thumbnails.get(self.items[self.first + row])
+            if thumbnail:
+                rect = self.thumbnail_rect(row)
+                screen.blit(thumbnail, rect)
+                pygame.draw.rect(screen, GRAY, rect, 1)
+                self.thumbnails_drawn.add(row)
+                rects.append(rect)
+        return rects
+        
+    def draw_scrollbar(self, screen):
+        """
+        Draw the scrollbar when not every game fits.
+        
+        Args:
+            screen: Pygame surface to draw on
+        """
+        if len(self.items) <= self.visible_rows:
+            return
+        track = pygame.Rect(self.rect.right - SCROLLBAR_WIDTH, self.y, SCROLLBAR_WIDTH, self.rect.height)
+        pygame.draw.rect(screen, DARK_GRAY, track)
+        thumb_height = max(track.height * self.visible_rows // len(self.items), SCROLLBAR_WIDTH)
+        thumb_y = track.y + (track.height - thumb_height) * self.first // self.max_first()
+        pygame.draw.rect(screen, GRAY, (track.x, thumb_y, SCROLLBAR_WIDTH, thumb_height))
+        
+    def draw(self, screen):
+        """
+        Draw the visible part of the list.
+        
+        Args:
+            screen: Pygame surface to draw on
+        """
+        screen.fill(BLACK, self.rect)
+        for row in range(min(self.visible_rows, len(self.items) - self.first)):
+            self.buttons[row].draw(screen)
+        self.thumbnails_drawn.clear()
+        self.draw_thumbnails(screen)
+        self.draw_scrollbar(screen)
+        self.needs_redraw = False
+        
+    def draw_dirty(self, screen):
+        """
+        Draw only what changed since the last frame.
+        
+        Args:
+            screen: Pygame surface to draw on
+            
+        Returns:
+            list: Rectangles of the screen that were redrawn
+        """
+        if self.needs_redraw:
+            self.draw(screen)
+            return [self.rect]
+            
+        rects = self.draw_thumbnails(screen)
+        for button in self.buttons:
+            if button.dirty and button.text:
+                button.draw(screen)
+                rects.append(button.rect)
+        return rects
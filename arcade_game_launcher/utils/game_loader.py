@@ -2,28 +2,84 @@
 Game loader for dynamically loading and switching between games.
 """
 import os
+import time
+import inspect
+import queue
+import itertools
+import threading
 import importlib.util
 import pygame
-from arcade_game_launcher.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from arcade_game_launcher.config import SCREEN_WIDTH, SCREEN_HEIGHT, GAMES_DIR
+from arcade_game_launcher.utils.manifest import GameManifest, file_stamp
+from arcade_game_launcher.utils.screen_manager import FrameDriver
+from arcade_game_launcher.utils.fonts import FontRegistry
+
+# Preload priorities, lower values are loaded first
+PRELOAD_HOVER = 0
+PRELOAD_IDLE = 1
 
 class GameLoader:
-    def __init__(self, games_dir="games"):
+    def __init__(self, games_dir=GAMES_DIR, hot_reload=False, manifest_file=None, fonts=None, lazy=False):
         """
         Initialize the game loader.
         
         Args:
             games_dir (str): Directory containing game modules
+            hot_reload (bool): Re-execute a cached module when its file changes
+            manifest_file (str or None): Path of the discovery manifest
+            fonts (FontRegistry): Font registry handed to games
+            lazy (bool): Load games only when they are launched, ignoring preloads
         """
-        self.games_dir = games_dir
+        self.games_dir = os.path.abspath(games_dir)
+        self.hot_reload = hot_reload
+        self.lazy = lazy
+        self.fonts = fonts or FontRegistry()
+        self.manifest = GameManifest(self.games_dir, manifest_file)
         self.games = {}
         self.current_game = None
         
+        # Loaded modules keyed by main file path, stored with the
+        # (mtime, size) stamp of the file they were executed from
+        self.module_cache = {}
+        self.load_times = {}
+        self.first_frame_times = {}
+        self.launch_counts = {}
+        
+        # Background preloading. The worker thread only executes modules;
+        # their preload hooks build fonts, so they run on the main thread in
+        # finish_preloads, which also prints the worker's messages.
+        self.lock = threading.RLock()
+        self.preload_queue = queue.PriorityQueue()
+        self.preload_order = itertools.count()
+        self.preload_requested = set()
+        self.preload_thread = None
+        self.preload_messages = queue.Queue()
+        self.unprepared = set()
+        
+    def find_game(self, game_name):
+        """
+        Find the info for a game by display name or directory name.
+        
+        Args:
+            game_name (str): Display name or directory name of the game
+            
+        Returns:
+            dict or None: Game info, or None if the game is unknown
+        """
+        for display_name, info in self.games.items():
+            if display_name == game_name or info["name"] == game_name:
+                return info
+        return None
+        
     def discover_games(self):
         """
         Discover available games in the games directory.
         
+        Games are read from the persistent manifest, which is validated
+        with directory stamps and rebuilt only for games that changed.
+        
         Returns:
-            dict: Dictionary of game names and their paths
+            dict: Dictionary of game display names and their manifest entries
         """
         games = {}
         
@@ -33,69 +89,206 @@ class GameLoader:
             return games
             
         # Look for game modules (directories with main.py)
-        for item in os.listdir(self.games_dir):
-            game_dir = os.path.join(self.games_dir, item)
-            main_file = os.path.join(game_dir, "main.py")
+        for entry in self.manifest.refresh().values():
+            games[entry["display_name"]] = entry
             
-            if os.path.isdir(game_dir) and os.path.exists(main_file):
-                # Format the game name for display (replace underscores with spaces and capitalize)
-                display_name = " ".join(word.capitalize() for word in item.split("_"))
-                games[display_name] = {
-                    "name": item,
-                    "path": game_dir,
-                    "main_file": main_file
-                }
-                
         self.games = games
         return games
         
-    def load_game(self, game_name):
+    def load_game(self, game_name, background=False):
         """
         Load a game module by name.
         
+        Modules are executed once and served from the cache afterwards.
+        With hot reload enabled, a cached module is re-executed only when
+        its main file's stamp has changed.
+        
         Args:
             game_name (str): Name of the game to load
+            background (bool): Loading on the preload worker; the module's
+                preload hook is left to finish_preloads and messages are
+                queued for it instead of printed
             
         Returns:
             module or None: Loaded game module or None if loading failed
         """
+        report = self.preload_messages.put if background else print
         try:
+            start = time.perf_counter()
+            
             # Find the game info
-            game_info = None
-            for display_name, info in self.games.items():
-                if display_name == game_name or info["name"] == game_name:
-                    game_info = info
-                    break
-                    
+            game_info = self.find_game(game_name)
             if not game_info:
-                print(f"Game '{game_name}' not found.")
+                report(f"Game '{game_name}' not found.")
                 return None
                 
-            # Load the module
-            module_name = f"arcade_game_launcher.games.{game_info['name']}.main"
-            spec = importlib.util.spec_from_file_location(module_name, game_info["main_file"])
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            # Serve the cached module unless hot reload spots a change. The
+            # lock makes a launch wait for a preload of the same game instead
+            # of executing the module twice.
+            main_file = game_info["main_file"]
+            with self.lock:
+                cached = self.module_cache.get(main_file)
+                if cached and not self.hot_reload:
+                    module = cached[1]
+                else:
+                    stamp = file_stamp(main_file)
+                    if cached and cached[0] == stamp:
+                        module = cached[1]
+                    else:
+                        # Load the module
+                        module_name = f"arcade_game_launcher.games.{game_info['name']}.main"
+                        spec = importlib.util.spec_from_file_location(module_name, main_file)
+                        module = importlib.util.module_from_spec(spec)
+                        spec.loader.exec_module(module)
+                        self.module_cache[main_file] = (stamp, module)
+                        self.unprepared.add(main_file)
+                        
+                        # Hover requests made for the replaced module must warm the new one
+                        if cached:
+                            self.forget_preloads(game_info["name"])
+                            
+            # Let the game build its resources ahead of launch
+            if not background:
+                self.prepare(main_file)
+                
+            # Record launch latency
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.load_times[game_info["name"]] = elapsed_ms
+            status = "cached" if cached and cached[1] is module else "loaded"
+            report(f"Game '{game_name}' {status} in {elapsed_ms:.2f} ms")
             
             return module
             
         except Exception as e:
-            print(f"Error loading game '{game_name}': {e}")
+            report(f"Error loading game '{game_name}': {e}")
             return None
             
-    def run_game(self, game_name, screen):
+    def prepare(self, main_file):
+        """
+        Run a loaded module's preload hook, once per execution of the module.
+        
+        Hooks build fonts and other Pygame resources, so this must be
+        called from the main thread.
+        
+        Args:
+            main_file (str): Main file of the module
+        """
+        with self.lock:
+            if main_file not in self.unprepared:
+                return
+            self.unprepared.discard(main_file)
+            module = self.module_cache[main_file][1]
+        if hasattr(module, "preload"):
+            try:
+                module.preload(self.fonts)
+            except Exception as e:
+                print(f"Error preloading resources of '{main_file}': {e}")
+                
+    def finish_preloads(self):
+        """
+        Finish games loaded in the background, from the main thread.
+        
+        Call between frames: prints the preload worker's messages and runs
+        the preload hooks of the modules it executed.
+        """
+        # The main thread is the only consumer, so empty() is reliable here
+        while not self.preload_messages.empty():
+            print(self.preload_messages.get_nowait())
+        if self.unprepared:
+            with self.lock:
+                pending = list(self.unprepared)
+            for main_file in pending:
+                self.prepare(main_file)
+                
+    def forget_preloads(self, game_name):
+        """
+        Allow a game to be preloaded again, e.g. after its module was reloaded.
+        
+        Args:
+            game_name (str): Name of the game
+        """
+        self.preload_requested = {key for key in self.preload_requested if key[0] != game_name}
+        
+        
+    def start_preloader(self):
+        """Start the background worker that warms game modules."""
+        if self.preload_thread is None:
+            self.preload_thread = threading.Thread(target=self.preload_worker, daemon=True)
+            self.preload_thread.start()
+            
+    def preload(self, game_name, priority=PRELOAD_IDLE):
+        """
+        Queue a game to be loaded in the background.
+        
+        Args:
+            game_name (str): Name of the game to preload
+            priority (int): PRELOAD_HOVER for a likely next launch, PRELOAD_IDLE otherwise
+        """
+        key = (game_name, priority)
+        if self.lazy:
+            return
+        if key in self.preload_requested and self.hot_reload:
+            # A module edited since it was loaded is warmed again
+            game_info = self.find_game(game_name)
+            cached = game_info and self.module_cache.get(game_info["main_file"])
+            if cached and cached[0] != file_stamp(game_info["main_file"]):
+                self.forget_preloads(game_name)
+        if key in self.preload_requested:
+            return
+        self.preload_requested.add(key)
+        self.start_preloader()
+        self.preload_queue.put((priority, next(self.preload_order), game_name))
+        
+    def preload_all(self):
+        """Queue every discovered game, most launched first."""
+        names = sorted(
+            (info["name"] for info in self.games.values()),
+            key=lambda name: -self.launch_counts.get(name, 0)
+        )
+        for name in names:
+            self.preload(name)
+            
+    def preload_worker(self):
+        """Load queued games until the process exits."""
+        while True:
+            _, _, game_name = self.preload_queue.get()
+            self.load_game(game_name, background=True)
+            
+    def supported_options(self, func, options):
+        """
+        Drop options a game's run_game does not accept.
+        
+        Games written against the plain run_game(screen, width, height)
+        contract keep working when the launcher passes extra options.
+        
+        Args:
+            func: The game's run_game function
+            options (dict): Keyword arguments to pass
+            
+        Returns:
+            dict: The options the function accepts
+        """
+        parameters = inspect.signature(func).parameters
+        if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+            return options
+        return {key: value for key, value in options.items() if key in parameters}
+        
+    def run_game(self, game_name, screen, **options):
         """
         Run a game by name.
         
         Args:
             game_name (str): Name of the game to run
             screen: Pygame surface to draw on
+            **options: Extra keyword arguments for the game's run_game,
+                such as headless, max_frames, render, fonts, profiler and input_script
             
         Returns:
             bool: True if the game ran successfully, False otherwise
         """
         try:
             # Load the game module
+            FrameDriver.mark_launch()
             module = self.load_game(game_name)
             if not module:
                 return False
@@ -103,7 +296,15 @@ class GameLoader:
             # Run the game
             self.current_game = module
             if hasattr(module, "run_game"):
-                module.run_game(screen, SCREEN_WIDTH, SCREEN_HEIGHT)
+                name = self.find_game(game_name)["name"]
+                self.launch_counts[name] = self.launch_counts.get(name, 0) + 1
+                options.setdefault("fonts", self.fonts)
+                if options.get("profiler"):
+                    options["profiler"].set_label(name)
+                options = self.supported_options(module.run_game, options)
+                module.run_game(screen, SCREEN_WIDTH, SCREEN_HEIGHT, **options)
+                if FrameDriver.first_frame_ms is not None:
+                    self.first_frame_times[name] = FrameDriver.first_frame_ms
                 return True
             else:
                 print(f"Game '{game_name}' does not have a run_game function.")
@@ -0,0 +1,90 @@
+"""
+Queues of timestamped player intents, applied one simulation step at a time.
+"""
+from collections import deque
+
+
+class InputQueue:
+    def __init__(self, driver, capacity=1, lifetime=None):
+        """
+        Initialize a queue of player intents.
+        
+        Games turn input events into intents, e.g. a turn or a jump, as the
+        events are read and apply them from update(), one per simulation
+        step. Presses between two steps are queued instead of overwriting
+        each other, and a press is acted on once however long it is held.
+        Each intent carries the time its event was read, so the driver can
+        measure how long it takes to reach the display.
+        
+        Args:
+            driver (FrameDriver): Driver the events are read through
+            capacity (int): Intents kept at once; further ones are dropped
+            lifetime (int or None): Game milliseconds an intent is kept
+                before it is dropped unused, or None to keep it until applied
+        """
+        self.driver = driver
+        self.capacity = capacity
+        self.lifetime = lifetime
+        self.intents = deque()
+        
+    def __len__(self):
+        """int: Number of queued intents."""
+        return len(self.intents)
+        
+    def push(self, action):
+        """
+        Queue an intent read from this frame's events.
+        
+        Args:
+            action: What the player asked for, e.g. a direction
+            
+        Returns:
+            bool: True if queued, False if the queue was full
+        """
+        if len(self.intents) >= self.capacity:
+            return False
+        expires = None
+        if self.lifetime is not None:
+            expires = self.driver.get_ticks() + self.lifetime
+        self.intents.append((action, self.driver.event_time, expires))
+        return True
+        
+    def last(self, default=None):
+        """
+        Get the most recently queued intent without applying it.
+        
+        Args:
+            default: Value returned when the queue is empty
+            
+        Returns:
+            The last queued action, or default
+        """
+        if not self.intents:
+            return default
+        return self.intents[-1][0]
+        
+    def pop(self):
+        """
+        Take the oldest intent to apply it in the current step.
+        
+        Intents that outlived their lifetime are dropped first. The driver
+        is told the intent was applied, so its latency is measured when the
+        next frame is presented.
+        
+        Returns:
+            The action, or None if nothing is queued
+        """
+        intents = self.intents
+        if self.lifetime is not None:
+            now = self.driver.get_ticks()
+            while intents and intents[0][2] < now:
+                intents.popleft()
+        if not intents:
+            return None
+        action, stamp, _ = intents.popleft()
+        self.driver.input_applied(stamp)
+        return action
+        
+    def clear(self):
+        """Drop every queued intent, e.g. on restart."""
+        self.intents.clear()
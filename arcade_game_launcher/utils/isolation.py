@@ -0,0 +1,444 @@
+"""
+Process-isolated game sessions. Each game runs in its own child process,
+renders into a shared-memory framebuffer that the launcher blits, and
+receives input events over a pipe.
+"""
+import time
+import struct
+import multiprocessing
+from multiprocessing import shared_memory
+import pygame
+from arcade_game_launcher.config import (
+    FPS, SESSION_FRAME_BUDGET_MS, SESSION_MAX_OVERRUNS, SESSION_HANG_TIMEOUT, SESSION_MEMORY_LIMIT_MB
+)
+from arcade_game_launcher.utils.screen_manager import init_display
+from arcade_game_launcher.utils.replay import InputRecorder
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Event types forwarded from the launcher to a session
+FORWARDED_EVENTS = (
+    pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION
+)
+
+
+class SharedFramebuffer:
+    # Header: number of the last published frame, frames over budget
+    HEADER = struct.Struct("QQ")
+    
+    def __init__(self, width, height, name=None):
+        """
+        Create or attach to a double-buffered shared-memory framebuffer.
+        
+        The writer draws frame n into slot n % 2 and only then publishes n,
+        so the reader always blits a finished frame.
+        
+        Args:
+            width (int): Frame width in pixels
+            height (int): Frame height in pixels
+            name (str or None): Name of an existing buffer to attach to,
+                or None to create a new one
+        """
+        self.width = width
+        self.height = height
+        self.frame_bytes = width * height * 4
+        size = self.HEADER.size + 2 * self.frame_bytes
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.HEADER.pack_into(self.shm.buf, 0, 0, 0)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.slots = [
+            pygame.image.frombuffer(self.shm.buf[start:start + self.frame_bytes], (width, height), "BGRA")
+            for start in (self.HEADER.size, self.HEADER.size + self.frame_bytes)
+        ]
+        self.frame = 0
+        self.overruns = 0
+        
+    def publish(self, surface):
+        """
+        Copy a finished frame into the buffer and publish it.
+        
+        Args:
+            surface: Pygame surface holding the frame
+        """
+        frame = self.frame + 1
+        self.slots[frame % 2].blit(surface, (0, 0))
+        self.HEADER.pack_into(self.shm.buf, 0, frame, self.overruns)
+        self.frame = frame
+        
+    def read_header(self):
+        """
+        Read the latest published frame number and overrun count.
+        
+        Returns:
+            tuple: (frame, overruns)
+        """
+        return self.HEADER.unpack_from(self.shm.buf, 0)
+        
+    def latest(self):
+        """
+        Get the most recently published frame.
+        
+        Returns:
+            pygame.Surface or None: The frame, or None before the first one
+        """
+        frame, _ = self.read_header()
+        if frame == 0:
+            return None
+        return self.slots[frame % 2]
+        
+    def close(self, unlink=False):
+        """
+        Detach from the buffer.
+        
+        Args:
+            unlink (bool): Also free the shared memory (owner only)
+        """
+        # Surfaces export the buffer, so drop them before closing it
+        self.slots = []
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+class SessionBridge:
+    def __init__(self, conn, framebuffer, screen, frame_budget_ms, max_overruns=SESSION_MAX_OVERRUNS):
+        """
+        Connect a game running in a child process to its launcher.
+        
+        The bridge is installed as the game's input_script, so it runs once
+        per frame: it publishes the frame drawn last time and posts input
+        events received from the launcher. It also enforces the frame
+        budget: a game that overruns it on too many frames in a row is sent
+        a QUIT event, while a single slow frame is only counted.
+        
+        Args:
+            conn: Child end of the session pipe
+            framebuffer (SharedFramebuffer): Framebuffer to publish into
+            screen: Surface the game draws on
+            frame_budget_ms (float): Frames slower than this count as overruns
+            max_overruns (int or None): Overruns in a row before the game is
+                ended, or None to only count them
+        """
+        self.conn = conn
+        self.framebuffer = framebuffer
+        self.screen = screen
+        self.frame_budget = frame_budget_ms / 1000
+        self.max_overruns = max_overruns
+        self.consecutive_overruns = 0
+        self.over_budget = False
+        self.last_frame = None
+        
+    def __call__(self, frame):
+        """
+        Publish the previous frame and forward pending input.
+        
+        Args:
+            frame (int): Frame number about to run
+        """
+        now = time.perf_counter()
+        if self.last_frame is not None and now - self.last_frame > self.frame_budget:
+            self.framebuffer.overruns += 1
+            self.consecutive_overruns += 1
+        else:
+            self.consecutive_overruns = 0
+        self.last_frame = now
+        
+        if (self.max_overruns and self.consecutive_overruns >= self.max_overruns
+                and not self.over_budget):
+            self.over_budget = True
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        
+        if frame > 0:
+            self.framebuffer.publish(self.screen)
+            
+        while self.conn.poll():
+            message = self.conn.recv()
+            if message[0] == "event":
+                pygame.event.post(pygame.event.Event(message[1], message[2]))
+
+
+def limit_memory(memory_limit_mb):
+    """
+    Cap the address space of the current process.
+    
+    Args:
+        memory_limit_mb (int or None): Limit in megabytes, or None for no limit
+    """
+    if resource is None or not memory_limit_mb:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def run_session(loader, game_name, shm_name, conn, width, height, options):
+    """
+    Run a game inside a session process until it exits.
+    
+    The display must already be initialized with the headless video driver.
+    
+    Args:
+        loader: Game loader that has discovered the games
+        game_name (str): Game to run
+        shm_name (str): Name of the shared framebuffer
+        conn: Child end of the session pipe
+        width (int): Screen width
+        height (int): Screen height
+        options (dict): headless, max_frames, frame_budget_ms, max_overruns,
+            memory_limit_mb and record, a replay file to record the session to
+    """
+    limit_memory(options.get("memory_limit_mb"))
+    
+    # A dummy-driver display keeps frame pacing and flips working without a window
+    headless = options.get("headless", False)
+    if headless:
+        screen = pygame.Surface((width, height))
+    else:
+        screen = pygame.display.set_mode((width, height))
+        
+    framebuffer = SharedFramebuffer(width, height, shm_name)
+    bridge = SessionBridge(conn, framebuffer, screen, options.get("frame_budget_ms", SESSION_FRAME_BUDGET_MS),
+                           options.get("max_overruns", SESSION_MAX_OVERRUNS))
+    record = options.get("record")
+    ok = loader.run_game(
+        game_name,
+        screen,
+        headless=headless,
+        max_frames=options.get("max_frames"),
+        input_script=bridge,
+        input_source=InputRecorder(record) if record else None
+    )
+    framebuffer.publish(screen)
+    if bridge.over_budget:
+        print(f"Session '{game_name}' went over its frame budget on "
+              f"{bridge.consecutive_overruns} frames in a row, ending it.")
+        ok = False
+    conn.send(("exit", ok))
+    framebuffer.close()
+
+
+def session_main(game_name, shm_name, conn, width, height, options):
+    """
+    Entry point of a session's spawned child process.
+    
+    Args:
+        game_name (str): Game to run
+        shm_name (str): Name of the shared framebuffer
+        conn: Child end of the session pipe
+        width (int): Screen width
+        height (int): Screen height
+        options (dict): Session options, see run_session
+    """
+    from arcade_game_launcher.utils.game_loader import GameLoader
+    
+    init_display(True)
+    loader = GameLoader()
+    loader.discover_games()
+    run_session(loader, game_name, shm_name, conn, width, height, options)
+    pygame.quit()
+
+
+class IsolatedSession:
+    def __init__(self, game_name, width, height, headless=False, max_frames=None,
+                 frame_budget_ms=SESSION_FRAME_BUDGET_MS, memory_limit_mb=SESSION_MEMORY_LIMIT_MB,
+                 hang_timeout=SESSION_HANG_TIMEOUT, pool=None, record=None,
+                 max_overruns=SESSION_MAX_OVERRUNS):
+        """
+        Initialize a game session that runs in a child process.
+        
+        Args:
+            game_name (str): Game to run
+            width (int): Screen width
+            height (int): Screen height
+            headless (bool): Run the game without a frame cap
+            max_frames (int or None): Stop the game after this many frames
+            frame_budget_ms (float): Frames slower than this count as overruns
+            memory_limit_mb (int or None): Address space limit of the child
+            hang_timeout (float): Seconds without a new frame before the child is killed
+            pool (WarmPool or None): Fork the session from this warm pool
+                instead of spawning a fresh interpreter
+            record (str or None): Record the session's input to this replay file
+            max_overruns (int or None): Frame budget overruns in a row before
+                the game is ended, or None to only count them
+        """
+        self.game_name = game_name
+        self.width = width
+        self.height = height
+        self.hang_timeout = hang_timeout
+        self.pool = pool
+        self.options = {
+            "headless": headless,
+            "max_frames": max_frames,
+            "frame_budget_ms": frame_budget_ms,
+            "max_overruns": max_overruns,
+            "memory_limit_mb": memory_limit_mb,
+            "record": record
+        }
+        self.framebuffer = None
+        self.process = None
+        self.conn = None
+        self.result = None
+        self.last_frame = 0
+        self.last_progress = 0.0
+        self.started = 0.0
+        self.first_frame_ms = None
+        
+    def start(self):
+        """Create the framebuffer and start the child process."""
+        self.started = time.perf_counter()
+        self.framebuffer = SharedFramebuffer(self.width, self.height)
+        if self.pool:
+            launched = self.pool.launch(
+                self.game_name, self.framebuffer.name, self.width, self.height, self.options
+            )
+            if launched:
+                self.conn, self.process = launched
+                self.last_progress = time.monotonic()
+                return
+            print("Warm pool unavailable, spawning the session instead.")
+            
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=session_main,
+            args=(self.game_name, self.framebuffer.name, child_conn, self.width, self.height, self.options),
+            name=f"session-{self.game_name}",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.last_progress = time.monotonic()
+        
+    def forward_event(self, event):
+        """
+        Send an input event to the game.
+        
+        Args:
+            event: Pygame event
+        """
+        if event.type not in FORWARDED_EVENTS:
+            return
+        attributes = {key: value for key, value in event.dict.items()
+                      if isinstance(value, (int, float, str, tuple, bool))}
+        try:
+            self.conn.send(("event", event.type, attributes))
+        except (BrokenPipeError, OSError):
+            pass
+            
+    def poll(self):
+        """
+        Check on the child process and enforce the hang timeout.
+        
+        Returns:
+            bool: True while the session is running, False once it ended
+        """
+        while self.conn.poll():
+            try:
+                message = self.conn.recv()
+            except EOFError:
+                break
+            if message[0] == "exit":
+                self.result = message[1]
+                
+        frame, _ = self.framebuffer.read_header()
+        now = time.monotonic()
+        if frame != self.last_frame:
+            if self.last_frame == 0:
+                self.first_frame_ms = (time.perf_counter() - self.started) * 1000
+                print(f"Session '{self.game_name}' first frame after {self.first_frame_ms:.2f} ms")
+            self.last_frame = frame
+            self.last_progress = now
+        elif self.process.is_alive() and now - self.last_progress > self.hang_timeout:
+            # SDL turns SIGTERM into a QUIT event, which a hung game never reads
+            print(f"Session '{self.game_name}' hung for {self.hang_timeout:.1f} s, killing it.")
+            self.process.kill()
+            self.process.join(1.0)
+            self.result = False
+            
+        return self.process.is_alive()
+        
+    def blit(self, screen):
+        """
+        Draw the latest frame of the session.
+        
+        Args:
+            screen: Pygame surface to draw on
+        """
+        frame = self.framebuffer.latest()
+        if frame is not None:
+            screen.blit(frame, (0, 0))
+            
+    def stop(self):
+        """Stop the child process and free the framebuffer."""
+        if self.process.is_alive():
+            self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        if self.process.exitcode not in (0, None) and self.result is None:
+            print(f"Session '{self.game_name}' exited with code {self.process.exitcode}.")
+            self.result = False
+            
+        _, overruns = self.framebuffer.read_header()
+        if overruns:
+            print(f"Session '{self.game_name}' went over its frame budget {overruns} times.")
+        self.framebuffer.close(unlink=True)
+        self.conn.close()
+        
+    def run(self, screen_manager):
+        """
+        Run the session interactively, showing its frames in the launcher.
+        
+        Args:
+            screen_manager: Screen manager owning the display
+            
+        Returns:
+            bool: True if the game ran successfully, False otherwise
+        """
+        self.start()
+        while self.poll():
+            for event in pygame.event.get():
+                self.forward_event(event)
+            self.blit(screen_manager.screen)
+            screen_manager.update()
+            if screen_manager.headless:
+                # Headless frames are uncapped, so pace the polling instead
+                time.sleep(1 / FPS)
+        self.stop()
+        return bool(self.result)
+
+
+def run_parallel(game_names, width, height, max_frames=None, **options):
+    """
+    Run several games headless at once, each in its own process.
+    
+    Args:
+        game_names (list): Games to run
+        width (int): Screen width
+        height (int): Screen height
+        max_frames (int or None): Frames to run each game for
+        **options: Extra IsolatedSession options
+        
+    Returns:
+        dict: Game name mapped to True if it ran successfully
+    """
+    sessions = [IsolatedSession(name, width, height, True, max_frames, **options) for name in game_names]
+    for session in sessions:
+        session.start()
+        
+    running = list(sessions)
+    while running:
+        running = [session for session in running if session.poll()]
+        time.sleep(1 / FPS)
+        
+    results = {}
+    for session in sessions:
+        session.stop()
+        results[session.game_name] = bool(session.result)
+    return results
@@ -0,0 +1,223 @@
+"""
+Persistent manifest of discovered games, so the games directory does not
+have to be rescanned and every game rehashed on each start.
+"""
+import os
+import ast
+import json
+import hashlib
+from arcade_game_launcher.config import CACHE_DIR
+
+MANIFEST_VERSION = 1
+ENTRY_POINT = "main.py"
+METADATA_FILE = "game.json"
+
+
+def format_display_name(name):
+    """
+    Format a game directory name for display.
+    
+    Args:
+        name (str): Game directory name, e.g. "flappy_bird"
+        
+    Returns:
+        str: Display name, e.g. "Flappy Bird"
+    """
+    return " ".join(word.capitalize() for word in name.split("_"))
+
+
+def hash_file(path):
+    """
+    Hash a file's contents.
+    
+    Args:
+        path (str): File path
+        
+    Returns:
+        str: Hex SHA-1 digest of the file
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def file_stamp(path):
+    """
+    Get a cheap change stamp for a file or directory.
+    
+    Args:
+        path (str): File or directory path
+        
+    Returns:
+        list: [mtime_ns, size] of the path
+    """
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class GameManifest:
+    def __init__(self, games_dir, manifest_file=None):
+        """
+        Initialize the manifest for a games directory.
+        
+        Args:
+            games_dir (str): Directory containing game modules
+            manifest_file (str or None): Where to store the manifest, defaults
+                to a file in the cache directory named after the games directory
+        """
+        self.games_dir = games_dir
+        if manifest_file is None:
+            # Kept outside the games directory so saving it does not bump
+            # the directory stamp used for validation
+            dir_hash = hashlib.sha1(games_dir.encode("utf-8")).hexdigest()[:12]
+            manifest_file = os.path.join(CACHE_DIR, f"manifest-{dir_hash}.json")
+        self.manifest_file = manifest_file
+        self.dir_stamp = None
+        self.entries = {}
+        self.rebuilt = []
+        
+    def load(self):
+        """
+        Load the manifest from disk, ignoring missing or stale files.
+        
+        Returns:
+            bool: True if a manifest was loaded, False otherwise
+        """
+        try:
+            with open(self.manifest_file, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+            
+        if data.get("version") != MANIFEST_VERSION or data.get("games_dir") != self.games_dir:
+            return False
+            
+        self.dir_stamp = data.get("dir_stamp")
+        self.entries = data.get("games", {})
+        return True
+        
+    def save(self):
+        """Write the manifest to disk atomically."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "games_dir": self.games_dir,
+            "dir_stamp": self.dir_stamp,
+            "games": self.entries
+        }
+        tmp_file = f"{self.manifest_file}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.manifest_file), exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_file, self.manifest_file)
+        except OSError as e:
+            print(f"Error saving game manifest: {e}")
+            
+    def build_entry(self, name):
+        """
+        Build the manifest entry for one game directory.
+        
+        Args:
+            name (str): Game directory name
+            
+        Returns:
+            dict or None: Manifest entry, or None if the directory is not a game
+        """
+        game_dir = os.path.join(self.games_dir, name)
+        main_file = os.path.join(game_dir, ENTRY_POINT)
+        if not os.path.isdir(game_dir) or not os.path.exists(main_file):
+            return None
+            
+        return {
+            "name": name,
+            "display_name": format_display_name(name),
+            "path": game_dir,
+            "main_file": main_file,
+            "entry_point": ENTRY_POINT,
+            "stamp": file_stamp(main_file),
+            "dir_stamp": file_stamp(game_dir),
+            "hash": hash_file(main_file),
+            "metadata": self.read_metadata(game_dir)
+        }
+        
+    def read_metadata(self, game_dir):
+        """
+        Read a game's metadata from its game.json, or its package docstring.
+        
+        Args:
+            game_dir (str): Game directory
+            
+        Returns:
+            dict: Metadata for the game
+        """
+        metadata_file = os.path.join(game_dir, METADATA_FILE)
+        if os.path.exists(metadata_file):
+            try:
+                with open(metadata_file, "r") as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error reading metadata '{metadata_file}': {e}")
+                
+        init_file = os.path.join(game_dir, "__init__.py")
+        if os.path.exists(init_file):
+            try:
+                with open(init_file, "r") as f:
+                    docstring = ast.get_docstring(ast.parse(f.read()))
+                if docstring:
+                    return {"description": docstring.strip()}
+            except (OSError, SyntaxError):
+                pass
+        return {}
+        
+    def is_current(self, entry):
+        """
+        Check whether a manifest entry still matches the files on disk.
+        
+        Args:
+            entry (dict): Manifest entry
+            
+        Returns:
+            bool: True if the entry is still valid, False otherwise
+        """
+        try:
+            return (file_stamp(entry["path"]) == entry["dir_stamp"]
+                    and file_stamp(entry["main_file"]) == entry["stamp"])
+        except (OSError, KeyError):
+            return False
+            
+    def refresh(self):
+        """
+        Bring the manifest up to date, rebuilding only changed games.
+        
+        The directory listing is only re-read when the games directory's own
+        stamp changed; each known game is then validated with two stats and
+        rehashed only if its files changed.
+        
+        Returns:
+            dict: Manifest entries keyed by game directory name
+        """
+        self.rebuilt = []
+        if not self.entries:
+            self.load()
+            
+        dir_stamp = file_stamp(self.games_dir)
+        if dir_stamp != self.dir_stamp:
+            names = sorted(os.listdir(self.games_dir))
+        else:
+            names = sorted(self.entries)
+            
+        entries = {}
+        for name in names:
+            entry = self.entries.get(name)
+            if entry is None or not self.is_current(entry):
+                entry = self.build_entry(name)
+                if entry is None:
+                    continue
+                self.rebuilt.append(name)
+            entries[name] = entry
+            
+        changed = bool(self.rebuilt) or dir_stamp != self.dir_stamp or entries.keys() != self.entries.keys()
+        self.entries = entries
+        self.dir_stamp = dir_stamp
+        if changed:
+            self.save()
+        return self.entries
@@ -0,0 +1,235 @@
+"""
+Per-phase frame timing with rolling percentiles, an on-screen overlay and
+Chrome trace-event export.
+"""
+import os
+import json
+import time
+from collections import deque
+import pygame
+from arcade_game_launcher.config import WHITE, BLACK, PROFILE_WINDOW, PROFILE_MAX_TRACE_EVENTS
+
+# Phases recorded for every frame, in loop order
+PHASES = ("events", "update", "draw", "flip", "tick")
+
+# Hotkey toggling the statistics overlay
+OVERLAY_KEY = pygame.K_F3
+
+
+def percentile(sorted_values, fraction):
+    """
+    Pick a percentile from sorted values using the nearest-rank method.
+    
+    Args:
+        sorted_values (list): Values in ascending order
+        fraction (float): Percentile as a fraction, e.g. 0.95
+        
+    Returns:
+        float: The percentile, or 0.0 when there are no values
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    def __init__(self, window=PROFILE_WINDOW, trace=False, max_trace_events=PROFILE_MAX_TRACE_EVENTS):
+        """
+        Initialize the frame profiler.
+        
+        Frame loops call begin_frame(), then lap() after each phase and
+        end_frame() at the end. Loops skip all of this when they have no
+        profiler, so disabled profiling costs nothing.
+        
+        Args:
+            window (int): Number of recent frames kept for percentiles
+            trace (bool): Whether to record Chrome trace events
+            max_trace_events (int): Cap on recorded trace events
+        """
+        self.window = window
+        self.samples = {name: deque(maxlen=window) for name in PHASES + ("frame",)}
+        self.extra_samples = {}
+        self.trace = trace
+        self.max_trace_events = max_trace_events
+        self.trace_events = []
+        self.origin = time.perf_counter()
+        self.frame_start = 0.0
+        self.last = 0.0
+        self.frames = 0
+        self.label = "frame"
+        
+        # Overlay state
+        self.overlay_visible = False
+        self.overlay_key_down = False
+        self.overlay_font = None
+        self.overlay_surface = None
+        self.overlay_rect = None
+        
+    def set_label(self, label):
+        """
+        Name the loop being profiled, used for trace threads.
+        
+        Args:
+            label (str): Loop name, e.g. the game name
+        """
+        self.label = label
+        
+    def begin_frame(self):
+        """Start timing a frame."""
+        self.frame_start = self.last = time.perf_counter()
+        
+    def lap(self, name):
+        """
+        Record the time since the previous lap as one phase.
+        
+        Args:
+            name (str): Phase name
+        """
+        now = time.perf_counter()
+        self.samples[name].append((now - self.last) * 1000)
+        if self.trace:
+            self.add_trace_event(name, self.last, now)
+        self.last = now
+        
+    def end_frame(self):
+        """Finish timing a frame."""
+        now = time.perf_counter()
+        self.samples["frame"].append((now - self.frame_start) * 1000)
+        if self.trace:
+            self.add_trace_event("frame", self.frame_start, now)
+        self.frames += 1
+        
+    def record(self, name, milliseconds):
+        """
+        Record a sample for a metric that is not a frame phase.
+        
+        Args:
+            name (str): Metric name
+            milliseconds (float): Sample value
+        """
+        samples = self.extra_samples.get(name)
+        if samples is None:
+            samples = self.extra_samples[name] = deque(maxlen=self.window)
+        samples.append(milliseconds)
+        
+    def add_trace_event(self, name, start, end):
+        """
+        Record a complete ("X") trace event.
+        
+        Args:
+            name (str): Event name
+            start (float): Start time from time.perf_counter()
+            end (float): End time from time.perf_counter()
+        """
+        if len(self.trace_events) < self.max_trace_events:
+            self.trace_events.append({
+                "name": name,
+                "cat": self.label,
+                "ph": "X",
+                "ts": (start - self.origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": self.label
+            })
+            
+    def stats(self):
+        """
+        Get rolling statistics for every phase.
+        
+        Returns:
+            dict: Metric name mapped to mean, p50, p95, p99 and max in milliseconds
+        """
+        stats = {}
+        metrics = dict(self.samples)
+        metrics.update(self.extra_samples)
+        for name, samples in metrics.items():
+            values = sorted(samples)
+            stats[name] = {
+                "mean": sum(values) / len(values) if values else 0.0,
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99),
+                "max": values[-1] if values else 0.0
+            }
+        return stats
+        
+    def summary(self):
+        """
+        Format the rolling statistics as text lines.
+        
+        Returns:
+            list: One line per metric
+        """
+        lines = []
+        for name, stat in self.stats().items():
+            lines.append(f"{name:>8}: p50 {stat['p50']:6.2f}  p95 {stat['p95']:6.2f}  "
+                         f"p99 {stat['p99']:6.2f} ms")
+        return lines
+        
+    def export_chrome_trace(self, path):
+        """
+        Write recorded trace events as Chrome trace-event JSON.
+        
+        The file can be opened in chrome://tracing or Perfetto.
+        
+        Args:
+            path (str): Output file path
+        """
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.trace_events, "displayTimeUnit": "ms"}, f)
+        print(f"Wrote {len(self.trace_events)} trace events to {path}")
+        
+    def poll_overlay_key(self):
+        """Toggle the overlay on the edge of the hotkey being pressed."""
+        key_down = pygame.key.get_pressed()[OVERLAY_KEY]
+        if key_down and not self.overlay_key_down:
+            self.overlay_visible = not self.overlay_visible
+        self.overlay_key_down = key_down
+        
+    def draw_overlay(self, screen, repaint=None):
+        """
+        Draw the statistics overlay in the top-right corner when visible.
+        
+        The overlay text is re-rendered only every 30 frames. When it gets
+        smaller, the part of the previous overlay it no longer covers must be
+        repainted, as retained screens only redraw what changed.
+        
+        Args:
+            screen: Pygame surface to draw on
+            repaint (callable or None): Called with the previous overlay's
+                rectangle to redraw what is under it when it shrank
+            
+        Returns:
+            pygame.Rect or None: Area changed, covering both the previous and
+                the new overlay, or None when hidden
+        """
+        if not self.overlay_visible:
+            self.overlay_rect = None
+            return None
+            
+        if self.overlay_surface is None or self.frames % 30 == 0:
+            if self.overlay_font is None:
+                if not pygame.font.get_init():
+                    pygame.font.init()
+                self.overlay_font = pygame.font.Font(None, 18)
+            lines = [self.overlay_font.render(line, True, WHITE) for line in self.summary()]
+            width = max(line.get_width() for line in lines) + 10
+            height = sum(line.get_height() for line in lines) + 10
+            self.overlay_surface = pygame.Surface((width, height))
+            self.overlay_surface.fill(BLACK)
+            y = 5
+            for line in lines:
+                self.overlay_surface.blit(line, (5, y))
+                y += line.get_height()
+                
+        rect = self.overlay_surface.get_rect(topright=(screen.get_width() - 10, 10))
+        area = rect
+        previous = self.overlay_rect
+        if previous is not None and not rect.contains(previous):
+            if repaint:
+                repaint(previous)
+            area = rect.union(previous)
+        self.overlay_rect = rect
+        screen.blit(self.overlay_surface, rect)
+        return area
@@ -0,0 +1,647 @@
+"""
+Input recording and replay for reproducing game sessions.
+
+A replay log holds a game's random seed and the input it read on every
+frame, which together with the fixed simulation timestep determine
+everything the game does. The log is binary:
+
+    header   MAGIC, then a varint length and JSON (game, seed, fps, step_rate)
+    blocks   up to BLOCK_FRAMES frames each, as a varint frame count, a varint
+             byte length and the frames, with runs of identical frames
+             stored once
+    index    varint block count, then (first frame, offset) varint pairs
+    footer   varint length and JSON (frames, score)
+    trailer  offset of the index as an unsigned 64-bit integer, then MAGIC
+
+Each frame holds the number of simulation steps run, the events the game
+handled and the results of the key and mouse button states it polled. The
+index lets a reader jump to any frame without decoding the frames before it.
+"""
+import os
+import json
+import random
+import struct
+import pygame
+
+MAGIC = b"ARCRPLY1"
+TRAILER = struct.Struct("<Q8s")
+
+# Frames per block; the index has one entry per block
+BLOCK_FRAMES = 256
+
+# Recorded event types; games do not handle any others
+EVENT_TYPES = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP]
+EVENT_CODES = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+
+
+def write_varint(buffer, value):
+    """
+    Append an unsigned integer using 7 bits per byte.
+    
+    Args:
+        buffer (bytearray): Buffer to append to
+        value (int): Non-negative integer
+    """
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data, offset):
+    """
+    Read an unsigned integer written by write_varint.
+    
+    Args:
+        data (bytes): Buffer to read from
+        offset (int): Position of the first byte
+        
+    Returns:
+        tuple: (value, offset after it)
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def encode_frame(steps, events, polls):
+    """
+    Encode one frame of input.
+    
+    Args:
+        steps (int): Simulation steps run in the frame
+        events (list): Pygame events of the recorded types
+        polls (list): Results of the key and mouse button polls, in order
+        
+    Returns:
+        bytes: The encoded frame
+    """
+    buffer = bytearray()
+    write_varint(buffer, steps)
+    write_varint(buffer, len(events))
+    for event in events:
+        buffer.append(EVENT_CODES[event.type])
+        if event.type == pygame.KEYDOWN:
+            write_varint(buffer, event.key)
+            write_varint(buffer, getattr(event, "mod", 0))
+            text = getattr(event, "unicode", "")
+            write_varint(buffer, ord(text) + 1 if len(text) == 1 else 0)
+        elif event.type == pygame.KEYUP:
+            write_varint(buffer, event.key)
+            write_varint(buffer, getattr(event, "mod", 0))
+        elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            write_varint(buffer, event.button)
+            write_varint(buffer, max(0, event.pos[0]))
+            write_varint(buffer, max(0, event.pos[1]))
+            
+    write_varint(buffer, len(polls))
+    bits = 0
+    for i, held in enumerate(polls):
+        if held:
+            bits |= 1 << i
+    buffer.extend(bits.to_bytes((len(polls) + 7) // 8, "little"))
+    return bytes(buffer)
+
+
+def decode_frame(data, offset):
+    """
+    Decode one frame of input written by encode_frame.
+    
+    Args:
+        data (bytes): Buffer to read from
+        offset (int): Position of the frame
+        
+    Returns:
+        tuple: ((steps, events, polls), offset after the frame)
+    """
+    steps, offset = read_varint(data, offset)
+    count, offset = read_varint(data, offset)
+    events = []
+    for _ in range(count):
+        event_type = EVENT_TYPES[data[offset]]
+        offset += 1
+        if event_type == pygame.KEYDOWN:
+            key, offset = read_varint(data, offset)
+            mod, offset = read_varint(data, offset)
+            char, offset = read_varint(data, offset)
+            events.append(pygame.event.Event(event_type, key=key, mod=mod, unicode=chr(char - 1) if char else ""))
+        elif event_type == pygame.KEYUP:
+            key, offset = read_varint(data, offset)
+            mod, offset = read_varint(data, offset)
+            events.append(pygame.event.Event(event_type, key=key, mod=mod, unicode=""))
+        elif event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            button, offset = read_varint(data, offset)
+            x, offset = read_varint(data, offset)
+            y, offset = read_varint(data, offset)
+            events.append(pygame.event.Event(event_type, button=button, pos=(x, y)))
+        else:
+            events.append(pygame.event.Event(event_type))
+            
+    count, offset = read_varint(data, offset)
+    size = (count + 7) // 8
+    bits = int.from_bytes(data[offset:offset + size], "little")
+    polls = [bool(bits >> i & 1) for i in range(count)]
+    return (steps, events, polls), offset + size
+
+
+class LiveInput:
+    """Input read straight from Pygame, the default for every FrameDriver."""
+    
+    finished = False
+    
+    def start(self, game_name, seed, fps, step_rate):
+        """
+        Start a game session.
+        
+        Args:
+            game_name (str): Game directory name
+            seed (int or None): Seed the game was asked to use
+            fps (int): Frame rate of the driver
+            step_rate (int or None): Fixed simulation steps per second
+            
+        Returns:
+            int or None: Seed the game should use
+        """
+        return seed
+        
+    def get_events(self):
+        """
+        Get the events since the last call.
+        
+        Returns:
+            list: Pygame events
+        """
+        return pygame.event.get()
+        
+    def key_held(self, key):
+        """
+        Check whether a key is held down.
+        
+        Args:
+            key (int): Pygame key code
+            
+        Returns:
+            bool: True if the key is down
+        """
+        return bool(pygame.key.get_pressed()[key])
+        
+    def mouse_held(self, button=0):
+        """
+        Check whether a mouse button is held down.
+        
+        Args:
+            button (int): 0 for the left button, 1 middle, 2 right
+            
+        Returns:
+            bool: True if the button is down
+        """
+        return bool(pygame.mouse.get_pressed()[button])
+        
+    def steps(self, steps):
+        """
+        Settle the number of simulation steps to run this frame.
+        
+        Args:
+            steps (int): Steps due by the clock
+            
+        Returns:
+            int: Steps to run
+        """
+        return steps
+        
+    def end_frame(self):
+        """Finish the current frame."""
+        
+    def close(self, game=None):
+        """
+        End the session.
+        
+        Args:
+            game: Game that was run, to record or check its outcome
+        """
+
+
+class InputRecorder(LiveInput):
+    def __init__(self, path):
+        """
+        Initialize a recorder that logs live input to a replay file.
+        
+        Args:
+            path (str): Replay file to write
+        """
+        self.path = path
+        self.file = None
+        self.frames = 0
+        self.events = []
+        self.polls = []
+        self.frame_steps = 0
+        
+        # The current block, and the run of identical frames at its end
+        self.block = bytearray()
+        self.block_frames = 0
+        self.run_frame = None
+        self.run_length = 0
+        self.index = []
+        
+    def start(self, game_name, seed, fps, step_rate):
+        """
+        Open the replay file and write the header.
+        
+        A seed is drawn when the game was not given one, so the session can
+        be reproduced.
+        
+        Args:
+            game_name (str): Game directory name
+            seed (int or None): Seed the game was asked to use
+            fps (int): Frame rate of the driver
+            step_rate (int or None): Fixed simulation steps per second
+            
+        Returns:
+            int: Seed the game should use
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(self.path, "wb")
+        header = bytearray(MAGIC)
+        data = json.dumps({"game": game_name, "seed": seed, "fps": fps, "step_rate": step_rate}).encode()
+        write_varint(header, len(data))
+        header.extend(data)
+        self.file.write(header)
+        return seed
+        
+    def get_events(self):
+        """
+        Get the events since the last call, recording those games handle.
+        
+        Returns:
+            list: Pygame events of the recorded types
+        """
+        events = [event for event in pygame.event.get() if event.type in EVENT_CODES]
+        self.events.extend(events)
+        return events
+        
+    def key_held(self, key):
+        """
+        Check whether a key is held down, recording the result.
+        
+        Args:
+            key (int): Pygame key code
+            
+        Returns:
+            bool: True if the key is down
+        """
+        held = super().key_held(key)
+        self.polls.append(held)
+        return held
+        
+    def mouse_held(self, button=0):
+        """
+        Check whether a mouse button is held down, recording the result.
+        
+        Args:
+            button (int): 0 for the left button, 1 middle, 2 right
+            
+        Returns:
+            bool: True if the button is down
+        """
+        held = super().mouse_held(button)
+        self.polls.append(held)
+        return held
+        
+    def steps(self, steps):
+        """
+        Record the number of simulation steps run this frame.
+        
+        Args:
+            steps (int): Steps due by the clock
+            
+        Returns:
+            int: Steps to run, unchanged
+        """
+        self.frame_steps = steps
+        return steps
+        
+    def end_frame(self):
+        """Add the frame's input to the log."""
+        frame = encode_frame(self.frame_steps, self.events, self.polls)
+        self.events = []
+        self.polls = []
+        self.frame_steps = 0
+        
+        if frame == self.run_frame:
+            self.run_length += 1
+        else:
+            self.flush_run()
+            self.run_frame = frame
+            self.run_length = 1
+        self.frames += 1
+        self.block_frames += 1
+        if self.block_frames == BLOCK_FRAMES:
+            self.flush_block()
+            
+    def flush_run(self):
+        """Add the run of identical frames to the current block."""
+        if self.run_length:
+            write_varint(self.block, self.run_length)
+            self.block.extend(self.run_frame)
+        self.run_frame = None
+        self.run_length = 0
+        
+    def flush_block(self):
+        """Write the current block to the file and index it."""
+        self.flush_run()
+        if not self.block_frames:
+            return
+        self.index.append((self.frames - self.block_frames, self.file.tell()))
+        header = bytearray()
+        write_varint(header, self.block_frames)
+        write_varint(header, len(self.block))
+        self.file.write(header)
+        self.file.write(self.block)
+        self.block = bytearray()
+        self.block_frames = 0
+        
+    def close(self, game=None):
+        """
+        Write the last block, the index and the outcome of the game.
+        
+        Args:
+            game: Game that was run; its score is stored to check replays against
+        """
+        if self.file is None:
+            return
+        self.flush_block()
+        index_offset = self.file.tell()
+        data = bytearray()
+        write_varint(data, len(self.index))
+        for first_frame, offset in self.index:
+            write_varint(data, first_frame)
+            write_varint(data, offset)
+        footer = json.dumps({"frames": self.frames, "score": getattr(game, "score", None)}).encode()
+        write_varint(data, len(footer))
+        data.extend(footer)
+        self.file.write(data)
+        self.file.write(TRAILER.pack(index_offset, MAGIC))
+        self.file.close()
+        self.file = None
+
+
+class ReplayLog:
+    def __init__(self, path):
+        """
+        Open a replay file for reading.
+        
+        The index and footer are read from the end of the file. A recording
+        that was cut short has neither, and its blocks are indexed by
+        skipping from one block header to the next.
+        
+        Args:
+            path (str): Replay file to read
+            
+        Raises:
+            ValueError: If the file is not a replay log
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self.data = f.read()
+        if not self.data.startswith(MAGIC):
+            raise ValueError(f"{path} is not a replay log")
+        length, offset = read_varint(self.data, len(MAGIC))
+        self.header = json.loads(self.data[offset:offset + length])
+        self.blocks_start = offset + length
+        self.footer = {}
+        
+        magic = None
+        if len(self.data) >= self.blocks_start + TRAILER.size:
+            index_offset, magic = TRAILER.unpack_from(self.data, len(self.data) - TRAILER.size)
+        if magic == MAGIC:
+            self.index, self.footer = self.read_index(index_offset)
+        else:
+            self.index = self.scan_blocks()
+        self.frames = self.footer.get("frames", sum(self.block_sizes()))
+        
+    def read_index(self, offset):
+        """
+        Read the block index and footer.
+        
+        Args:
+            offset (int): Position of the index
+            
+        Returns:
+            tuple: (list of (first frame, offset) pairs, footer dict)
+        """
+        count, offset = read_varint(self.data, offset)
+        index = []
+        for _ in range(count):
+            first_frame, offset = read_varint(self.data, offset)
+            block_offset, offset = read_varint(self.data, offset)
+            index.append((first_frame, block_offset))
+        length, offset = read_varint(self.data, offset)
+        return index, json.loads(self.data[offset:offset + length])
+        
+    def scan_blocks(self):
+        """
+        Index the blocks of a recording that has no index.
+        
+        Returns:
+            list: (first frame, offset) pairs
+        """
+        index = []
+        frame = 0
+        offset = self.blocks_start
+        while offset < len(self.data):
+            try:
+                frames, data_offset = read_varint(self.data, offset)
+                length, data_offset = read_varint(self.data, data_offset)
+            except IndexError:
+                break
+            if data_offset + length > len(self.data):
+                break
+            index.append((frame, offset))
+            frame += frames
+            offset = data_offset + length
+        return index
+        
+    def block_sizes(self):
+        """
+        Get the number of frames in each block.
+        
+        Returns:
+            list: Frames per block
+        """
+        return [read_varint(self.data, offset)[0] for _, offset in self.index]
+        
+    def iter_frames(self, start=0):
+        """
+        Decode frames in order, starting at any frame.
+        
+        The index finds the block holding the start frame, so only that
+        block's earlier frames are decoded to get there.
+        
+        Args:
+            start (int): First frame to yield
+            
+        Yields:
+            tuple: (frame number, steps, events, polls)
+        """
+        block = 0
+        for i, (first_frame, _) in enumerate(self.index):
+            if first_frame <= start:
+                block = i
+                
+        for first_frame, offset in self.index[block:]:
+            frames, offset = read_varint(self.data, offset)
+            length, offset = read_varint(self.data, offset)
+            end = offset + length
+            frame = first_frame
+            while offset < end:
+                run, offset = read_varint(self.data, offset)
+                (steps, events, polls), offset = decode_frame(self.data, offset)
+                for _ in range(run):
+                    if frame >= start:
+                        yield frame, steps, events, polls
+                    frame += 1
+
+
+class InputReplay(LiveInput):
+    def __init__(self, path):
+        """
+        Initialize an input source that plays a replay file back.
+        
+        Args:
+            path (str): Replay file to play
+        """
+        self.log = ReplayLog(path)
+        self.frames = self.log.iter_frames()
+        self.frame = 0
+        self.current = None
+        self.poll = 0
+        self.diverged = False
+        
+    @property
+    def finished(self):
+        """bool: True once every recorded frame has been played."""
+        return self.frame >= self.log.frames
+        
+    def start(self, game_name, seed, fps, step_rate):
+        """
+        Start playing the log back, warning when it was made differently.
+        
+        Args:
+            game_name (str): Game directory name
+            seed (int or None): Ignored, the recorded seed is used
+            fps (int): Frame rate of the driver
+            step_rate (int or None): Fixed simulation steps per second
+            
+        Returns:
+            int: The recorded seed
+        """
+        header = self.log.header
+        if (header["game"], header["fps"], header["step_rate"]) != (game_name, fps, step_rate):
+            print(f"Replay of {header['game']} at {header['fps']} fps and {header['step_rate']} steps/s "
+                  f"is played by {game_name} at {fps} fps and {step_rate} steps/s")
+        return header["seed"]
+        
+    def current_frame(self):
+        """
+        Get the recorded input of the frame being played.
+        
+        Returns:
+            tuple: (frame number, steps, events, polls)
+        """
+        if self.current is None:
+            self.current = next(self.frames, (self.frame, 0, [], []))
+            self.poll = 0
+        return self.current
+        
+    def get_events(self):
+        """
+        Get the events recorded for this frame.
+        
+        Returns:
+            list: Pygame events
+        """
+        # Drain real events so the queue does not fill up
+        pygame.event.pump()
+        pygame.event.clear()
+        return self.current_frame()[2]
+        
+    def next_poll(self):
+        """
+        Get the next recorded poll result of this frame.
+        
+        Returns:
+            bool: The recorded result
+        """
+        polls = self.current_frame()[3]
+        if self.poll >= len(polls):
+            self.diverged = True
+            return False
+        self.poll += 1
+        return polls[self.poll - 1]
+        
+    def key_held(self, key):
+        """
+        Get the recorded state of a key.
+        
+        Args:
+            key (int): Pygame key code
+            
+        Returns:
+            bool: True if the key was down
+        """
+        return self.next_poll()
+        
+    def mouse_held(self, button=0):
+        """
+        Get the recorded state of a mouse button.
+        
+        Args:
+            button (int): 0 for the left button, 1 middle, 2 right
+            
+        Returns:
+            bool: True if the button was down
+        """
+        return self.next_poll()
+        
+    def steps(self, steps):
+        """
+        Get the number of simulation steps recorded for this frame.
+        
+        Args:
+            steps (int): Steps due by the clock, ignored
+            
+        Returns:
+            int: Steps to run
+        """
+        return self.current_frame()[1]
+        
+    def end_frame(self):
+        """Move on to the next recorded frame."""
+        if self.poll != len(self.current_frame()[3]):
+            self.diverged = True
+        self.current = None
+        self.frame += 1
+        
+    def close(self, game=None):
+        """
+        Check that the game ended the way it did when it was recorded.
+        
+        Args:
+            game: Game that was played back
+        """
+        expected = self.log.footer.get("score")
+        score = getattr(game, "score", None)
+        if self.finished and expected is not None and score != expected:
+            self.diverged = True
+        if self.diverged:
+            print(f"Replay diverged from the recording: score {score}, recorded {expected}")
@@ -1,25 +1,421 @@
 """
 Screen manager for handling different screens and states in the game launcher.
 """
+import os
+import time
 import pygame
-from arcade_game_launcher.config import BLACK
+from arcade_game_launcher.config import BLACK, FPS, HEADLESS_ENV_VAR, MAX_FRAME_TIME
+from arcade_game_launcher.utils.replay import LiveInput
+
+
+def is_headless(headless=None):
+    """
+    Resolve whether headless mode is active.
+    
+    Args:
+        headless (bool or None): Explicit flag, or None to read the environment
+        
+    Returns:
+        bool: True if running headless, False otherwise
+    """
+    if headless is not None:
+        return bool(headless)
+    return os.environ.get(HEADLESS_ENV_VAR, "").lower() not in ("", "0", "false", "no")
+
+
+def init_headless_video():
+    """Select SDL's dummy drivers so Pygame can run without a window."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def init_display(headless=None):
+    """
+    Initialize only Pygame's display subsystem.
+    
+    pygame.init() also starts audio, joysticks and other subsystems no game
+    uses. Fonts are initialized by FontRegistry on first use.
+    
+    Args:
+        headless (bool or None): Use the dummy video driver, or None to read
+            the environment
+    """
+    if is_headless(headless):
+        init_headless_video()
+    pygame.display.init()
+
+
+def interpolate_rect(previous, current, alpha):
+    """
+    Blend a rectangle's position between the last two simulation steps.
+    
+    Args:
+        previous (pygame.Rect): Rectangle after the step before last
+        current (pygame.Rect): Rectangle after the last step
+        alpha (float): Fraction of a step elapsed since the last step
+        
+    Returns:
+        pygame.Rect: The rectangle to draw this frame
+    """
+    rect = current.copy()
+    rect.x = round(previous.x + (current.x - previous.x) * alpha)
+    rect.y = round(previous.y + (current.y - previous.y) * alpha)
+    return rect
+
+
+class FrameDriver:
+    # Launch timing shared by every driver, see mark_launch
+    launch_started = None
+    first_frame_ms = None
+    
+    def __init__(self, fps=FPS, headless=None, max_frames=None, render=True, profiler=None,
+                 input_script=None, step_rate=None, input_source=None):
+        """
+        Initialize the frame driver that presents and paces frames.
+        
+        In headless mode frames are never flipped to a window and the frame
+        cap is dropped, so loops run as fast as the CPU allows.
+        
+        With a step rate the simulation runs on a fixed timestep: elapsed
+        time is accumulated and update() is called once per whole step,
+        independently of the render rate, and draw() can interpolate
+        between the last two steps using alpha.
+        
+        Games read input through the driver's input source rather than from
+        Pygame directly, so a session can be recorded and played back. Events
+        are stamped with the time they were read, and intents built from
+        them (see InputQueue) report when they were applied, so a profiler
+        gets the input-to-display latency of every applied intent.
+        
+        Args:
+            fps (int): Frame cap (render rate) when running with a display
+            headless (bool or None): Headless flag, or None to read the environment
+            max_frames (int or None): Stop after this many frames, or None to run forever
+            render (bool): Whether to draw at all when headless
+            profiler (FrameProfiler): Records per-phase timings when set
+            input_script (callable): Called with the frame number before each
+                frame's events are handled, e.g. to post scripted input
+            step_rate (int or None): Fixed simulation steps per second, or None
+                to update once per rendered frame
+            input_source (LiveInput): Where input comes from, e.g. an
+                InputRecorder or InputReplay; live Pygame input by default
+        """
+        self.fps = fps
+        self.headless = is_headless(headless)
+        self.max_frames = max_frames
+        self.render = render or not self.headless
+        self.profiler = profiler
+        self.input_script = input_script
+        self.step_rate = step_rate
+        self.input = input_source or LiveInput()
+        self.clock = pygame.time.Clock()
+        self.frame = 0
+        self.steps = 0
+        
+        # Fixed timestep state. Time is counted in units of
+        # 1 / (fps * step_rate) seconds so a frame and a step are both whole
+        # numbers of units and headless runs step at exact ratios.
+        self.accumulator = 0
+        self.alpha = 1.0
+        
+        # Input latency state, see input_time
+        self.event_time = 0.0
+        self.applied = []
+        
+    @property
+    def finished(self):
+        """bool: True once the frame budget or the replayed input has been used up."""
+        return (self.max_frames is not None and self.frame >= self.max_frames) or self.input.finished
+        
+    def start_input(self, game_name, seed=None):
+        """
+        Start a game session on the input source.
+        
+        Args:
+            game_name (str): Game directory name
+            seed (int or None): Seed the game was asked to use
+            
+        Returns:
+            int or None: Seed the game should use, drawn by a recorder or
+                taken from a replay
+        """
+        return self.input.start(game_name, seed, self.fps, self.step_rate)
+        
+    def input_time(self):
+        """
+        Get the clock input latency is measured with, in milliseconds.
+        
+        Headless runs use the simulated frame time, so their latencies show
+        how many frames input waits to be applied rather than CPU speed.
+        
+        Returns:
+            float: Milliseconds on the latency clock
+        """
+        if self.headless:
+            return self.frame * 1000 / self.fps
+        return time.perf_counter() * 1000
+        
+    def get_events(self):
+        """
+        Get the input events since the last call.
+        
+        The events share one timestamp, event_time, taken as they are read.
+        
+        Returns:
+            list: Pygame events
+        """
+        self.event_time = self.input_time()
+        return self.input.get_events()
+        
+    def input_applied(self, stamp):
+        """
+        Note that an intent was applied, to measure its latency at the next present.
+        
+        Args:
+            stamp (float): event_time of the event the intent came from
+        """
+        if self.profiler:
+            self.applied.append(stamp)
+        
+    def key_held(self, key):
+        """
+        Check whether a key is held down.
+        
+        Args:
+            key (int): Pygame key code
+            
+        Returns:
+            bool: True if the key is down
+        """
+        return self.input.key_held(key)
+        
+    def mouse_held(self, button=0):
+        """
+        Check whether a mouse button is held down.
+        
+        Args:
+            button (int): 0 for the left button, 1 middle, 2 right
+            
+        Returns:
+            bool: True if the button is down
+        """
+        return self.input.mouse_held(button)
+        
+    def get_ticks(self):
+        """
+        Get the elapsed game time in milliseconds.
+        
+        Fixed timestep runs derive time from the simulation step count, and
+        headless runs from the frame count, so timers behave the same no
+        matter how fast frames are stepped.
+        
+        Returns:
+            int: Milliseconds since the driver started
+        """
+        if self.step_rate:
+            return self.steps * 1000 // self.step_rate
+        if self.headless:
+            return self.frame * 1000 // self.fps
+        return pygame.time.get_ticks()
+        
+    def wait(self, milliseconds):
+        """
+        Pause for a number of milliseconds, skipped when headless.
+        
+        Args:
+            milliseconds (int): Time to wait
+        """
+        if not self.headless:
+            pygame.time.wait(milliseconds)
+            
+    @classmethod
+    def mark_launch(cls):
+        """Start timing a launch; the next presented frame reports time-to-first-frame."""
+        cls.launch_started = time.perf_counter()
+        cls.first_frame_ms = None
+        
+    def present(self, rects=None):
+        """
+        Push the finished frame to the display.
+        
+        Args:
+            rects (list or None): Changed regions to push, or None to flip
+                the whole display
+        """
+        if not self.headless:
+            if rects is None:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+                
+        # Intents applied this frame are on screen now
+        if self.applied:
+            now = self.input_time()
+            for stamp in self.applied:
+                self.profiler.record("input", now - stamp)
+            self.applied.clear()
+            
+        # Report time-to-first-frame for a pending launch
+        if FrameDriver.launch_started is not None:
+            FrameDriver.first_frame_ms = (time.perf_counter() - FrameDriver.launch_started) * 1000
+            FrameDriver.launch_started = None
+            print(f"Time to first frame: {FrameDriver.first_frame_ms:.2f} ms")
+            
+    def tick(self):
+        """
+        Advance the frame counter and wait for the frame cap.
+        
+        Returns:
+            int: Milliseconds since the previous tick
+        """
+        self.input.end_frame()
+        self.frame += 1
+        if self.headless:
+            return 0
+        return self.clock.tick(self.fps)
+        
+    def advance(self, game):
+        """
+        Advance the simulation for one rendered frame.
+        
+        Args:
+            game: Object with running and update members
+        """
+        if not self.step_rate:
+            due = 1
+        else:
+            # Feed the time of the previous frame into the accumulator, clamped
+            # so a long stall does not trigger a burst of catch-up steps
+            if self.headless:
+                self.accumulator += self.step_rate
+            else:
+                elapsed = min(self.clock.get_time() / 1000, MAX_FRAME_TIME)
+                self.accumulator += round(elapsed * self.fps * self.step_rate)
+            due = self.accumulator // self.fps
+            self.accumulator -= due * self.fps
+            self.alpha = self.accumulator / self.fps
+            
+        # Run every whole step that has accumulated. A recording stores the
+        # count, and a replay runs the recorded count instead.
+        for _ in range(self.input.steps(due)):
+            if not game.running:
+                break
+            game.update()
+            self.steps += 1
+        
+    def run(self, game):
+        """
+        Run a game's event/update/draw loop until it stops.
+        
+        Args:
+            game: Object with running, handle_events, update and draw members
+        """
+        try:
+            if self.profiler:
+                self.run_profiled(game)
+                return
+                
+            while game.running and not self.finished:
+                if self.input_script:
+                    self.input_script(self.frame)
+                game.handle_events()
+                self.advance(game)
+                # Games that draw incrementally return the rectangles they changed
+                rects = None
+                if self.render:
+                    rects = game.draw()
+                self.present(rects)
+                self.tick()
+        finally:
+            self.input.close(game)
+            
+    def poll_overlay_key(self, screen):
+        """
+        Toggle the profiler overlay, redrawing a retained screen fully when it
+        is toggled so the overlay does not linger on it.
+        
+        Args:
+            screen: Game or screen being run
+        """
+        visible = self.profiler.overlay_visible
+        self.profiler.poll_overlay_key()
+        if self.profiler.overlay_visible != visible and hasattr(screen, "invalidate"):
+            screen.invalidate()
+            
+    def draw_overlay(self, screen, surface, rects):
+        """
+        Draw the profiler overlay over a finished frame.
+        
+        When the overlay shrinks, a retained screen repaints what it
+        uncovered with its repaint(area) method, or, without one, is
+        redrawn in full on the next frame.
+        
+        Args:
+            screen: Game or screen being run
+            surface: Pygame surface the frame was drawn on
+            rects (list or None): Changed regions of the frame, extended
+                with the overlay's
+        """
+        repaint = getattr(screen, "repaint", None)
+        if repaint is None and hasattr(screen, "invalidate"):
+            repaint = lambda area: screen.invalidate()
+        overlay_rect = self.profiler.draw_overlay(surface, repaint)
+        if overlay_rect and rects is not None:
+            rects.append(overlay_rect)
+            
+    def run_profiled(self, game):
+        """
+        Run a game's loop while recording the cost of each phase.
+        
+        Args:
+            game: Object with running, screen, handle_events, update and draw members
+        """
+        profiler = self.profiler
+        while game.running and not self.finished:
+            if self.input_script:
+                self.input_script(self.frame)
+            profiler.begin_frame()
+            self.poll_overlay_key(game)
+            game.handle_events()
+            profiler.lap("events")
+            self.advance(game)
+            profiler.lap("update")
+            rects = None
+            if self.render:
+                rects = game.draw()
+                self.draw_overlay(game, game.screen, rects)
+            profiler.lap("draw")
+            self.present(rects)
+            profiler.lap("flip")
+            self.tick()
+            profiler.lap("tick")
+            profiler.end_frame()
+
 
 class ScreenManager:
-    def __init__(self, width, height):
+    def __init__(self, width, height, headless=None, max_frames=None, profiler=None):
         """
         Initialize the screen manager.
         
         Args:
             width (int): Screen width
             height (int): Screen height
+            headless (bool or None): Render off-screen without a frame cap
+            max_frames (int or None): Frames to run each screen for when headless
+            profiler (FrameProfiler): Records per-phase timings when set
         """
         self.width = width
         self.height = height
-        self.screen = pygame.display.set_mode((width, height))
-        self.clock = pygame.time.Clock()
+        self.headless = is_headless(headless)
+        if self.headless:
+            self.screen = pygame.Surface((width, height))
+        else:
+            self.screen = pygame.display.set_mode((width, height))
+        self.driver = FrameDriver(FPS, self.headless, max_frames, profiler=profiler)
+        self.clock = self.driver.clock
         self.current_screen = None
         self.running = True
-        self.fps = 60
+        self.fps = FPS
         
     def set_caption(self, caption):
         """Set the window caption."""
@@ -28,6 +424,7 @@ class ScreenManager:
     def set_fps(self, fps):
         """Set the frames per second."""
         self.fps = fps
+        self.driver.fps = fps
         
     def set_screen(self, screen):
         """
@@ -38,6 +435,10 @@ class ScreenManager:
         """
         self.current_screen = screen
         
+        # Whatever was on the display before is stale for a retained screen
+        if hasattr(screen, "invalidate"):
+            screen.invalidate()
+        
     def clear_screen(self, color=BLACK):
         """
         Clear the screen with the specified color.
@@ -47,10 +448,16 @@ class ScreenManager:
         """
         self.screen.fill(color)
         
-    def update(self):
-        """Update the display."""
-        pygame.display.flip()
-        self.clock.tick(self.fps)
+    def update(self, rects=None):
+        """
+        Update the display.
+        
+        Args:
+            rects (list or None): Changed regions to push, or None to flip
+                the whole display
+        """
+        self.driver.present(rects)
+        self.driver.tick()
         
     def quit(self):
         """Quit the screen manager."""
@@ -66,7 +473,19 @@ class ScreenManager:
         if not self.current_screen:
             return None
             
+        profiler = self.driver.profiler
         while self.running:
+            # Stop once a headless run has used its frame budget
+            if self.driver.finished:
+                return None
+                
+            if profiler:
+                profiler.begin_frame()
+                self.driver.poll_overlay_key(self.current_screen)
+                
+            if self.driver.input_script:
+                self.driver.input_script(self.driver.frame)
+                
             # Handle events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -77,11 +496,35 @@ class ScreenManager:
                 result = self.current_screen.handle_event(event)
                 if result:
                     return result
-            
-            # Update and draw the current screen
+                    
+            if profiler:
+                profiler.lap("events")
+                
+            # Update and draw the current screen. Retained screens draw only
+            # what changed and hand back the dirty rectangles.
             self.current_screen.update()
-            self.clear_screen()
-            self.current_screen.draw(self.screen)
-            self.update()
+            if profiler:
+                profiler.lap("update")
+                
+            rects = None
+            if self.driver.render:
+                if hasattr(self.current_screen, "draw_dirty"):
+                    rects = self.current_screen.draw_dirty(self.screen)
+                else:
+                    self.clear_screen()
+                    self.current_screen.draw(self.screen)
+                    
+                if profiler:
+                    self.driver.draw_overlay(self.current_screen, self.screen, rects)
+                        
+            if profiler:
+                profiler.lap("draw")
+                self.driver.present(rects)
+                profiler.lap("flip")
+                self.driver.tick()
+                profiler.lap("tick")
+                profiler.end_frame()
+            else:
+                self.update(rects)
             
         return None
@@ -0,0 +1,34 @@
+"""
+Scripted input for running games unattended, e.g. in benchmarks and thumbnails.
+"""
+import pygame
+
+SCRIPT_KEYS = [pygame.K_SPACE, pygame.K_UP, pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT]
+SCRIPT_INTERVAL = 15  # frames between scripted key presses
+
+
+class ScriptedInput:
+    def __init__(self, keys=SCRIPT_KEYS, interval=SCRIPT_INTERVAL):
+        """
+        Initialize a scripted input source that presses keys in turn.
+        
+        Args:
+            keys (list): Pygame key codes to cycle through
+            interval (int): Frames between key presses
+        """
+        self.keys = keys
+        self.interval = interval
+        self.presses = 0
+        
+    def __call__(self, frame):
+        """
+        Post the scripted key press for a frame, if any.
+        
+        Args:
+            frame (int): Frame number about to run
+        """
+        if frame % self.interval == 0:
+            key = self.keys[self.presses % len(self.keys)]
+            self.presses += 1
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=""))
+            pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode=""))
@@ -0,0 +1,248 @@
+"""
+Incremental type-ahead search over the game catalog.
+"""
+import re
+from collections import defaultdict
+
+# Word prefixes up to this length are indexed directly; longer query words
+# are checked against the games found for their first MAX_PREFIX characters
+MAX_PREFIX = 8
+
+# Query words this long also match inside words, found through trigrams
+MIN_INFIX = 3
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """
+    Split text into lowercase words.
+    
+    Args:
+        text (str): Text to split
+        
+    Returns:
+        list: Words in the text
+    """
+    return WORD_PATTERN.findall(text.casefold())
+
+
+def searchable_text(entry):
+    """
+    Collect the text a game can be found by: its name and string metadata.
+    
+    Args:
+        entry (dict): Manifest entry of the game
+        
+    Returns:
+        str: Searchable text
+    """
+    parts = [entry["display_name"], entry["name"]]
+    for value in entry.get("metadata", {}).values():
+        if isinstance(value, str):
+            parts.append(value)
+        elif isinstance(value, (list, tuple)):
+            parts.extend(item for item in value if isinstance(item, str))
+    return " ".join(parts)
+
+
+class SearchIndex:
+    def __init__(self):
+        """
+        Initialize an empty search index.
+        
+        A game matches a query when every query word starts one of its
+        words or, from MIN_INFIX characters on, appears inside one. Word
+        starts are looked up in a prefix index and words inside others by
+        intersecting the games that contain each of the query word's
+        trigrams, so a query never scans the catalog.
+        """
+        self.documents = {}
+        self.prefixes = defaultdict(set)
+        self.trigrams = defaultdict(set)
+        self.order = []
+        self.rank = {}
+        self.found = {}
+        self.last_words = None
+        self.last_results = None
+        
+    def update(self, entries):
+        """
+        Bring the index in line with the catalog.
+        
+        Only games that were added, removed or changed are re-indexed.
+        
+        Args:
+            entries (list): Manifest entries of the games, in display order
+        """
+        seen = set()
+        for entry in entries:
+            name = entry["name"]
+            seen.add(name)
+            text = searchable_text(entry)
+            document = self.documents.get(name)
+            if document and document[0] == text:
+                continue
+            if document:
+                self.remove(name)
+            self.add(name, text)
+            
+        for name in [name for name in self.documents if name not in seen]:
+            self.remove(name)
+            
+        self.order = [entry["name"] for entry in entries]
+        self.rank = {name: i for i, name in enumerate(self.order)}
+        self.found.clear()
+        self.last_words = None
+        self.last_results = None
+        
+    def add(self, name, text):
+        """
+        Index one game.
+        
+        Args:
+            name (str): Game directory name
+            text (str): Searchable text of the game
+        """
+        words = set(tokenize(text))
+        self.documents[name] = (text, words)
+        for word in words:
+            for length in range(1, min(len(word), MAX_PREFIX) + 1):
+                self.prefixes[word[:length]].add(name)
+            for i in range(len(word) - 2):
+                self.trigrams[word[i:i + 3]].add(name)
+                
+    def remove(self, name):
+        """
+        Remove one game from the index.
+        
+        Args:
+            name (str): Game directory name
+        """
+        _, words = self.documents.pop(name)
+        for word in words:
+            for length in range(1, min(len(word), MAX_PREFIX) + 1):
+                self.discard(self.prefixes, word[:length], name)
+            for i in range(len(word) - 2):
+                self.discard(self.trigrams, word[i:i + 3], name)
+                
+    def discard(self, index, key, name):
+        """
+        Remove a game from one index bucket, dropping the bucket when empty.
+        
+        Args:
+            index (dict): Prefix or trigram index
+            key (str): Bucket key
+            name (str): Game directory name
+        """
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.discard(name)
+            if not bucket:
+                del index[key]
+                
+    def has_word(self, name, word, inside):
+        """
+        Check whether one of a game's words starts with or contains a word.
+        
+        Args:
+            name (str): Game directory name
+            word (str): Query word
+            inside (bool): Also accept the word inside a game word
+            
+        Returns:
+            bool: True if the game has a matching word
+        """
+        if inside:
+            return any(word in game_word for game_word in self.documents[name][1])
+        return any(game_word.startswith(word) for game_word in self.documents[name][1])
+        
+    def find(self, word):
+        """
+        Find the games matching one query word.
+        
+        Results are cached until the catalog changes, so words a query keeps
+        while the player types on are not looked up again.
+        
+        Args:
+            word (str): Query word
+            
+        Returns:
+            set: Names of the matching games
+        """
+        found = self.found.get(word)
+        if found is not None:
+            return found
+            
+        # Games with a word starting with the query word
+        found = self.prefixes.get(word[:MAX_PREFIX], set())
+        if len(word) > MAX_PREFIX:
+            found = {name for name in found if self.has_word(name, word, False)}
+            
+        # Games with the query word inside a word. Trigrams find every such
+        # game, plus some that only share the trigrams, which are checked.
+        if len(word) >= MIN_INFIX:
+            trigrams = sorted((self.trigrams.get(word[i:i + 3], set()) for i in range(len(word) - 2)), key=len)
+            inside = trigrams[0] - found
+            for games in trigrams[1:]:
+                if not inside:
+                    break
+                inside &= games
+            if inside and len(word) > MIN_INFIX:
+                inside = {name for name in inside if self.has_word(name, word, True)}
+            if inside:
+                found = found | inside
+                
+        self.found[word] = found
+        return found
+        
+    def narrows(self, words):
+        """
+        Check whether a query can only match a subset of the last results.
+        
+        That holds when the player typed on: the last query word grew or
+        new words were added. It does not when the grown word just became
+        long enough to match inside words.
+        
+        Args:
+            words (list): Query words
+            
+        Returns:
+            bool: True if the last results can be filtered
+        """
+        last = self.last_words
+        if not last or len(words) < len(last) or words[:len(last) - 1] != last[:-1]:
+            return False
+        previous, current = last[-1], words[len(last) - 1]
+        return current.startswith(previous) and (len(previous) >= MIN_INFIX or len(current) < MIN_INFIX)
+        
+    def search(self, query):
+        """
+        Find the games matching a query.
+        
+        When the query extends the previous one, as it does while typing,
+        the previous results are filtered instead of sorted again.
+        
+        Args:
+            query (str): Text typed by the player
+            
+        Returns:
+            list: Matching game names in catalog order
+        """
+        words = tokenize(query)
+        if not words:
+            results = list(self.order)
+        else:
+            found = None
+            for word in sorted(set(words), key=len, reverse=True):
+                found = self.find(word) if found is None else found & self.find(word)
+                if not found:
+                    break
+            if self.narrows(words):
+                results = [name for name in self.last_results if name in found]
+            else:
+                results = sorted(found, key=self.rank.__getitem__)
+                
+        self.last_words = words
+        self.last_results = results
+        return results
@@ -0,0 +1,118 @@
+"""
+Shared cache of rendered text surfaces for HUD, overlay and button text.
+"""
+import time
+from collections import OrderedDict
+from arcade_game_launcher.config import TEXT_CACHE_MAX_BYTES
+
+
+class TextCache:
+    def __init__(self, max_bytes=TEXT_CACHE_MAX_BYTES):
+        """
+        Initialize the text cache.
+        
+        Args:
+            max_bytes (int): Memory cap for cached surfaces, in bytes
+        """
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.render_ms = 0.0
+        
+    def render(self, font, text, color, antialias=True):
+        """
+        Render text, reusing a cached surface when one exists.
+        
+        Cached surfaces are shared, so callers must not draw onto them.
+        
+        Args:
+            font: Pygame font to render with
+            text (str): Text to render
+            color (tuple): RGB text color
+            antialias (bool): Whether to antialias the text
+            
+        Returns:
+            pygame.Surface: The rendered text
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+            
+        # Render and remember how long it took
+        self.misses += 1
+        start = time.perf_counter()
+        surface = font.render(text, antialias, color)
+        self.render_ms += (time.perf_counter() - start) * 1000
+        
+        self.surfaces[key] = surface
+        self.total_bytes += self.surface_bytes(surface)
+        
+        # Evict least recently used surfaces over the memory cap
+        while self.total_bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, evicted = self.surfaces.popitem(last=False)
+            self.total_bytes -= self.surface_bytes(evicted)
+            self.evictions += 1
+        return surface
+        
+    def surface_bytes(self, surface):
+        """
+        Estimate the memory used by a surface.
+        
+        Args:
+            surface: Pygame surface
+            
+        Returns:
+            int: Size of the pixel data in bytes
+        """
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+        
+    def clear(self):
+        """Drop every cached surface."""
+        self.surfaces.clear()
+        self.total_bytes = 0
+        
+    def stats(self):
+        """
+        Get cache statistics.
+        
+        The saved time is estimated from the average cost of a miss.
+        
+        Returns:
+            dict: Hits, misses, evictions, entries, bytes and saved milliseconds
+        """
+        average_ms = self.render_ms / self.misses if self.misses else 0.0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.surfaces),
+            "bytes": self.total_bytes,
+            "saved_ms": self.hits * average_ms
+        }
+
+
+# Project-wide cache shared by every game and the launcher
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    """
+    Render text through the shared cache.
+    
+    Args:
+        font: Pygame font to render with
+        text (str): Text to render
+        color (tuple): RGB text color
+        antialias (bool): Whether to antialias the text
+        
+    Returns:
+        pygame.Surface: The rendered text
+    """
+    return text_cache.render(font, text, color, antialias)
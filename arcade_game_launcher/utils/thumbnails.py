@@ -0,0 +1,183 @@
+"""
+Game preview thumbnails, rendered by running each game headless for a few
+seconds of scripted play and cached on disk by the game's content hash.
+"""
+import os
+import glob
+import random
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from arcade_game_launcher.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, THUMBNAIL_DIR, THUMBNAIL_SIZE, THUMBNAIL_SECONDS
+)
+
+
+def thumbnail_path(entry, cache_dir=THUMBNAIL_DIR):
+    """
+    Get where a game's thumbnail is cached.
+    
+    The file name includes the hash of the game's main file, so editing the
+    game points at a new file and the old one is regenerated.
+    
+    Args:
+        entry (dict): Manifest entry of the game
+        cache_dir (str): Thumbnail cache directory
+        
+    Returns:
+        str: Path of the PNG file
+    """
+    return os.path.join(cache_dir, f"{entry['name']}-{entry['hash'][:16]}.png")
+
+
+def render_thumbnail(game_name, path, frames):
+    """
+    Run a game headless and save its last frame as a PNG.
+    
+    Runs in a worker process, so it sets up its own pygame.
+    
+    Args:
+        game_name (str): Game directory name
+        path (str): Where to save the PNG
+        frames (int): Frames of scripted play before the capture
+        
+    Returns:
+        str: The saved path
+    """
+    from arcade_game_launcher.utils.scripted_input import ScriptedInput
+    from arcade_game_launcher.utils.game_loader import GameLoader
+    from arcade_game_launcher.utils.screen_manager import init_display
+    
+    init_display(True)
+    random.seed(0)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    loader = GameLoader()
+    loader.discover_games()
+    loader.run_game(game_name, screen, headless=True, max_frames=frames, input_script=ScriptedInput())
+    
+    # Write then rename, so readers never see a partial file. The temporary
+    # name does not end in .png, so stale thumbnail cleanup leaves it alone.
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        pygame.image.save(screen, f, "png")
+    os.replace(temp_path, path)
+    pygame.quit()
+    return path
+
+
+class ThumbnailCache:
+    def __init__(self, cache_dir=THUMBNAIL_DIR, size=THUMBNAIL_SIZE, seconds=THUMBNAIL_SECONDS):
+        """
+        Initialize the thumbnail cache.
+        
+        Args:
+            cache_dir (str): Directory holding the cached PNGs
+            size (tuple): Size thumbnails are shown at
+            seconds (float): Seconds of scripted play before the capture
+        """
+        self.cache_dir = cache_dir
+        self.size = size
+        self.frames = int(seconds * FPS)
+        self.renders = {}
+        self.loads = {}
+        self.surfaces = {}
+        self.render_pool = None
+        self.load_pool = ThreadPoolExecutor(max_workers=1)
+        
+    def generate(self, entries):
+        """
+        Render thumbnails that are missing or stale in a process pool.
+        
+        Returns at once; rendering happens in the background.
+        
+        Args:
+            entries (iterable): Manifest entries of the games
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        missing = []
+        for entry in entries:
+            path = thumbnail_path(entry, self.cache_dir)
+            # Drop thumbnails of older versions of the game
+            for old_path in glob.glob(os.path.join(self.cache_dir, f"{entry['name']}-*.png")):
+                if old_path != path:
+                    os.remove(old_path)
+            if not os.path.exists(path) and path not in self.renders:
+                missing.append((entry["name"], path))
+                self.surfaces.pop(path, None)
+                
+        if not missing:
+            return
+        if self.render_pool is None:
+            # Imported here so multiprocessing stays out of launcher startup
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            self.render_pool = ProcessPoolExecutor(
+                max_workers=min(len(missing), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        for name, path in missing:
+            self.renders[path] = self.render_pool.submit(render_thumbnail, name, path, self.frames)
+            
+    def load(self, path):
+        """
+        Load a cached PNG and scale it to thumbnail size.
+        
+        Runs on the loader thread.
+        
+        Args:
+            path (str): PNG path
+            
+        Returns:
+            pygame.Surface: The scaled thumbnail
+        """
+        return pygame.transform.smoothscale(pygame.image.load(path), self.size)
+        
+    def get(self, entry):
+        """
+        Get a game's thumbnail without blocking.
+        
+        The first calls start loading it in the background; None is returned
+        until it is ready, or while it is still being rendered.
+        
+        Args:
+            entry (dict): Manifest entry of the game
+            
+        Returns:
+            pygame.Surface or None: The thumbnail, or None if not ready yet
+        """
+        path = thumbnail_path(entry, self.cache_dir)
+        if path in self.surfaces:
+            return self.surfaces[path] or None
+            
+        render = self.renders.get(path)
+        if render is not None:
+            if not render.done():
+                return None
+            if render.exception():
+                print(f"Error rendering thumbnail for '{entry['name']}': {render.exception()}")
+                self.surfaces[path] = False
+                return None
+                
+        load = self.loads.get(path)
+        if load is None:
+            if os.path.exists(path):
+                self.loads[path] = self.load_pool.submit(self.load, path)
+            else:
+                # Never generated, so stop looking until generate() is called
+                self.surfaces[path] = False
+            return None
+        if not load.done():
+            return None
+            
+        try:
+            surface = load.result()
+        except (pygame.error, OSError) as e:
+            print(f"Error loading thumbnail '{path}': {e}")
+            surface = False
+        self.surfaces[path] = surface
+        return surface or None
+        
+    def shutdown(self):
+        """Stop background rendering and loading."""
+        if self.render_pool:
+            self.render_pool.shutdown(wait=False, cancel_futures=True)
+        self.load_pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,288 @@
+"""
+Fork-server warm pool for isolated game sessions. A zygote process imports
+pygame and every game module once, then forks workers that share those pages
+copy-on-write and keeps a few of them initialized and waiting for a launch.
+"""
+import os
+import gc
+import time
+import random
+import signal
+import traceback
+import multiprocessing
+from collections import deque
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import send_handle, recv_handle
+import pygame
+from arcade_game_launcher.config import WARM_POOL_SIZE, WARM_POOL_TIMEOUT
+from arcade_game_launcher.utils.screen_manager import init_display, init_headless_video
+from arcade_game_launcher.utils.isolation import run_session
+
+
+def fork_supported():
+    """
+    Check whether the platform can fork workers.
+    
+    Returns:
+        bool: True where os.fork is available
+    """
+    return hasattr(os, "fork")
+
+
+class ForkedProcess:
+    def __init__(self, pid):
+        """
+        Handle on a worker forked by the zygote.
+        
+        The worker is the zygote's child rather than ours, so it is watched
+        by pid; this mirrors the parts of multiprocessing.Process that
+        IsolatedSession uses. Exit codes are not available.
+        
+        Args:
+            pid (int): Process id of the worker
+        """
+        self.pid = pid
+        self.exitcode = None
+        
+    def is_alive(self):
+        """
+        Check whether the worker is still running.
+        
+        Returns:
+            bool: True while the process exists
+        """
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+        
+    def send_signal(self, signum):
+        """
+        Send a signal to the worker if it is still running.
+        
+        Args:
+            signum (int): Signal number
+        """
+        try:
+            os.kill(self.pid, signum)
+        except ProcessLookupError:
+            pass
+            
+    def terminate(self):
+        """Ask the worker to exit."""
+        self.send_signal(signal.SIGTERM)
+        
+    def kill(self):
+        """Kill the worker."""
+        self.send_signal(signal.SIGKILL)
+        
+    def join(self, timeout=None):
+        """
+        Wait for the worker to exit.
+        
+        Args:
+            timeout (float or None): Seconds to wait, or None to wait forever
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.is_alive():
+            if deadline is not None and time.monotonic() > deadline:
+                return
+            time.sleep(0.01)
+
+
+def worker_main(loader, conn):
+    """
+    Body of a warm worker: initialize the display, then wait for a launch.
+    
+    Args:
+        loader: Game loader inherited from the zygote with every game loaded
+        conn: Worker end of the zygote pipe
+    """
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    # Forked workers would otherwise all replay the zygote's random sequence
+    random.seed()
+    init_display(True)
+    
+    try:
+        message = conn.recv()
+    except EOFError:
+        return
+    _, game_name, shm_name, width, height, options = message
+    session_conn = Connection(recv_handle(conn))
+    conn.close()
+    
+    run_session(loader, game_name, shm_name, session_conn, width, height, options)
+    pygame.quit()
+
+
+def fork_worker(loader, inherited):
+    """
+    Fork a warm worker from the zygote.
+    
+    Args:
+        loader: Game loader to hand to the worker
+        inherited (list): Zygote connections the worker must close so that
+            their peers still see EOF when the zygote closes them
+            
+    Returns:
+        tuple: (pid, zygote end of the worker pipe)
+    """
+    zygote_conn, worker_conn = multiprocessing.Pipe()
+    pid = os.fork()
+    if pid == 0:
+        zygote_conn.close()
+        for conn in inherited:
+            conn.close()
+        code = 0
+        try:
+            worker_main(loader, worker_conn)
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        finally:
+            os._exit(code)
+            
+    worker_conn.close()
+    return pid, zygote_conn
+
+
+def zygote_main(conn, pool_size):
+    """
+    Entry point of the zygote process.
+    
+    Loads everything a session needs once, keeps pool_size workers forked
+    and waiting, and hands each launch request to one of them.
+    
+    Args:
+        conn: Zygote end of the launcher pipe
+        pool_size (int): Number of warm workers to keep ready
+    """
+    from arcade_game_launcher.utils.game_loader import GameLoader
+    
+    # Workers are our children; let the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    
+    init_headless_video()
+    pygame.font.init()
+    loader = GameLoader()
+    for info in loader.discover_games().values():
+        loader.load_game(info["name"])
+        
+    # Move everything loaded so far out of the collector's reach, so garbage
+    # collection in the workers does not write to (and so copy) shared pages
+    gc.freeze()
+    
+    workers = deque()
+    
+    def refill():
+        while len(workers) < max(pool_size, 1):
+            workers.append(fork_worker(loader, [conn] + [worker[1] for worker in workers]))
+            
+    refill()
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message[0] != "launch":
+            break
+            
+        fd = recv_handle(conn)
+        pid, worker_conn = workers.popleft()
+        try:
+            worker_conn.send(message)
+            send_handle(worker_conn, fd, pid)
+        except OSError:
+            pid = None
+        os.close(fd)
+        worker_conn.close()
+        conn.send(("launched", pid))
+        refill()
+        
+    # Warm workers exit when their pipe closes
+    for _, worker_conn in workers:
+        worker_conn.close()
+
+
+class WarmPool:
+    def __init__(self, size=WARM_POOL_SIZE, timeout=WARM_POOL_TIMEOUT):
+        """
+        Initialize a warm pool of forked session workers.
+        
+        Args:
+            size (int): Number of workers kept ready
+            timeout (float): Seconds to wait for the zygote to hand out a worker
+        """
+        self.size = size
+        self.timeout = timeout
+        self.process = None
+        self.conn = None
+        
+    def start(self):
+        """
+        Start the zygote process. It loads in the background, so this returns at once.
+        
+        Returns:
+            bool: True if the pool started, False where forking is unsupported
+        """
+        if not fork_supported():
+            print("Forking is not supported on this platform; sessions will be spawned.")
+            return False
+            
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=zygote_main, args=(child_conn, self.size),
+                                       name="zygote", daemon=True)
+        self.process.start()
+        child_conn.close()
+        return True
+        
+    def launch(self, game_name, shm_name, width, height, options):
+        """
+        Run a game session in a warm worker.
+        
+        Args:
+            game_name (str): Game to run
+            shm_name (str): Name of the session's shared framebuffer
+            width (int): Screen width
+            height (int): Screen height
+            options (dict): Session options, see IsolatedSession
+            
+        Returns:
+            tuple or None: (session connection, ForkedProcess), or None if the
+                pool could not provide a worker
+        """
+        if self.process is None or not self.process.is_alive():
+            return None
+            
+        session_conn, worker_end = multiprocessing.Pipe()
+        try:
+            self.conn.send(("launch", game_name, shm_name, width, height, options))
+            send_handle(self.conn, worker_end.fileno(), self.process.pid)
+            worker_end.close()
+            if not self.conn.poll(self.timeout):
+                # The zygote is out of step with us now, so retire it
+                print(f"Warm pool did not respond within {self.timeout:.1f} s, stopping it.")
+                self.stop()
+                return None
+            _, pid = self.conn.recv()
+        except (OSError, EOFError):
+            return None
+            
+        if pid is None:
+            return None
+        return session_conn, ForkedProcess(pid)
+        
+    def stop(self):
+        """Stop the zygote and its idle workers."""
+        if self.process is None:
+            return
+        self.conn.close()
+        self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.process = None